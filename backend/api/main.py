@@ -21,23 +21,30 @@ for local development.
 """
 
 import os
-import json
+import asyncio
+import time
+import hashlib
+import importlib.util
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import groupby
+from typing import Annotated, Callable, NoReturn, Optional, List, Dict, Any
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import cast
 from contextvars import ContextVar
-from urllib.request import Request as UrlRequest, urlopen
-from urllib.parse import urlencode
-
-import uuid
+from types import MappingProxyType
 
 from fastapi import FastAPI, HTTPException, Depends, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, ValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 import boto3
+from botocore.config import Config as BotoConfig
+import httpx
+import orjson
 from mangum import Mangum
 from dotenv import load_dotenv
 from fastapi_clerk_auth import ClerkConfig, ClerkHTTPBearer, HTTPAuthorizationCredentials
@@ -46,6 +53,7 @@ from src import Database
 from src.schemas import (
     UserCreate,
     AccountCreate,
+    InstrumentCreate,
     PositionCreate,
     JobCreate,
     JobUpdate,
@@ -53,8 +61,13 @@ from src.schemas import (
     JobStatus,
 )
 
-from rebalancer.rebalance import compute_rebalance_recommendation
+from rebalancer.rebalance import (
+    NormalizedTargets,
+    compute_rebalance_recommendation,
+    normalize_asset_class_targets,
+)
 from retirement.simulation import (
+    PortfolioArrays,
     calculate_portfolio_value,
     calculate_asset_allocation,
     generate_projections,
@@ -72,6 +85,8 @@ load_dotenv(override=True)
 logging.basicConfig(level=logging.INFO)
 # Create module-level logger for this file
 logger = logging.getLogger(__name__)
+# httpx logs full request URLs at INFO, which would leak the Polygon apiKey
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # =========================
 # Correlation Context
@@ -79,6 +94,13 @@ logger = logging.getLogger(__name__)
 
 request_id_ctx: ContextVar[str | None] = ContextVar("request_id", default=None)
 clerk_user_id_ctx: ContextVar[str | None] = ContextVar("clerk_user_id", default=None)
+# Per-request memo of (portfolio snapshot, data quality) keyed by Clerk user id
+# (see `_load_portfolio_snapshot_with_quality`)
+snapshot_cache_ctx: ContextVar[
+    Dict[str, tuple[List[Dict[str, Any]], Dict[str, Any]]] | None
+] = ContextVar(
+    "snapshot_cache", default=None
+)
 
 
 def _get_request_id(request: Request) -> str:
@@ -91,14 +113,57 @@ def _get_request_id(request: Request) -> str:
 
 
 def _log_event(event: str, *, request: Request | None = None, **fields: Any) -> None:
+    # Skip payload construction entirely when INFO logging is disabled
+    if not logger.isEnabledFor(logging.INFO):
+        return
     payload: Dict[str, Any] = {
         "event": event,
-        "timestamp": datetime.now().isoformat(),
+        # orjson serialises the datetime natively; no isoformat() string building
+        "timestamp": datetime.now(timezone.utc),
         "request_id": request_id_ctx.get() or (request and _get_request_id(request)),
         "clerk_user_id": clerk_user_id_ctx.get(),
         **fields,
     }
-    logger.info(json.dumps(payload, default=str))
+    logger.info(
+        orjson.dumps(
+            payload, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        ).decode()
+    )
+
+
+# =========================
+# JSON Serialisation
+# =========================
+
+
+def _orjson_default(value: Any) -> Any:
+    """
+    Fallback encoder for types orjson does not serialise natively.
+
+    Decimals are emitted as floats to match FastAPI's `jsonable_encoder`;
+    anything else falls back to its string representation.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib `json` module.
+
+    Used as the application's default response class so every endpoint emits
+    its payload through orjson's C encoder. List-style endpoints additionally
+    declare `response_model=None` so database rows are serialised directly,
+    skipping FastAPI's response validation pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
 
 
 # =========================
@@ -110,30 +175,57 @@ app = FastAPI(
     title="Alex Financial Advisor API",
     description="Backend API for AI-powered financial planning",
     version="1.0.0",
+    default_response_class=OrjsonResponse,
 )
 
 # =========================
 # Request Middleware (Request-ID)
 # =========================
 
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    # Prefer an upstream request id if provided; otherwise generate one.
-    incoming = request.headers.get("x-request-id") or request.headers.get(
-        "x-amzn-trace-id"
-    )
-    request_id = incoming.strip() if incoming else str(uuid.uuid4())
+class RequestIdMiddleware:
+    """
+    Raw ASGI middleware that assigns a correlation id to every HTTP request.
+
+    An upstream `x-request-id` (or `x-amzn-trace-id`) header is reused when
+    present; otherwise a new id is generated. The id is exposed through
+    `request.state.request_id` and `request_id_ctx`, echoed back in the
+    `x-request-id` response header, and scopes the per-request snapshot cache.
+    Implemented without `BaseHTTPMiddleware` to avoid its per-request task and
+    response streaming overhead.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Prefer an upstream request id if provided; otherwise generate one.
+        headers = dict(scope["headers"])
+        incoming = headers.get(b"x-request-id") or headers.get(b"x-amzn-trace-id")
+        request_id = incoming.decode("latin-1").strip() if incoming else os.urandom(16).hex()
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_request_id(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
+
+        token = request_id_ctx.set(request_id)
+        snapshot_token = snapshot_cache_ctx.set({})
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            snapshot_cache_ctx.reset(snapshot_token)
+            request_id_ctx.reset(token)
+            clerk_user_id_ctx.set(None)
 
-    request.state.request_id = request_id
-    token = request_id_ctx.set(request_id)
-    try:
-        response = await call_next(request)
-    finally:
-        request_id_ctx.reset(token)
-        clerk_user_id_ctx.set(None)
 
-    response.headers["x-request-id"] = request_id
-    return response
+app.add_middleware(RequestIdMiddleware)
 
 # =========================
 # CORS Configuration
@@ -147,6 +239,9 @@ cors_origins: List[str] = [
     if origin.strip()
 ]
 
+cors_allow_methods: List[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
+cors_allow_headers: List[str] = ["Authorization", "Content-Type"]
+
 # Attach CORS middleware to allow browser-based frontends to call the API
 app.add_middleware(
     CORSMiddleware,
@@ -154,19 +249,102 @@ app.add_middleware(
     # This frontend authenticates via `Authorization: Bearer <token>` (not cookies),
     # so CORS credentials are not required and keeping them off avoids misconfigs.
     allow_credentials=False,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type"],
+    allow_methods=cors_allow_methods,
+    allow_headers=cors_allow_headers,
+)
+
+# Lookup sets and response headers for preflights, compiled once at import
+_CORS_ALLOW_ALL_ORIGINS: bool = "*" in cors_origins
+_CORS_ALLOWED_ORIGINS: frozenset[str] = frozenset(cors_origins)
+_CORS_ALLOWED_METHODS: frozenset[str] = frozenset(cors_allow_methods)
+# Browsers may always send CORS-safelisted headers in addition to ours
+_CORS_ALLOWED_REQUEST_HEADERS: frozenset[str] = frozenset(
+    [h.lower() for h in cors_allow_headers]
+    + ["accept", "accept-language", "content-language", "content-type"]
+)
+_PREFLIGHT_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"access-control-allow-methods", ", ".join(sorted(_CORS_ALLOWED_METHODS)).encode()),
+    (b"access-control-allow-headers", ", ".join(sorted(_CORS_ALLOWED_REQUEST_HEADERS)).encode()),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
 )
 
+
+class CorsPreflightMiddleware:
+    """
+    Answer valid CORS preflight requests before any other middleware runs.
+
+    Preflights that pass the origin/method/header checks get an immediate 204
+    built from the precomputed headers above. Anything else (including
+    rejected preflights) falls through to `CORSMiddleware`, which remains the
+    source of truth for error responses and non-preflight requests.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or scope["method"] != "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        origin = headers.get(b"origin")
+        requested_method = headers.get(b"access-control-request-method")
+        if origin is None or requested_method is None or not self._is_allowed(
+            origin, requested_method, headers.get(b"access-control-request-headers")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        allow_origin = b"*" if _CORS_ALLOW_ALL_ORIGINS else origin
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_204_NO_CONTENT,
+                "headers": [(b"access-control-allow-origin", allow_origin), *_PREFLIGHT_HEADERS],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    def _is_allowed(origin: bytes, method: bytes, requested_headers: bytes | None) -> bool:
+        if not _CORS_ALLOW_ALL_ORIGINS and origin.decode("latin-1") not in _CORS_ALLOWED_ORIGINS:
+            return False
+        if method.decode("latin-1").upper() not in _CORS_ALLOWED_METHODS:
+            return False
+        if requested_headers:
+            for header in requested_headers.decode("latin-1").split(","):
+                header = header.strip().lower()
+                if header and header not in _CORS_ALLOWED_REQUEST_HEADERS:
+                    return False
+        return True
+
+
+# Added last so it is the outermost layer and sees preflights first
+app.add_middleware(CorsPreflightMiddleware)
+
 # =========================
 # Custom Exception Handlers
 # =========================
 
+# Map raw status codes to more descriptive and friendly messages (built once, read-only)
+_FRIENDLY_MESSAGES = MappingProxyType(
+    {
+        status.HTTP_401_UNAUTHORIZED: "Your session has expired. Please sign in again.",
+        status.HTTP_403_FORBIDDEN: "You don't have permission to access this resource.",
+        status.HTTP_404_NOT_FOUND: "The requested resource was not found.",
+        status.HTTP_429_TOO_MANY_REQUESTS: "Too many requests. Please slow down and try again later.",
+        status.HTTP_500_INTERNAL_SERVER_ERROR: "An internal error occurred. Please try again later.",
+        status.HTTP_503_SERVICE_UNAVAILABLE: "The service is temporarily unavailable. Please try again later.",
+    }
+)
+
 
 @app.exception_handler(ValidationError)
 async def validation_exception_handler(
     request: Request, exc: ValidationError
-) -> JSONResponse:
+) -> OrjsonResponse:
     """
     Handle Pydantic validation errors with user-friendly messages.
 
@@ -179,11 +357,11 @@ async def validation_exception_handler(
 
     Returns
     -------
-    fastapi.responses.JSONResponse
+    OrjsonResponse
         Response with HTTP 422 status and a generic user-friendly message.
     """
     # Return a simplified error payload instead of raw Pydantic internals
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Invalid input data. Please check your request and try again."
@@ -194,7 +372,7 @@ async def validation_exception_handler(
 @app.exception_handler(HTTPException)
 async def http_exception_handler(
     request: Request, exc: HTTPException
-) -> JSONResponse:
+) -> OrjsonResponse:
     """
     Handle HTTP exceptions and map them to user-friendly messages.
 
@@ -207,28 +385,18 @@ async def http_exception_handler(
 
     Returns
     -------
-    fastapi.responses.JSONResponse
+    OrjsonResponse
         Response with the original HTTP status code and a friendlier message.
     """
-    # Map raw status codes to more descriptive and friendly messages
-    user_friendly_messages: Dict[int, str] = {
-        status.HTTP_401_UNAUTHORIZED: "Your session has expired. Please sign in again.",
-        status.HTTP_403_FORBIDDEN: "You don't have permission to access this resource.",
-        status.HTTP_404_NOT_FOUND: "The requested resource was not found.",
-        status.HTTP_429_TOO_MANY_REQUESTS: "Too many requests. Please slow down and try again later.",
-        status.HTTP_500_INTERNAL_SERVER_ERROR: "An internal error occurred. Please try again later.",
-        status.HTTP_503_SERVICE_UNAVAILABLE: "The service is temporarily unavailable. Please try again later.",
-    }
-
     # Use friendly message when available, otherwise fall back to the original detail
-    message: str = user_friendly_messages.get(exc.status_code, exc.detail)
-    return JSONResponse(status_code=exc.status_code, content={"detail": message})
+    message: str = _FRIENDLY_MESSAGES.get(exc.status_code, exc.detail)
+    return OrjsonResponse(status_code=exc.status_code, content={"detail": message})
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(
     request: Request, exc: Exception
-) -> JSONResponse:
+) -> OrjsonResponse:
     """
     Handle unexpected unhandled exceptions gracefully.
 
@@ -244,13 +412,13 @@ async def general_exception_handler(
 
     Returns
     -------
-    fastapi.responses.JSONResponse
+    OrjsonResponse
         Response with HTTP 500 status and a generic user-friendly message.
     """
     # Log the full exception with stack trace for diagnostics
     logger.error("Unexpected error: %s", exc, exc_info=True)
     # Return a generic error message that is safe to show to end users
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "An unexpected error occurred. Our team has been notified."},
     )
@@ -261,6 +429,7 @@ async def general_exception_handler(
 # =========================
 
 _db_instance: Database | None = None
+_db_init_lock = threading.Lock()
 
 
 def _get_db() -> Database:
@@ -268,11 +437,15 @@ def _get_db() -> Database:
     Lazily instantiate the Database.
 
     This avoids failing module import (and breaking `/health`) when required DB
-    environment variables are not set yet.
+    environment variables are not set yet. Initialisation is guarded by a lock
+    so concurrent first requests in the threadpool share one client and its
+    connection pool instead of each building their own.
     """
     global _db_instance
     if _db_instance is None:
-        _db_instance = Database()
+        with _db_init_lock:
+            if _db_instance is None:
+                _db_instance = Database()
     return _db_instance
 
 
@@ -284,69 +457,253 @@ class _LazyDatabase:
 # Lazy proxy so route handlers can continue using `db.<model>...` unchanged.
 db: Database = cast(Database, _LazyDatabase())
 
-# Create an SQS client for sending analysis jobs to a background worker queue
-sqs_client = boto3.client(
-    "sqs", region_name=os.getenv("DEFAULT_AWS_REGION", "us-east-1")
-)
-
 # Read the SQS queue URL from environment (may be empty if queue is not configured)
 SQS_QUEUE_URL: str = os.getenv("SQS_QUEUE_URL", "")
 POLYGON_API_KEY: str = os.getenv("POLYGON_API_KEY", "")
 
+# Create an SQS client for sending analysis jobs to a background worker queue.
+# Skipped entirely when no queue is configured (e.g. local development).
+# Keepalive probes let idle pooled connections be reused across warm invocations.
+sqs_client: Any = (
+    boto3.client(
+        "sqs",
+        region_name=os.getenv("DEFAULT_AWS_REGION", "us-east-1"),
+        config=BotoConfig(tcp_keepalive=True),
+    )
+    if SQS_QUEUE_URL
+    else None
+)
+
+# SendMessageBatch accepts at most 10 entries per call
+SQS_BATCH_MAX_ENTRIES: int = 10
+# How long (seconds) queued messages wait for companions before a batch is sent;
+# raise it (e.g. 0.02) to trade a little latency for fuller batches under bursts
+SQS_BATCH_FLUSH_DELAY: float = float(os.getenv("SQS_BATCH_FLUSH_DELAY", "0.005"))
+
+
+class _SqsBatcher:
+    """
+    Coalesce concurrent SQS sends into `SendMessageBatch` calls.
+
+    Messages are buffered until either `SQS_BATCH_MAX_ENTRIES` are queued or
+    `SQS_BATCH_FLUSH_DELAY` elapses, then sent in a single request. Each
+    caller awaits a future that resolves to its own SQS message id (or raises
+    if that entry failed). The blocking boto3 call runs in a worker thread so
+    the event loop keeps serving other requests during the SQS round trip.
+    """
+
+    def __init__(self) -> None:
+        self._pending: deque[tuple[str, asyncio.Future[str]]] = deque()
+        self._flush_task: asyncio.Task[None] | None = None
+        # Strong references to in-flight full-batch flushes
+        self._sending: set[asyncio.Task[None]] = set()
+
+    async def enqueue(self, body: str) -> str:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.append((body, future))
+
+        if len(self._pending) >= SQS_BATCH_MAX_ENTRIES:
+            task = loop.create_task(self._flush())
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+
+        return await future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(SQS_BATCH_FLUSH_DELAY)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        while self._pending:
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(SQS_BATCH_MAX_ENTRIES, len(self._pending)))
+            ]
+            entries = [{"Id": str(i), "MessageBody": body} for i, (body, _) in enumerate(batch)]
+
+            try:
+                response = await asyncio.to_thread(
+                    sqs_client.send_message_batch, QueueUrl=SQS_QUEUE_URL, Entries=entries
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            successful = {e["Id"]: e["MessageId"] for e in response.get("Successful", [])}
+            failed = {e["Id"]: e for e in response.get("Failed", [])}
+            for i, (_, future) in enumerate(batch):
+                if future.done():
+                    continue
+                entry_id = str(i)
+                if entry_id in successful:
+                    future.set_result(successful[entry_id])
+                else:
+                    reason = failed.get(entry_id, {}).get("Message", "unknown error")
+                    future.set_exception(RuntimeError(f"SQS send failed: {reason}"))
+
+
+_sqs_batcher = _SqsBatcher()
+
+
+async def enqueue_job(message: Dict[str, Any]) -> str:
+    """
+    Queue a job message on SQS, batching with concurrent sends.
+
+    Parameters
+    ----------
+    message : dict
+        JSON-serialisable job message for the background worker.
+
+    Returns
+    -------
+    str
+        SQS message id assigned to the message.
+    """
+    # boto3 wants a str MessageBody; orjson's bytes decode cheaply to one
+    return await _sqs_batcher.enqueue(
+        orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+    )
+
+
+# Load snapshot positions for all accounts in one query (set "false" to fall back)
+SNAPSHOT_BATCH_POSITIONS: bool = os.getenv("SNAPSHOT_BATCH_POSITIONS", "true").lower() != "false"
+
 # =========================
 # Portfolio Snapshot Helpers
 # =========================
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime_str(s: str) -> Optional[datetime]:
+    # Memoised: instrument timestamps repeat across positions and requests.
+    try:
+        # RDS Data API returns ISO timestamps without timezone.
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return None
+
+
 def _parse_iso_datetime(value: Any) -> Optional[datetime]:
     if value is None:
         return None
     if isinstance(value, datetime):
         return value
     if isinstance(value, str):
-        s = value.strip()
-        if not s:
-            return None
-        try:
-            # RDS Data API returns ISO timestamps without timezone.
-            return datetime.fromisoformat(s)
-        except ValueError:
+        # Only pay for strip() when there is surrounding whitespace
+        if value and (value[0].isspace() or value[-1].isspace()):
+            value = value.strip()
+        if not value:
             return None
+        return _parse_iso_datetime_str(value)
     return None
 
 
-def _load_portfolio_snapshot(clerk_user_id: str) -> List[Dict[str, Any]]:
+def _snapshot_position(p: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an instrument-enriched position row into snapshot form.
+    """
+    instrument = {
+        "symbol": p.get("symbol"),
+        "name": p.get("instrument_name"),
+        "instrument_type": p.get("instrument_type"),
+        "current_price": p.get("current_price"),
+        "allocation_regions": p.get("allocation_regions") or {},
+        "allocation_sectors": p.get("allocation_sectors") or {},
+        "allocation_asset_class": p.get("allocation_asset_class") or {},
+        "updated_at": p.get("instrument_updated_at"),
+    }
+    return {
+        "symbol": p.get("symbol"),
+        "quantity": float(p.get("quantity") or 0.0),
+        "as_of_date": p.get("as_of_date"),
+        "current_price": float(p.get("current_price") or 0.0),
+        "instrument": instrument,
+    }
+
+
+def _load_portfolio_snapshot_with_quality(
+    clerk_user_id: str,
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Load a portfolio snapshot and its data-quality indicators.
+
+    Results are memoised for the lifetime of the current request (the cache
+    is installed by `RequestIdMiddleware`), so several consumers within
+    one request share a single set of database reads. Callers must treat the
+    returned structures as read-only.
+    """
+    cache = snapshot_cache_ctx.get()
+    if cache is None:
+        return _query_portfolio_snapshot(clerk_user_id)
+
+    entry = cache.get(clerk_user_id)
+    if entry is None:
+        entry = cache[clerk_user_id] = _query_portfolio_snapshot(clerk_user_id)
+    return entry
+
+
+def _load_portfolio_arrays(
+    clerk_user_id: str,
+) -> tuple[Dict[str, Any], PortfolioArrays]:
+    """
+    Load the request-scoped data quality plus the portfolio's column view.
+
+    The numeric fields are coerced to float64 columns once so value and
+    allocation reductions do not re-walk the nested dicts.
+    """
+    snapshot, data_quality = _load_portfolio_snapshot_with_quality(clerk_user_id)
+    return data_quality, PortfolioArrays.from_portfolio_data({"accounts": snapshot})
+
+
+def _query_portfolio_snapshot(
+    clerk_user_id: str,
+) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """
-    Load a portfolio snapshot suitable for deterministic analysis utilities.
+    Read a portfolio snapshot from the database, with its data quality.
+
+    Positions for every account are fetched in one query and grouped by
+    account in Python. Setting `SNAPSHOT_BATCH_POSITIONS=false` falls back to
+    one positions query per account. Position freshness and the distinct
+    instruments are collected in the same walk that builds the snapshot, so
+    the data-quality checks need no second pass over positions.
     """
     accounts_raw = db.accounts.find_by_user(clerk_user_id)
+
+    positions_by_account: Dict[str, List[Dict[str, Any]]] = {}
+    if SNAPSHOT_BATCH_POSITIONS:
+        rows = db.positions.find_by_user(clerk_user_id)
+        for account_id, group in groupby(rows, key=lambda row: str(row.get("account_id"))):
+            positions_by_account[account_id] = list(group)
+
     snapshot_accounts: List[Dict[str, Any]] = []
+    instruments_by_symbol: Dict[str, Dict[str, Any]] = {}
+    latest_position_as_of: Optional[datetime] = None
     for account in accounts_raw:
         account_id = account.get("id")
         if not account_id:
             continue
-        positions = db.positions.find_by_account(account_id)
+        if SNAPSHOT_BATCH_POSITIONS:
+            positions = positions_by_account.get(str(account_id), [])
+        else:
+            positions = db.positions.find_by_account(account_id)
+
         snapshot_positions: List[Dict[str, Any]] = []
         for p in positions:
-            instrument = {
-                "symbol": p.get("symbol"),
-                "name": p.get("instrument_name"),
-                "instrument_type": p.get("instrument_type"),
-                "current_price": p.get("current_price"),
-                "allocation_regions": p.get("allocation_regions") or {},
-                "allocation_sectors": p.get("allocation_sectors") or {},
-                "allocation_asset_class": p.get("allocation_asset_class") or {},
-                "updated_at": p.get("instrument_updated_at"),
-            }
-            snapshot_positions.append(
-                {
-                    "symbol": p.get("symbol"),
-                    "quantity": float(p.get("quantity") or 0.0),
-                    "as_of_date": p.get("as_of_date"),
-                    "current_price": float(p.get("current_price") or 0.0),
-                    "instrument": instrument,
-                }
-            )
+            pos = _snapshot_position(p)
+            snapshot_positions.append(pos)
+
+            # Data-quality facts gathered in the same walk
+            as_of = _parse_iso_datetime(pos["as_of_date"])
+            if as_of and (latest_position_as_of is None or as_of > latest_position_as_of):
+                latest_position_as_of = as_of
+            symbol = str(pos["symbol"] or "").upper()
+            if symbol not in instruments_by_symbol:
+                instruments_by_symbol[symbol] = pos["instrument"]
 
         snapshot_accounts.append(
             {
@@ -358,61 +715,55 @@ def _load_portfolio_snapshot(clerk_user_id: str) -> List[Dict[str, Any]]:
             }
         )
 
-    return snapshot_accounts
+    return snapshot_accounts, _data_quality_from_instruments(
+        instruments_by_symbol, latest_position_as_of
+    )
 
 
-def _compute_data_quality(snapshot_accounts: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _data_quality_from_instruments(
+    instruments_by_symbol: Dict[str, Dict[str, Any]],
+    latest_position_as_of: Optional[datetime],
+) -> Dict[str, Any]:
     """
-    Compute missing/stale metadata indicators from a portfolio snapshot.
+    Build data-quality indicators from the distinct instruments of a portfolio.
     """
     missing_prices: List[Dict[str, Any]] = []
     missing_allocations: List[Dict[str, Any]] = []
     stale_prices: List[Dict[str, Any]] = []
 
     latest_instrument_update: Optional[datetime] = None
-    latest_position_as_of: Optional[datetime] = None
     now = datetime.now(timezone.utc)
+    # RDS Data API timestamps are naive UTC; compare them against a naive clock
+    now_naive = now.replace(tzinfo=None)
 
-    seen_symbols: set[str] = set()
+    # Instrument-level checks run once per distinct symbol
+    for symbol, instrument in instruments_by_symbol.items():
+        name = instrument.get("name")
 
-    for account in snapshot_accounts:
-        for pos in account.get("positions") or []:
-            symbol = str(pos.get("symbol") or "").upper()
-            instrument = pos.get("instrument") or {}
-
-            as_of = _parse_iso_datetime(pos.get("as_of_date"))
-            if as_of and (latest_position_as_of is None or as_of > latest_position_as_of):
-                latest_position_as_of = as_of
-
-            updated_at = _parse_iso_datetime(instrument.get("updated_at"))
-            if updated_at and (latest_instrument_update is None or updated_at > latest_instrument_update):
-                latest_instrument_update = updated_at
-
-            if symbol in seen_symbols:
-                continue
-            seen_symbols.add(symbol)
-
-            price = instrument.get("current_price")
-            try:
-                price_f = float(price) if price is not None else 0.0
-            except (TypeError, ValueError):
-                price_f = 0.0
+        updated_at = _parse_iso_datetime(instrument.get("updated_at"))
+        if updated_at and (latest_instrument_update is None or updated_at > latest_instrument_update):
+            latest_instrument_update = updated_at
 
-            if price_f <= 0:
-                missing_prices.append({"symbol": symbol, "name": instrument.get("name")})
+        price = instrument.get("current_price")
+        try:
+            price_f = float(price) if price is not None else 0.0
+        except (TypeError, ValueError):
+            price_f = 0.0
 
-            alloc_asset = instrument.get("allocation_asset_class") or {}
-            alloc_regions = instrument.get("allocation_regions") or {}
-            alloc_sectors = instrument.get("allocation_sectors") or {}
+        if price_f <= 0:
+            missing_prices.append({"symbol": symbol, "name": name})
 
-            has_alloc = bool(alloc_asset) and bool(alloc_regions) and bool(alloc_sectors)
-            if not has_alloc:
-                missing_allocations.append({"symbol": symbol, "name": instrument.get("name")})
+        if not (
+            instrument.get("allocation_asset_class")
+            and instrument.get("allocation_regions")
+            and instrument.get("allocation_sectors")
+        ):
+            missing_allocations.append({"symbol": symbol, "name": name})
 
-            if updated_at:
-                age_days = (now - updated_at.replace(tzinfo=timezone.utc)).days
-                if age_days >= 7:
-                    stale_prices.append({"symbol": symbol, "name": instrument.get("name"), "age_days": age_days})
+        if updated_at:
+            age_days = ((now_naive if updated_at.tzinfo is None else now) - updated_at).days
+            if age_days >= 7:
+                stale_prices.append({"symbol": symbol, "name": name, "age_days": age_days})
 
     confidence = "high"
     if missing_prices or missing_allocations:
@@ -439,36 +790,110 @@ def _compute_data_quality(snapshot_accounts: List[Dict[str, Any]]) -> Dict[str,
     }
 
 
-def _polygon_get_json(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+# Shared async Polygon client: keeps TCP/TLS connections alive across calls and,
+# on Lambda, across warm invocations of the same container. It is deliberately
+# never closed, since Mangum runs lifespan shutdown after every invocation.
+# HTTP/2 lets concurrent requests multiplex over one connection; it needs the
+# optional `h2` package (httpx[http2]) and falls back to HTTP/1.1 without it.
+_polygon_client = httpx.AsyncClient(
+    base_url="https://api.polygon.io",
+    headers={"Accept": "application/json"},
+    timeout=20.0,
+    limits=httpx.Limits(max_keepalive_connections=20),
+    http2=importlib.util.find_spec("h2") is not None,
+)
+
+
+async def _polygon_get_json(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Minimal Polygon REST helper (no external dependencies).
+    Minimal Polygon REST helper using the shared keep-alive client.
+
+    Awaited from async route handlers so a slow upstream call no longer
+    blocks the event loop for other in-flight requests.
     """
     if not POLYGON_API_KEY:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="POLYGON_API_KEY not configured")
 
-    q = {**params, "apiKey": POLYGON_API_KEY}
-    url = f"https://api.polygon.io{path}?{urlencode(q)}"
-    req = UrlRequest(url, headers={"Accept": "application/json"})
-    with urlopen(req, timeout=20) as resp:  # noqa: S310
-        raw = resp.read().decode("utf-8")
-    return json.loads(raw)
+    resp = await _polygon_client.get(path, params={**params, "apiKey": POLYGON_API_KEY})
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
 # =========================
 # Clerk Authentication Setup
 # =========================
 
+# Upper bound on cached verified tokens held per warm container
+JWT_CACHE_MAXSIZE: int = 4096
+# Maximum time (seconds) a verified token is trusted without re-verification
+JWT_CACHE_TTL_SECONDS: float = 300.0
+# Evict cached tokens this many seconds before their `exp` claim
+JWT_CACHE_EXP_SKEW_SECONDS: float = 30.0
+
+
+class CachedClerkHTTPBearer(ClerkHTTPBearer):
+    """
+    Clerk bearer guard that memoises verified JWT claims per raw token.
+
+    JWKS signature verification (RSA) is the dominant cost of authenticating a
+    request. Sessions re-send the same token until it expires, so the decoded
+    claims are kept in a bounded LRU keyed by a hash of the token and reused
+    until `exp` (minus a small skew) or `JWT_CACHE_TTL_SECONDS`, whichever
+    comes first. Tokens that fail verification are never cached.
+    """
+
+    def __init__(self, config: ClerkConfig, **kwargs: Any) -> None:
+        super().__init__(config, **kwargs)
+        self._claims_cache: "OrderedDict[bytes, tuple[Dict[str, Any], float]]" = OrderedDict()
+
+    @staticmethod
+    def _cache_key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def _decode_token(self, token: str) -> dict | None:
+        key = self._cache_key(token)
+        now = time.time()
+
+        cached = self._claims_cache.get(key)
+        if cached is not None:
+            claims, expires_at = cached
+            if expires_at > now:
+                self._claims_cache.move_to_end(key)
+                return claims
+            del self._claims_cache[key]
+
+        claims = super()._decode_token(token)
+        if not claims:
+            return claims
+
+        expires_at = now + JWT_CACHE_TTL_SECONDS
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp) - JWT_CACHE_EXP_SKEW_SECONDS)
+
+        if expires_at > now:
+            self._claims_cache[key] = (claims, expires_at)
+            if len(self._claims_cache) > JWT_CACHE_MAXSIZE:
+                self._claims_cache.popitem(last=False)
+
+        return claims
+
+
 # Build Clerk configuration using JWKS URL for JWT verification
 clerk_config: ClerkConfig = ClerkConfig(jwks_url=os.getenv("CLERK_JWKS_URL", ""))
 
 # Instantiate HTTP bearer guard that validates Clerk JWTs on incoming requests
-clerk_guard: ClerkHTTPBearer = ClerkHTTPBearer(clerk_config)
+clerk_guard: ClerkHTTPBearer = CachedClerkHTTPBearer(clerk_config)
 
 
-async def get_current_user_id(
+async def get_auth(
     creds: HTTPAuthorizationCredentials = Depends(clerk_guard),
-) -> str:
+) -> tuple[str, HTTPAuthorizationCredentials]:
     """
-    Extract the authenticated Clerk user ID from a validated JWT.
+    Resolve the authenticated Clerk user and their verified credentials.
+
+    This is the single dependency that touches `clerk_guard`; every route
+    reaches the JWT through it so FastAPI's per-request dependency cache
+    guarantees exactly one verification per request.
 
     Parameters
     ----------
@@ -477,15 +902,34 @@ async def get_current_user_id(
 
     Returns
     -------
-    str
-        Clerk user identifier (`sub` claim) for the current session.
+    tuple of (str, fastapi_clerk_auth.HTTPAuthorizationCredentials)
+        Clerk user identifier (`sub` claim) and the credentials it came from.
     """
     # Read the subject (user id) from the decoded Clerk JWT payload
     user_id: str = creds.decoded["sub"]
     # Log the authenticated user for observability and debugging
     clerk_user_id_ctx.set(user_id)
     logger.info("Authenticated user: %s", user_id)
-    return user_id
+    return user_id, creds
+
+
+async def get_current_user_id(
+    auth: tuple[str, HTTPAuthorizationCredentials] = Depends(get_auth),
+) -> str:
+    """
+    Extract the authenticated Clerk user ID from a validated JWT.
+
+    Parameters
+    ----------
+    auth : tuple of (str, fastapi_clerk_auth.HTTPAuthorizationCredentials)
+        Result of `get_auth` for the current request.
+
+    Returns
+    -------
+    str
+        Clerk user identifier (`sub` claim) for the current session.
+    """
+    return auth[0]
 
 
 # =========================
@@ -493,6 +937,19 @@ async def get_current_user_id(
 # =========================
 
 
+class RequestModel(BaseModel):
+    """
+    Base class for request bodies accepted by the API.
+
+    Unknown fields are ignored and surrounding whitespace is stripped from
+    string values before the compiled pydantic-core validator runs. Validators
+    are built eagerly when each subclass is defined, so the cost is paid once
+    at cold start rather than on the first request that uses the model.
+    """
+
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True, defer_build=False)
+
+
 class UserResponse(BaseModel):
     """
     API response model for user retrieval or creation.
@@ -510,7 +967,7 @@ class UserResponse(BaseModel):
     created: bool
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(RequestModel):
     """
     Payload for updating user-level settings.
 
@@ -536,7 +993,7 @@ class UserUpdate(BaseModel):
     user_preferences: Optional[Dict[str, Any]] = None
 
 
-class AccountUpdate(BaseModel):
+class AccountUpdate(RequestModel):
     """
     Payload for updating a single investment account.
 
@@ -555,7 +1012,7 @@ class AccountUpdate(BaseModel):
     cash_balance: Optional[float] = None
 
 
-class PositionUpdate(BaseModel):
+class PositionUpdate(RequestModel):
     """
     Payload for updating a single position within an account.
 
@@ -568,7 +1025,7 @@ class PositionUpdate(BaseModel):
     quantity: Optional[float] = None
 
 
-class AnalyzeRequest(BaseModel):
+class AnalyzeRequest(RequestModel):
     """
     Request body for triggering a portfolio analysis job.
 
@@ -604,31 +1061,41 @@ class AnalyzeResponse(BaseModel):
     message: str
 
 
-class RebalancePreviewRequest(BaseModel):
+class RebalancePreviewRequest(RequestModel):
     cash_only: bool = True
     allow_sells: bool = False
-    drift_band_pct: float = Field(default=5.0, ge=0.0, le=100.0)
+    drift_band_pct: Annotated[float, Field(ge=0.0, le=100.0)] = 5.0
     drift_band_pct_by_class: Optional[Dict[str, float]] = None
-    max_turnover_pct: float = Field(default=20.0, ge=0.0, le=100.0)
-    transaction_cost_bps: float = Field(default=10.0, ge=0.0, le=10_000.0)
+    max_turnover_pct: Annotated[float, Field(ge=0.0, le=100.0)] = 20.0
+    transaction_cost_bps: Annotated[float, Field(ge=0.0, le=10_000.0)] = 10.0
     allow_taxable_sells: bool = True
     excluded_accounts: Optional[List[str]] = None
     jurisdiction: Optional[str] = None
     persist: bool = False
 
 
-class RetirementPreviewRequest(BaseModel):
-    annual_contribution: float = Field(default=10_000.0, ge=0.0)
-    years_until_retirement: Optional[int] = Field(default=None, ge=0)
-    retirement_age: Optional[int] = Field(default=None, ge=0)
-    current_age: Optional[int] = Field(default=None, ge=0)
-    target_annual_income: Optional[float] = Field(default=None, ge=0.0)
-    inflation_rate: float = Field(default=0.03, ge=0.0, le=0.2)
-    return_shift: float = Field(default=0.0, ge=-0.2, le=0.2)
-    volatility_mult: float = Field(default=1.0, ge=0.1, le=5.0)
-    shock_year: Optional[int] = Field(default=None, ge=0)
-    shock_pct: Optional[float] = Field(default=None, ge=0.0, le=1.0)
-    num_simulations: int = Field(default=500, ge=50, le=5000)
+# Rebalance request fields forwarded to the engine without transformation
+_REBALANCE_PASSTHROUGH_OPTIONS = frozenset({
+    "drift_band_pct",
+    "drift_band_pct_by_class",
+    "max_turnover_pct",
+    "transaction_cost_bps",
+    "allow_taxable_sells",
+})
+
+
+class RetirementPreviewRequest(RequestModel):
+    annual_contribution: Annotated[float, Field(ge=0.0)] = 10_000.0
+    years_until_retirement: Optional[Annotated[int, Field(ge=0)]] = None
+    retirement_age: Optional[Annotated[int, Field(ge=0)]] = None
+    current_age: Optional[Annotated[int, Field(ge=0)]] = None
+    target_annual_income: Optional[Annotated[float, Field(ge=0.0)]] = None
+    inflation_rate: Annotated[float, Field(ge=0.0, le=0.2)] = 0.03
+    return_shift: Annotated[float, Field(ge=-0.2, le=0.2)] = 0.0
+    volatility_mult: Annotated[float, Field(ge=0.1, le=5.0)] = 1.0
+    shock_year: Optional[Annotated[int, Field(ge=0)]] = None
+    shock_pct: Optional[Annotated[float, Field(ge=0.0, le=1.0)]] = None
+    num_simulations: Annotated[int, Field(ge=50, le=5000)] = 500
 
 
 # =========================
@@ -636,18 +1103,33 @@ class RetirementPreviewRequest(BaseModel):
 # =========================
 
 
+# Pre-serialized health payload as [generated_at, body]; refreshed at most once per second
+_HEALTH_BODY_CACHE: List[Any] = [0.0, b""]
+
+
 @app.get("/health")
-async def health_check() -> Dict[str, str]:
+async def health_check() -> Response:
     """
     Simple health check endpoint for uptime monitoring.
 
+    The JSON body is rendered once and reused until the timestamp is more than
+    a second old, so frequent load-balancer probes skip serialisation entirely.
+
     Returns
     -------
-    dict
-        Dictionary containing a `status` flag and current ISO-8601 timestamp.
-    """
+    fastapi.Response
+        JSON body containing a `status` flag and current ISO-8601 timestamp.
+    """
+    now = time.time()
+    if now - _HEALTH_BODY_CACHE[0] > 1.0:
+        _HEALTH_BODY_CACHE[:] = [
+            now,
+            b'{"status":"healthy","timestamp":"%s"}'
+            % datetime.fromtimestamp(now).isoformat().encode(),
+        ]
+
     # Return a basic health payload indicating the API is responsive
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return Response(content=_HEALTH_BODY_CACHE[1], media_type="application/json")
 
 
 # =========================
@@ -655,38 +1137,40 @@ async def health_check() -> Dict[str, str]:
 # =========================
 
 
-@app.get("/api/user", response_model=UserResponse)
-async def get_or_create_user(
-    clerk_user_id: str = Depends(get_current_user_id),
-    creds: HTTPAuthorizationCredentials = Depends(clerk_guard),
-) -> UserResponse:
+@app.get("/api/user", response_model=None, responses={200: {"model": UserResponse}})
+def get_or_create_user(
+    auth: tuple[str, HTTPAuthorizationCredentials] = Depends(get_auth),
+) -> OrjsonResponse:
     """
     Retrieve an existing user or create a new one with sensible defaults.
 
     Parameters
     ----------
-    clerk_user_id : str
-        Authenticated Clerk user identifier injected by dependency.
-    creds : fastapi_clerk_auth.HTTPAuthorizationCredentials
-        Credentials providing access to the decoded Clerk JWT.
+    auth : tuple of (str, fastapi_clerk_auth.HTTPAuthorizationCredentials)
+        Authenticated Clerk user identifier and the credentials providing
+        access to the decoded Clerk JWT, injected by dependency.
 
     Returns
     -------
-    UserResponse
-        Metadata about the user and whether a new record was created.
+    OrjsonResponse
+        Body shaped like `UserResponse`: the user row and whether a new
+        record was created. Returned directly so the row is serialised once
+        without response-model revalidation.
 
     Raises
     ------
     fastapi.HTTPException
         If the user profile cannot be loaded or created due to an internal error.
     """
+    clerk_user_id, creds = auth
+
     try:
         # Attempt to look up the user by Clerk user identifier
         user: Optional[Dict[str, Any]] = db.users.find_by_clerk_id(clerk_user_id)
 
         # If the user already exists, return it without creating a new record
         if user:
-            return UserResponse(user=user, created=False)
+            return OrjsonResponse({"user": user, "created": False})
 
         # Extract token claims for default display name and other metadata
         token_data: Dict[str, Any] = creds.decoded
@@ -700,7 +1184,6 @@ async def get_or_create_user(
 
         # Prepare default user preferences to insert in a single operation
         user_data: Dict[str, Any] = {
-            "clerk_user_id": clerk_user_id,
             "display_name": display_name,
             "years_until_retirement": 20,
             "target_retirement_income": 60000,
@@ -715,15 +1198,14 @@ async def get_or_create_user(
             },
         }
 
-        # Insert user into database using Clerk user id as the primary key
-        db.users.db.insert("users", user_data, returning="clerk_user_id")
-
-        # Retrieve the freshly created user record for confirmation
-        created_user: Dict[str, Any] = db.users.find_by_clerk_id(clerk_user_id)
-        # Log creation event for observability
-        logger.info("Created new user: %s", clerk_user_id)
+        # Insert the user and get the stored row back from the same statement;
+        # a concurrent first request for the same user makes this a no-op read
+        stored_user, created = db.users.upsert_default(clerk_user_id, user_data)
+        if created:
+            # Log creation event for observability
+            logger.info("Created new user: %s", clerk_user_id)
 
-        return UserResponse(user=created_user, created=True)
+        return OrjsonResponse({"user": stored_user, "created": created})
 
     except Exception as e:
         # Log any unexpected failure to create or fetch the user
@@ -735,7 +1217,7 @@ async def get_or_create_user(
 
 
 @app.put("/api/user")
-async def update_user(
+def update_user(
     user_update: UserUpdate, clerk_user_id: str = Depends(get_current_user_id)
 ) -> Dict[str, Any]:
     """
@@ -759,23 +1241,18 @@ async def update_user(
         If the user cannot be found or an internal error occurs.
     """
     try:
-        # Attempt to fetch the existing user record from the database
-        user: Optional[Dict[str, Any]] = db.users.find_by_clerk_id(clerk_user_id)
-
-        # If no user is found, return a 404 response
-        if not user:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
         # Extract only the fields that were explicitly provided in the request
         update_data: Dict[str, Any] = user_update.model_dump(exclude_unset=True)
 
-        # Apply the partial update using Clerk user id as the primary key
-        db.users.db.update(
-            "users", update_data, "clerk_user_id = :clerk_user_id", {"clerk_user_id": clerk_user_id}
+        # Apply the partial update and read the updated row back via RETURNING
+        updated_user: Optional[Dict[str, Any]] = db.users.update_by_clerk_id(
+            clerk_user_id, update_data
         )
 
-        # Fetch the updated user to return to the client
-        updated_user: Dict[str, Any] = db.users.find_by_clerk_id(clerk_user_id)
+        # If no user matched, return a 404 response
+        if not updated_user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
         return updated_user
 
     except HTTPException:
@@ -794,10 +1271,27 @@ async def update_user(
 # =========================
 
 
-@app.get("/api/accounts")
-async def list_accounts(
+# Starting cash balance when the request omits one
+_ZERO_CASH = Decimal("0")
+
+
+def _raise_missing_or_forbidden(record: Optional[Dict[str, Any]], not_found_detail: str) -> NoReturn:
+    """
+    Map an owner-scoped mutation that matched no rows to the right error.
+
+    Only called on the failure path: `record` is the unscoped lookup of the
+    target row, so a missing row is a 404 and an existing one belongs to
+    someone else (403).
+    """
+    if not record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found_detail)
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+
+@app.get("/api/accounts", response_model=None)
+def list_accounts(
     clerk_user_id: str = Depends(get_current_user_id),
-) -> List[Dict[str, Any]]:
+) -> OrjsonResponse:
     """
     List all investment accounts belonging to the current user.
 
@@ -808,8 +1302,9 @@ async def list_accounts(
 
     Returns
     -------
-    list of dict
-        List of account records owned by the user.
+    OrjsonResponse
+        JSON array of account records owned by the user. Rows are rendered
+        directly, bypassing FastAPI's `jsonable_encoder` walk.
 
     Raises
     ------
@@ -819,7 +1314,7 @@ async def list_accounts(
     try:
         # Retrieve all accounts associated with the authenticated user
         accounts: List[Dict[str, Any]] = db.accounts.find_by_user(clerk_user_id)
-        return accounts
+        return OrjsonResponse(accounts)
     except Exception as e:
         # Log any unexpected error during account retrieval
         logger.error("Error listing accounts: %s", e)
@@ -829,7 +1324,7 @@ async def list_accounts(
 
 
 @app.post("/api/accounts")
-async def create_account(
+def create_account(
     account: AccountCreate, clerk_user_id: str = Depends(get_current_user_id)
 ) -> Dict[str, Any]:
     """
@@ -859,18 +1354,16 @@ async def create_account(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
         # Determine starting cash balance as Decimal for financial accuracy
-        cash_balance: Decimal = getattr(account, "cash_balance", Decimal("0"))
+        cash_balance: Decimal = getattr(account, "cash_balance", _ZERO_CASH)
 
-        # Create the account record within the database
-        account_id: str = db.accounts.create_account(
+        # Create the account record and read it back via RETURNING in one round trip
+        created_account: Dict[str, Any] = db.accounts.create_account(
             clerk_user_id=clerk_user_id,
             account_name=account.account_name,
             account_purpose=account.account_purpose,
             cash_balance=cash_balance,
+            returning="*",
         )
-
-        # Fetch the created account for the response payload
-        created_account: Dict[str, Any] = db.accounts.find_by_id(account_id)
         return created_account
 
     except HTTPException:
@@ -885,7 +1378,7 @@ async def create_account(
 
 
 @app.put("/api/accounts/{account_id}")
-async def update_account(
+def update_account(
     account_id: str,
     account_update: AccountUpdate,
     clerk_user_id: str = Depends(get_current_user_id),
@@ -914,23 +1407,16 @@ async def update_account(
         or an internal error occurs.
     """
     try:
-        # Retrieve the target account to confirm existence and ownership
-        account: Optional[Dict[str, Any]] = db.accounts.find_by_id(account_id)
-        if not account:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
-
-        # Enforce that the account belongs to the authenticated user
-        if account.get("clerk_user_id") != clerk_user_id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-
         # Construct a dict of fields that the client intends to update
         update_data: Dict[str, Any] = account_update.model_dump(exclude_unset=True)
 
-        # Apply the update via the account repository
-        db.accounts.update(account_id, update_data)
+        # Apply the update only if the account is owned by the user (one statement)
+        updated_account: Optional[Dict[str, Any]] = db.accounts.update_owned(
+            account_id, clerk_user_id, update_data
+        )
+        if not updated_account:
+            _raise_missing_or_forbidden(db.accounts.find_by_id(account_id), "Account not found")
 
-        # Return the updated account from the database
-        updated_account: Dict[str, Any] = db.accounts.find_by_id(account_id)
         return updated_account
 
     except HTTPException:
@@ -945,7 +1431,7 @@ async def update_account(
 
 
 @app.delete("/api/accounts/{account_id}")
-async def delete_account(
+def delete_account(
     account_id: str, clerk_user_id: str = Depends(get_current_user_id)
 ) -> Dict[str, str]:
     """
@@ -970,23 +1456,10 @@ async def delete_account(
         or an internal error occurs.
     """
     try:
-        # Retrieve the account record to verify existence and ownership
-        account: Optional[Dict[str, Any]] = db.accounts.find_by_id(account_id)
-        if not account:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
-
-        # Ensure that the account belongs to the requesting user
-        if account.get("clerk_user_id") != clerk_user_id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-
-        # Fetch all positions in this account to remove them first
-        positions: List[Dict[str, Any]] = db.positions.find_by_account(account_id)
-        for position in positions:
-            # Delete each position associated with this account
-            db.positions.delete(position["id"])
-
-        # Delete the account itself after positions have been removed
-        db.accounts.delete(account_id)
+        # Delete the account only if the user owns it; positions.account_id is
+        # ON DELETE CASCADE, so its positions go in the same statement
+        if not db.accounts.delete_owned(account_id, clerk_user_id):
+            _raise_missing_or_forbidden(db.accounts.find_by_id(account_id), "Account not found")
 
         return {"message": "Account deleted successfully"}
 
@@ -1006,32 +1479,39 @@ async def delete_account(
 # =========================
 
 
-@app.get("/api/accounts/{account_id}/positions")
+# Defaults for instruments auto-created from a new position's symbol. Read-only
+# views are safe to share: pydantic copies them into fresh dicts on validation.
+_ZERO_PRICE = Decimal("0.00")
+_DEFAULT_REGIONS = MappingProxyType({"north_america": 100.0})
+_DEFAULT_SECTORS = MappingProxyType({"other": 100.0})
+_DEFAULT_ASSET_CLASS = MappingProxyType({
+    "stock": MappingProxyType({"equity": 100.0}),
+    "etf": MappingProxyType({"fixed_income": 100.0}),
+})
+
+
+@app.get("/api/accounts/{account_id}/positions", response_model=None)
 async def list_positions(
     account_id: str, clerk_user_id: str = Depends(get_current_user_id)
 ) -> Dict[str, List[Dict[str, Any]]]:
     try:
-        account = db.accounts.find_by_id(account_id)
+        # The account (for ownership) and its positions are independent reads,
+        # so run them concurrently; positions are discarded if the check fails.
+        # Instrument columns (flat and nested) arrive in the same JOIN query.
+        account, positions = await asyncio.gather(
+            asyncio.to_thread(db.accounts.find_by_id, account_id),
+            asyncio.to_thread(db.positions.find_by_account_with_instrument, account_id),
+        )
         if not account:
             raise HTTPException(404, "Account not found")
 
         if account.get("clerk_user_id") != clerk_user_id:
             raise HTTPException(403, "Not authorized")
 
-        positions = db.positions.find_by_account(account_id)
-
-        formatted_positions = []
-        for pos in positions:
-            # ✔ Use the repository method (it actually works)
-            instrument = db.instruments.find_by_symbol(pos["symbol"])
-
-            formatted_positions.append({
-                **pos,
-                "instrument": instrument,
-            })
-
-        return {"positions": formatted_positions}
+        return {"positions": positions}
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error listing positions: %s", e)
         raise HTTPException(500, str(e))
@@ -1039,7 +1519,7 @@ async def list_positions(
 
 
 @app.post("/api/positions")
-async def create_position(
+def create_position(
     position: PositionCreate, clerk_user_id: str = Depends(get_current_user_id)
 ) -> Dict[str, Any]:
     """
@@ -1067,8 +1547,32 @@ async def create_position(
         or an internal error occurs.
     """
     try:
+        # Normalise symbol to uppercase for consistent instrument lookups
+        symbol_upper: str = position.symbol.upper()
+
+        # Infer a simple instrument type based on symbol structure
+        if len(symbol_upper) <= 5 and symbol_upper.isalpha():
+            instrument_type: str = "stock"
+        else:
+            instrument_type = "etf"
+
+        # Compose basic default allocations and zero starting price, used only
+        # if the symbol is not already a known instrument
+        new_instrument = InstrumentCreate(
+            symbol=symbol_upper,
+            name=f"{symbol_upper} - User Added",
+            instrument_type=instrument_type,
+            current_price=_ZERO_PRICE,
+            allocation_regions=_DEFAULT_REGIONS,
+            allocation_sectors=_DEFAULT_SECTORS,
+            allocation_asset_class=_DEFAULT_ASSET_CLASS[instrument_type],
+        )
+
+        # Look up the target account first: nothing is written until the
+        # caller is known to own it
+        account = db.accounts.find_by_id(position.account_id)
+
         # Check that the target account exists
-        account: Optional[Dict[str, Any]] = db.accounts.find_by_id(position.account_id)
         if not account:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
 
@@ -1076,49 +1580,20 @@ async def create_position(
         if account.get("clerk_user_id") != clerk_user_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-        # Normalise symbol to uppercase for consistent instrument lookups
-        symbol_upper: str = position.symbol.upper()
-
-        # Attempt to find an existing instrument for this symbol
-        instrument: Optional[Dict[str, Any]] = db.instruments.find_by_symbol(symbol_upper)
-        if not instrument:
-            # Log that a new instrument is being created on the fly
-            logger.info("Creating new instrument: %s", symbol_upper)
-
-            # Import the instrument creation schema lazily to avoid circular imports
-            from src.schemas import InstrumentCreate
-
-            # Infer a simple instrument type based on symbol structure
-            if len(symbol_upper) <= 5 and symbol_upper.isalpha():
-                instrument_type: str = "stock"
-            else:
-                instrument_type = "etf"
-
-            # Compose basic default allocations and zero starting price
-            new_instrument = InstrumentCreate(
-                symbol=symbol_upper,
-                name=f"{symbol_upper} - User Added",
-                instrument_type=instrument_type,
-                current_price=Decimal("0.00"),
-                allocation_regions={"north_america": 100.0},
-                allocation_sectors={"other": 100.0},
-                allocation_asset_class=(
-                    {"equity": 100.0}
-                    if instrument_type == "stock"
-                    else {"fixed_income": 100.0}
-                ),
-            )
-
-            # Persist the new instrument in the instrument repository
-            db.instruments.create_instrument(new_instrument)
-
-        # Insert the position into the positions repository
-        position_id: str = db.positions.add_position(
-            account_id=position.account_id, symbol=symbol_upper, quantity=position.quantity
+        # Ensure the instrument exists (ON CONFLICT DO NOTHING)
+        created_symbol = db.instruments.create_instrument(new_instrument, if_missing=True)
+        if created_symbol:
+            # Log that a new instrument was created on the fly
+            logger.info("Created new instrument: %s", symbol_upper)
+            _invalidate_instruments_cache()
+
+        # Upsert the position and read the stored row back via RETURNING
+        created_position: Dict[str, Any] = db.positions.add_position(
+            account_id=position.account_id,
+            symbol=symbol_upper,
+            quantity=position.quantity,
+            returning="*",
         )
-
-        # Retrieve the created position for the response payload
-        created_position: Dict[str, Any] = db.positions.find_by_id(position_id)
         return created_position
 
     except HTTPException:
@@ -1133,7 +1608,7 @@ async def create_position(
 
 
 @app.put("/api/positions/{position_id}")
-async def update_position(
+def update_position(
     position_id: str,
     position_update: PositionUpdate,
     clerk_user_id: str = Depends(get_current_user_id),
@@ -1162,28 +1637,16 @@ async def update_position(
         or an internal error occurs.
     """
     try:
-        # Retrieve the existing position record
-        position: Optional[Dict[str, Any]] = db.positions.find_by_id(position_id)
-        if not position:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Position not found")
-
-        # Fetch the related account to confirm existence and validate ownership
-        account: Optional[Dict[str, Any]] = db.accounts.find_by_id(position["account_id"])
-        if not account:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
-
-        # Ensure the account belongs to the currently authenticated user
-        if account.get("clerk_user_id") != clerk_user_id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-
         # Collect fields explicitly supplied in the update payload
         update_data: Dict[str, Any] = position_update.model_dump(exclude_unset=True)
 
-        # Apply the update through the positions repository
-        db.positions.update(position_id, update_data)
+        # Apply the update only if the position's account is owned by the user
+        updated_position: Optional[Dict[str, Any]] = db.positions.update_owned(
+            position_id, clerk_user_id, update_data
+        )
+        if not updated_position:
+            _raise_missing_or_forbidden(db.positions.find_by_id(position_id), "Position not found")
 
-        # Fetch and return the updated position for confirmation
-        updated_position: Dict[str, Any] = db.positions.find_by_id(position_id)
         return updated_position
 
     except HTTPException:
@@ -1198,7 +1661,7 @@ async def update_position(
 
 
 @app.delete("/api/positions/{position_id}")
-async def delete_position(
+def delete_position(
     position_id: str, clerk_user_id: str = Depends(get_current_user_id)
 ) -> Dict[str, str]:
     """
@@ -1223,22 +1686,10 @@ async def delete_position(
         or an internal error occurs.
     """
     try:
-        # Retrieve the existing position record to validate existence
-        position: Optional[Dict[str, Any]] = db.positions.find_by_id(position_id)
-        if not position:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Position not found")
-
-        # Retrieve the related account record for ownership verification
-        account: Optional[Dict[str, Any]] = db.accounts.find_by_id(position["account_id"])
-        if not account:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
+        # Remove the position only if its account is owned by the user
+        if not db.positions.delete_owned(position_id, clerk_user_id):
+            _raise_missing_or_forbidden(db.positions.find_by_id(position_id), "Position not found")
 
-        # Ensure that the account is owned by the authenticated user
-        if account.get("clerk_user_id") != clerk_user_id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-
-        # Remove the position from the database
-        db.positions.delete(position_id)
         return {"message": "Position deleted"}
 
     except HTTPException:
@@ -1256,9 +1707,40 @@ async def delete_position(
 # Instrument Endpoints
 # =========================
 
+# Instruments change rarely and are identical for every user, so the simplified
+# listing is cached per warm container for a short TTL (prices refreshed by the
+# planner show up once the entry expires).
+INSTRUMENTS_CACHE_TTL_SECONDS: float = float(os.getenv("INSTRUMENTS_CACHE_TTL_SECONDS", "60"))
+
+# (expires_at, items) swapped atomically; items are shared and must not be mutated
+_instruments_cache: tuple[float, Optional[List[Dict[str, Any]]]] = (0.0, None)
+
+
+def _list_instruments_cached() -> List[Dict[str, Any]]:
+    """
+    Return the simplified instrument listing, querying the database at most
+    once per `INSTRUMENTS_CACHE_TTL_SECONDS`.
+    """
+    global _instruments_cache
+    expires_at, items = _instruments_cache
+    now = time.monotonic()
+    if items is not None and now < expires_at:
+        return items
+
+    # Only the autocomplete columns are selected, with the price already a float
+    items: List[Dict[str, Any]] = db.instruments.find_all_summary()
+    _instruments_cache = (now + INSTRUMENTS_CACHE_TTL_SECONDS, items)
+    return items
+
+
+def _invalidate_instruments_cache() -> None:
+    """Drop the cached instrument listing after an instrument is created."""
+    global _instruments_cache
+    _instruments_cache = (0.0, None)
+
 
-@app.get("/api/instruments")
-async def list_instruments(
+@app.get("/api/instruments", response_model=None)
+def list_instruments(
     clerk_user_id: str = Depends(get_current_user_id),
 ) -> List[Dict[str, Any]]:
     """
@@ -1281,21 +1763,8 @@ async def list_instruments(
         If an internal error occurs while querying instruments.
     """
     try:
-        # Fetch all instrument records from the instrument repository
-        instruments: List[Dict[str, Any]] = db.instruments.find_all()
-
-        # Transform raw instruments into a simplified structure for the frontend
-        return [
-            {
-                "symbol": inst["symbol"],
-                "name": inst["name"],
-                "instrument_type": inst["instrument_type"],
-                "current_price": float(inst["current_price"])
-                if inst.get("current_price") is not None
-                else None,
-            }
-            for inst in instruments
-        ]
+        # Serve the shared listing from the short-lived per-container cache
+        return _list_instruments_cached()
     except Exception as e:
         # Log any unexpected error encountered while listing instruments
         logger.error("Error fetching instruments: %s", e)
@@ -1309,6 +1778,129 @@ async def list_instruments(
 # =========================
 
 
+def _days_back(days: int) -> Callable[[datetime], datetime]:
+    delta = timedelta(days=days)
+    return lambda now: now - delta
+
+
+# Range -> (Polygon timespan, multiplier, window start given "now", base unit).
+# Polygon applies `limit` to the *base* aggregates (minute bars for intraday,
+# daily bars otherwise); the limit is derived per request from the window.
+_MARKET_RANGES: Dict[str, tuple[str, int, Callable[[datetime], datetime], str]] = {
+    "1D": ("minute", 5, _days_back(1), "minute"),
+    "5D": ("hour", 1, _days_back(5), "minute"),
+    "1M": ("day", 1, _days_back(31), "day"),
+    "6M": ("day", 1, _days_back(183), "day"),
+    "YTD": ("day", 1, lambda now: datetime(now.year, 1, 1, tzinfo=timezone.utc), "day"),
+    "1Y": ("day", 1, _days_back(366), "day"),
+    "5Y": ("week", 1, _days_back(365 * 5 + 2), "day"),
+    "MAX": ("month", 1, _days_back(365 * 20), "day"),
+}
+
+# Seconds covered by one Polygon base aggregate
+_MARKET_BASE_SECONDS: Dict[str, int] = {"minute": 60, "day": 86400}
+# Polygon's maximum accepted `limit`
+POLYGON_MAX_LIMIT: int = 50_000
+
+
+def _market_limit(start: datetime, now: datetime, base: str) -> int:
+    """
+    Size Polygon's `limit` to every base bar the requested window can hold.
+
+    The window is counted in calendar time (from midnight of the start date,
+    which is what the request path sends), so 24h instruments such as BTCUSD
+    fit as well as session-bound equities; with sort=asc a tighter cap would
+    silently drop the newest bars.
+    """
+    window_start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    bars = int((now - window_start).total_seconds() // _MARKET_BASE_SECONDS[base]) + 2
+    return min(bars, POLYGON_MAX_LIMIT)
+
+
+# Fresh-cache lifetime per aggregation timespan: intraday bars move quickly,
+# daily and longer bars only change once per session or less.
+_MARKET_CACHE_TTL_SECONDS: Dict[str, float] = {
+    "minute": 60.0,
+    "hour": 300.0,
+    "day": 3600.0,
+    "week": 86400.0,
+    "month": 86400.0,
+}
+# Expired entries younger than TTL * this factor are served stale while refreshing
+MARKET_CACHE_STALE_FACTOR: float = 4.0
+# Upper bound on cached (symbol, range) series held per warm container
+MARKET_CACHE_MAXSIZE: int = 256
+
+# (symbol, range) -> (fetched_at monotonic seconds, response payload)
+_market_cache: "OrderedDict[tuple[str, str], tuple[float, Dict[str, Any]]]" = OrderedDict()
+# Keys with a background refresh in flight, and strong refs to those tasks
+_market_refreshing: set[tuple[str, str]] = set()
+_market_refresh_tasks: set[asyncio.Task] = set()
+
+
+def _store_market_series(key: tuple[str, str], payload: Dict[str, Any]) -> None:
+    _market_cache[key] = (time.monotonic(), payload)
+    _market_cache.move_to_end(key)
+    while len(_market_cache) > MARKET_CACHE_MAXSIZE:
+        _market_cache.popitem(last=False)
+
+
+async def _refresh_market_series(key: tuple[str, str]) -> None:
+    """Re-fetch a stale series in the background, keeping the stale copy on failure."""
+    try:
+        _store_market_series(key, await _fetch_market_series(*key))
+    except Exception as e:
+        logger.warning("Background refresh of %s/%s failed: %s", key[0], key[1], e)
+    finally:
+        _market_refreshing.discard(key)
+
+
+async def _fetch_market_series(sym: str, r: str) -> Dict[str, Any]:
+    """
+    Fetch and shape one Polygon aggregates series for `sym` over range `r`.
+    """
+    now = datetime.now(timezone.utc)
+
+    try:
+        timespan, multiplier, start_fn, base = _MARKET_RANGES[r]
+    except KeyError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Unsupported range")
+    start = start_fn(now)
+    limit = _market_limit(start, now, base)
+
+    path = f"/v2/aggs/ticker/{sym}/range/{multiplier}/{timespan}/{start.date().isoformat()}/{now.date().isoformat()}"
+    data = await _polygon_get_json(path, {"adjusted": "true", "sort": "asc", "limit": limit})
+
+    results = data.get("results") or []
+
+    # Columnar output: orjson already yields native ints/floats, so the common
+    # case is two flat comprehensions with no per-point dicts.
+    try:
+        ts = [int(item["t"]) for item in results]
+        closes = [float(item["c"]) for item in results]
+    except (KeyError, TypeError, ValueError):
+        # Rare malformed bar: fall back to skipping bad rows individually
+        ts, closes = [], []
+        for item in results:
+            try:
+                t_val = int(item.get("t"))
+                c_val = float(item.get("c"))
+            except (TypeError, ValueError):
+                continue
+            ts.append(t_val)
+            closes.append(c_val)
+
+    return {
+        "symbol": sym,
+        "range": r,
+        "timespan": timespan,
+        "multiplier": multiplier,
+        "t": ts,
+        "c": closes,
+        "count": len(ts),
+    }
+
+
 @app.get("/api/market/timeseries")
 async def get_market_timeseries(
     symbol: str,
@@ -1330,61 +1922,71 @@ async def get_market_timeseries(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Missing symbol")
 
     r = (range or "1M").strip().upper()
-    now = datetime.now(timezone.utc)
+    key = (sym, r)
+
+    # Serve from the per-container cache; slightly stale entries are returned
+    # immediately while a background task refreshes them
+    entry = _market_cache.get(key)
+    if entry is not None:
+        fetched_at, payload = entry
+        age = time.monotonic() - fetched_at
+        ttl = _MARKET_CACHE_TTL_SECONDS[payload["timespan"]]
+        if age < ttl:
+            return payload
+        if age < ttl * MARKET_CACHE_STALE_FACTOR:
+            if key not in _market_refreshing:
+                _market_refreshing.add(key)
+                task = asyncio.create_task(_refresh_market_series(key))
+                _market_refresh_tasks.add(task)
+                task.add_done_callback(_market_refresh_tasks.discard)
+            return payload
+
+    payload = await _fetch_market_series(sym, r)
+    _store_market_series(key, payload)
+    return payload
 
-    # Default aggregation settings by range.
-    if r == "1D":
-        timespan, multiplier = "minute", 5
-        start = now - timedelta(days=1)
-    elif r == "5D":
-        timespan, multiplier = "hour", 1
-        start = now - timedelta(days=5)
-    elif r == "1M":
-        timespan, multiplier = "day", 1
-        start = now - timedelta(days=31)
-    elif r == "6M":
-        timespan, multiplier = "day", 1
-        start = now - timedelta(days=183)
-    elif r == "YTD":
-        timespan, multiplier = "day", 1
-        start = datetime(now.year, 1, 1, tzinfo=timezone.utc)
-    elif r == "1Y":
-        timespan, multiplier = "day", 1
-        start = now - timedelta(days=366)
-    elif r == "5Y":
-        timespan, multiplier = "week", 1
-        start = now - timedelta(days=365 * 5 + 2)
-    elif r == "MAX":
-        timespan, multiplier = "month", 1
-        start = now - timedelta(days=365 * 20)
-    else:
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Unsupported range")
+# =========================
+# Analysis / Job Endpoints
+# =========================
 
-    path = f"/v2/aggs/ticker/{sym}/range/{multiplier}/{timespan}/{start.date().isoformat()}/{now.date().isoformat()}"
-    data = _polygon_get_json(path, {"adjusted": "true", "sort": "asc", "limit": 50000})
+# Jobs stay mutable after they finish (a persisted rebalance preview rewrites
+# summary_payload), so browsers always revalidate against the ETag
+_JOB_CACHE_CONTROL = "private, no-cache"
 
-    results = data.get("results") or []
-    points = []
-    for item in results:
-        try:
-            ts = int(item.get("t"))
-            close = float(item.get("c"))
-        except (TypeError, ValueError):
-            continue
-        points.append({"t": ts, "c": close})
 
-    return {
-        "symbol": sym,
-        "range": r,
-        "timespan": timespan,
-        "multiplier": multiplier,
-        "points": points,
-        "count": len(points),
-    }
+def _job_etag(job: Dict[str, Any]) -> str:
+    """
+    Build a weak ETag identifying one version of a job row.
 
-# =========================
-# Analysis / Job Endpoints
-# =========================
+    Parameters
+    ----------
+    job : dict
+        Job row containing at least `id` and `updated_at`.
+
+    Returns
+    -------
+    str
+        Weak ETag derived from the row id and its trigger-maintained
+        `updated_at` stamp.
+    """
+    return f'W/"{job["id"]}.{job.get("updated_at")}"'
+
+
+def _job_cache_headers(job: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Choose HTTP caching headers for a job status response.
+
+    Parameters
+    ----------
+    job : dict
+        Job row containing `id` and `updated_at`.
+
+    Returns
+    -------
+    dict
+        `ETag` and `Cache-Control` headers for the job's current version.
+    """
+    return {"ETag": _job_etag(job), "Cache-Control": _JOB_CACHE_CONTROL}
 
 
 @app.post("/api/analyze", response_model=AnalyzeResponse)
@@ -1416,24 +2018,27 @@ async def trigger_analysis(
     """
     try:
         # Ensure the requesting user exists in the users table
-        user: Optional[Dict[str, Any]] = db.users.find_by_clerk_id(clerk_user_id)
+        # (blocking Data API calls run in a worker thread to keep the loop free)
+        user: Optional[Dict[str, Any]] = await asyncio.to_thread(
+            db.users.find_by_clerk_id, clerk_user_id
+        )
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
         request_id = _get_request_id(http_request) if http_request else request_id_ctx.get()
 
+        # Shallow view of the validated fields, shared by the job row and the
+        # SQS message; unlike model_dump() it does not deep-copy `options`
+        request_fields: Dict[str, Any] = {**dict(analyze_request), "request_id": request_id}
+
         # Create a job record representing this analysis request
-        job_id: str = db.jobs.create_job(
+        job_id: str = await asyncio.to_thread(
+            db.jobs.create_job,
             clerk_user_id=clerk_user_id,
             job_type="portfolio_analysis",
-            request_payload={
-                **analyze_request.model_dump(),
-                "request_id": request_id,
-            },
+            request_payload=request_fields,
         )
 
-        # Retrieve the created job (not strictly required but useful for debugging)
-        job: Optional[Dict[str, Any]] = db.jobs.find_by_id(job_id)
         _log_event(
             "API_JOB_CREATED",
             request=http_request,
@@ -1445,13 +2050,11 @@ async def trigger_analysis(
             message: Dict[str, Any] = {
                 "job_id": str(job_id),
                 "clerk_user_id": clerk_user_id,
-                "request_id": request_id,
-                "analysis_type": analyze_request.analysis_type,
-                "options": analyze_request.options,
+                **request_fields,
             }
 
-            # Send the job message to the SQS queue
-            sqs_client.send_message(QueueUrl=SQS_QUEUE_URL, MessageBody=json.dumps(message))
+            # Send the job message to the SQS queue (batched with concurrent sends)
+            await enqueue_job(message)
             _log_event(
                 "API_SQS_ENQUEUED",
                 request=http_request,
@@ -1469,6 +2072,9 @@ async def trigger_analysis(
             message="Analysis started. Check job status for results.",
         )
 
+    except HTTPException:
+        # Allow previously raised HTTP exceptions to bubble up
+        raise
     except Exception as e:
         # Log the error that occurred while triggering analysis
         logger.error("Error triggering analysis: %s", e)
@@ -1477,24 +2083,33 @@ async def trigger_analysis(
         ) from e
 
 
-@app.get("/api/jobs/{job_id}")
-async def get_job_status(
-    job_id: str, clerk_user_id: str = Depends(get_current_user_id)
-) -> Dict[str, Any]:
+@app.get("/api/jobs/{job_id}", response_model=None)
+def get_job_status(
+    job_id: str,
+    http_request: Request,
+    clerk_user_id: str = Depends(get_current_user_id),
+) -> Response:
     """
     Retrieve the status and results for a specific analysis job.
 
+    Responses carry an `ETag` for the row version. A matching
+    `If-None-Match` is answered with `304 Not Modified` after a lightweight
+    version lookup, without loading the job's JSONB payloads.
+
     Parameters
     ----------
     job_id : str
         Identifier of the job to fetch.
+    http_request : fastapi.Request
+        Incoming request, inspected for `If-None-Match`.
     clerk_user_id : str
         Authenticated Clerk user identifier injected by dependency.
 
     Returns
     -------
-    dict
-        Job record including current status and, if available, results.
+    fastapi.Response
+        Job record including current status and, if available, results,
+        or an empty `304` response when the client's copy is current.
 
     Raises
     ------
@@ -1503,6 +2118,20 @@ async def get_job_status(
         or an internal error occurs.
     """
     try:
+        # Conditional polls only need the row version, not its payloads
+        if_none_match: Optional[str] = http_request.headers.get("if-none-match")
+        if if_none_match:
+            version: Optional[Dict[str, Any]] = db.jobs.find_version(job_id)
+            if (
+                version
+                and version.get("clerk_user_id") == clerk_user_id
+                and _job_etag(version) in {tag.strip() for tag in if_none_match.split(",")}
+            ):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers=_job_cache_headers(version),
+                )
+
         # Attempt to fetch the job by its identifier
         job: Optional[Dict[str, Any]] = db.jobs.find_by_id(job_id)
         if not job:
@@ -1512,7 +2141,7 @@ async def get_job_status(
         if job.get("clerk_user_id") != clerk_user_id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-        return job
+        return OrjsonResponse(job, headers=_job_cache_headers(job))
 
     except HTTPException:
         # Allow previously raised HTTP exceptions to bubble up
@@ -1525,8 +2154,8 @@ async def get_job_status(
         ) from e
 
 
-@app.get("/api/jobs/{job_id}/data-quality")
-async def get_job_data_quality(
+@app.get("/api/jobs/{job_id}/data-quality", response_model=None)
+def get_job_data_quality(
     job_id: str, clerk_user_id: str = Depends(get_current_user_id)
 ) -> Dict[str, Any]:
     """
@@ -1538,46 +2167,86 @@ async def get_job_data_quality(
     if job.get("clerk_user_id") != clerk_user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-    snapshot = _load_portfolio_snapshot(clerk_user_id)
-    return _compute_data_quality(snapshot)
+    return _load_portfolio_snapshot_with_quality(clerk_user_id)[1]
 
 
-@app.post("/api/jobs/{job_id}/rebalance/preview")
-async def preview_rebalance(
-    job_id: str,
-    payload: RebalancePreviewRequest,
-    clerk_user_id: str = Depends(get_current_user_id),
-) -> Dict[str, Any]:
+def _load_owned_job_with_user(
+    job_id: str, clerk_user_id: str
+) -> tuple[Dict[str, Any], Dict[str, Any]]:
     """
-    Deterministically recompute rebalancing suggestions with editable options.
+    Load a job and its owning user in one round trip, enforcing ownership.
+
+    Raises
+    ------
+    fastapi.HTTPException
+        404 if the job or user is missing, 403 if the job belongs to someone else.
     """
-    job: Optional[Dict[str, Any]] = db.jobs.find_by_id(job_id)
+    job: Optional[Dict[str, Any]] = db.jobs.find_by_id_with_user(job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
     if job.get("clerk_user_id") != clerk_user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-    user: Optional[Dict[str, Any]] = db.users.find_by_clerk_id(clerk_user_id)
+    user: Optional[Dict[str, Any]] = job.pop("owner", None)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return job, user
 
-    snapshot_accounts = _load_portfolio_snapshot(clerk_user_id)
-    jurisdiction = (payload.jurisdiction or "US").strip().upper()
-
-    options: Dict[str, Any] = {
-        "jurisdiction": jurisdiction,
-        "cash_only": bool(payload.cash_only) if not payload.allow_sells else False,
-        "drift_band_pct": float(payload.drift_band_pct),
-        "drift_band_pct_by_class": payload.drift_band_pct_by_class,
-        "max_turnover_pct": float(payload.max_turnover_pct),
-        "transaction_cost_bps": float(payload.transaction_cost_bps),
-        "allow_taxable_sells": bool(payload.allow_taxable_sells),
-        "excluded_accounts": payload.excluded_accounts or [],
-    }
+
+# Upper bound on users whose normalised rebalance targets are kept per warm container
+ASSET_TARGETS_CACHE_MAXSIZE: int = 1024
+
+# Normalised targets per user as {clerk_user_id: (users.updated_at, targets)}
+_asset_targets_cache: Dict[str, tuple[Any, NormalizedTargets]] = {}
+
+
+def _asset_class_targets_for(user: Dict[str, Any]) -> NormalizedTargets:
+    """
+    Return a user's normalised asset-class targets, reusing earlier work.
+
+    Entries are keyed by user and validated against the row's `updated_at`,
+    which the users trigger bumps on every write, so edited targets are
+    picked up on the next request.
+    """
+    clerk_user_id = user.get("clerk_user_id")
+    version = user.get("updated_at")
+    cached = _asset_targets_cache.get(clerk_user_id)
+    if cached is not None and version is not None and cached[0] == version:
+        return cached[1]
+
+    targets = normalize_asset_class_targets(user.get("asset_class_targets"))
+    if clerk_user_id and version is not None:
+        _asset_targets_cache.pop(clerk_user_id, None)
+        _asset_targets_cache[clerk_user_id] = (version, targets)
+        if len(_asset_targets_cache) > ASSET_TARGETS_CACHE_MAXSIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            _asset_targets_cache.pop(next(iter(_asset_targets_cache)), None)
+    return targets
+
+
+@app.post("/api/jobs/{job_id}/rebalance/preview")
+def preview_rebalance(
+    job_id: str,
+    payload: RebalancePreviewRequest,
+    clerk_user_id: str = Depends(get_current_user_id),
+) -> Dict[str, Any]:
+    """
+    Deterministically recompute rebalancing suggestions with editable options.
+    """
+    job, user = _load_owned_job_with_user(job_id, clerk_user_id)
+
+    snapshot_accounts, data_quality = _load_portfolio_snapshot_with_quality(clerk_user_id)
+
+    # Fields that pass through unchanged come out of pydantic-core's compiled
+    # serializer in one call; only the derived options are built in Python
+    options: Dict[str, Any] = payload.model_dump(include=_REBALANCE_PASSTHROUGH_OPTIONS)
+    options["jurisdiction"] = (payload.jurisdiction or "US").strip().upper()
+    options["cash_only"] = payload.cash_only and not payload.allow_sells
+    options["excluded_accounts"] = payload.excluded_accounts or []
 
     rebalance_payload = compute_rebalance_recommendation(
         accounts=snapshot_accounts,
-        asset_class_targets=(user or {}).get("asset_class_targets") or {},
+        asset_class_targets=_asset_class_targets_for(user),
         options=options,
     )
 
@@ -1587,11 +2256,11 @@ async def preview_rebalance(
             existing = {}
         db.jobs.update_summary(job_id, {**existing, "rebalance": rebalance_payload})
 
-    return {"rebalance": rebalance_payload, "data_quality": _compute_data_quality(snapshot_accounts)}
+    return {"rebalance": rebalance_payload, "data_quality": data_quality}
 
 
 @app.post("/api/jobs/{job_id}/retirement/preview")
-async def preview_retirement(
+def preview_retirement(
     job_id: str,
     payload: RetirementPreviewRequest,
     clerk_user_id: str = Depends(get_current_user_id),
@@ -1599,52 +2268,44 @@ async def preview_retirement(
     """
     Deterministically recompute retirement stress-test metrics (no LLM call).
     """
-    job: Optional[Dict[str, Any]] = db.jobs.find_by_id(job_id)
-    if not job:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-    if job.get("clerk_user_id") != clerk_user_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+    job, user = _load_owned_job_with_user(job_id, clerk_user_id)
 
-    user: Optional[Dict[str, Any]] = db.users.find_by_clerk_id(clerk_user_id)
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    data_quality, portfolio_arrays = _load_portfolio_arrays(clerk_user_id)
 
-    snapshot_accounts = _load_portfolio_snapshot(clerk_user_id)
-    portfolio_data = {"accounts": snapshot_accounts}
-
-    current_age = int(payload.current_age or 40)
+    # Request fields are already coerced to their declared types by the model
+    current_age = payload.current_age or 40
     base_years = int(user.get("years_until_retirement") or 30)
     years_until = payload.years_until_retirement
     if years_until is None and payload.retirement_age is not None:
-        years_until = max(0, int(payload.retirement_age) - current_age)
+        years_until = max(0, payload.retirement_age - current_age)
     years_until = int(years_until if years_until is not None else base_years)
 
-    target_income = float(
+    target_income = (
         payload.target_annual_income
         if payload.target_annual_income is not None
-        else (user.get("target_retirement_income") or 80_000)
+        else float(user.get("target_retirement_income") or 80_000)
     )
 
-    annual_contribution = float(payload.annual_contribution or 0.0)
+    annual_contribution = payload.annual_contribution
 
-    portfolio_value = calculate_portfolio_value(portfolio_data)
-    allocation = calculate_asset_allocation(portfolio_data)
+    portfolio_value = calculate_portfolio_value(portfolio_arrays)
+    allocation = calculate_asset_allocation(portfolio_arrays)
 
     shock = None
     if payload.shock_year is not None and payload.shock_pct is not None:
-        shock = {"year": int(payload.shock_year), "pct": float(payload.shock_pct)}
+        shock = {"year": payload.shock_year, "pct": payload.shock_pct}
 
     monte_carlo = run_monte_carlo_simulation(
         current_value=float(portfolio_value),
         years_until_retirement=years_until,
         target_annual_income=target_income,
         asset_allocation=allocation,
-        num_simulations=int(payload.num_simulations),
+        num_simulations=payload.num_simulations,
         annual_contribution=annual_contribution,
         shock=shock,
-        return_shift=float(payload.return_shift),
-        volatility_mult=float(payload.volatility_mult),
-        inflation_rate=float(payload.inflation_rate),
+        return_shift=payload.return_shift,
+        volatility_mult=payload.volatility_mult,
+        inflation_rate=payload.inflation_rate,
     )
 
     projections = generate_projections(
@@ -1653,14 +2314,15 @@ async def preview_retirement(
         asset_allocation=allocation,
         current_age=current_age,
         annual_contribution=annual_contribution,
+        max_years=10,
     )
 
     metrics = {
         "portfolio_value": round(float(portfolio_value), 2),
         "years_until_retirement": years_until,
-        "target_annual_income": round(float(target_income), 2),
+        "target_annual_income": round(target_income, 2),
         "current_age": current_age,
-        "annual_contribution_assumption": round(float(annual_contribution), 2),
+        "annual_contribution_assumption": round(annual_contribution, 2),
         "asset_allocation_pct": {k: round(float(v) * 100.0, 2) for k, v in allocation.items()},
         "monte_carlo": monte_carlo,
         "safe_withdrawal": {
@@ -1669,23 +2331,23 @@ async def preview_retirement(
             "gap": round(float(target_income - (portfolio_value * 0.04)), 2),
         },
         "assumptions": {
-            "inflation_rate": float(payload.inflation_rate),
+            "inflation_rate": payload.inflation_rate,
             "safe_withdrawal_rate": 0.04,
-            "num_simulations": int(payload.num_simulations),
-            "return_shift": float(payload.return_shift),
-            "volatility_mult": float(payload.volatility_mult),
+            "num_simulations": payload.num_simulations,
+            "return_shift": payload.return_shift,
+            "volatility_mult": payload.volatility_mult,
             "shock": shock,
         },
-        "projections": projections[:10],
+        "projections": projections,
     }
 
-    return {"metrics": metrics, "data_quality": _compute_data_quality(snapshot_accounts)}
+    return {"metrics": metrics, "data_quality": data_quality}
 
 
-@app.get("/api/jobs")
-async def list_jobs(
+@app.get("/api/jobs", response_model=None)
+def list_jobs(
     clerk_user_id: str = Depends(get_current_user_id),
-) -> Dict[str, List[Dict[str, Any]]]:
+) -> OrjsonResponse:
     """
     List recent analysis jobs belonging to the current user.
 
@@ -1696,9 +2358,9 @@ async def list_jobs(
 
     Returns
     -------
-    dict
-        Dictionary containing the user's jobs sorted by creation time
-        (most recent first).
+    OrjsonResponse
+        `{"jobs": [...]}` with the user's jobs sorted by creation time
+        (most recent first), rendered directly from the database rows.
 
     Raises
     ------
@@ -1706,13 +2368,13 @@ async def list_jobs(
         If an internal error occurs while listing jobs.
     """
     try:
-        # Fetch up to 100 jobs associated with the user
+        # Fetch up to 100 jobs associated with the user, newest first; the
+        # ORDER BY is served by the (clerk_user_id, created_at DESC) index
         user_jobs: List[Dict[str, Any]] = db.jobs.find_by_user(clerk_user_id, limit=100)
 
-        # Sort jobs by created_at timestamp in descending order
-        user_jobs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
-        return {"jobs": user_jobs}
+        # Encode the rows straight to bytes; returning the dict would first
+        # deep-copy every payload column through jsonable_encoder
+        return OrjsonResponse({"jobs": user_jobs})
 
     except Exception as e:
         # Log unexpected issues when listing jobs
@@ -1727,8 +2389,122 @@ async def list_jobs(
 # =========================
 
 
+# Demo instruments that must exist for the seeded portfolio; validated once at
+# import rather than rebuilt on every call to populate_test_data
+_SEED_INSTRUMENTS: tuple[InstrumentCreate, ...] = (
+    InstrumentCreate(
+        symbol="AAPL",
+        name="Apple Inc.",
+        instrument_type="stock",
+        current_price=Decimal("195.89"),
+        allocation_regions={"north_america": 100},
+        allocation_sectors={"technology": 100},
+        allocation_asset_class={"equity": 100},
+    ),
+    InstrumentCreate(
+        symbol="AMZN",
+        name="Amazon.com Inc.",
+        instrument_type="stock",
+        current_price=Decimal("178.35"),
+        allocation_regions={"north_america": 100},
+        allocation_sectors={"consumer_discretionary": 100},
+        allocation_asset_class={"equity": 100},
+    ),
+    InstrumentCreate(
+        symbol="NVDA",
+        name="NVIDIA Corporation",
+        instrument_type="stock",
+        current_price=Decimal("522.74"),
+        allocation_regions={"north_america": 100},
+        allocation_sectors={"technology": 100},
+        allocation_asset_class={"equity": 100},
+    ),
+    InstrumentCreate(
+        symbol="MSFT",
+        name="Microsoft Corporation",
+        instrument_type="stock",
+        current_price=Decimal("430.82"),
+        allocation_regions={"north_america": 100},
+        allocation_sectors={"technology": 100},
+        allocation_asset_class={"equity": 100},
+    ),
+    InstrumentCreate(
+        symbol="GOOGL",
+        name="Alphabet Inc. Class A",
+        instrument_type="stock",
+        current_price=Decimal("173.69"),
+        allocation_regions={"north_america": 100},
+        allocation_sectors={"technology": 100},
+        allocation_asset_class={"equity": 100},
+    ),
+    # Crypto (modelled as commodities)
+    InstrumentCreate(
+        symbol="BTCUSD",
+        name="Bitcoin (BTC/USD)",
+        instrument_type="commodity",
+        current_price=Decimal("42000.00"),
+        allocation_regions={"global": 100},
+        allocation_sectors={"commodities": 100},
+        allocation_asset_class={"commodities": 100},
+    ),
+    InstrumentCreate(
+        symbol="ETHUSD",
+        name="Ethereum (ETH/USD)",
+        instrument_type="commodity",
+        current_price=Decimal("2200.00"),
+        allocation_regions={"global": 100},
+        allocation_sectors={"commodities": 100},
+        allocation_asset_class={"commodities": 100},
+    ),
+)
+
+# Example accounts (and their positions) seeded for the current user
+_SEED_ACCOUNTS: tuple[MappingProxyType, ...] = (
+    MappingProxyType({
+        "account_name": "401k Long-term",
+        "account_purpose": "Primary retirement savings account with employer match",
+        "cash_balance": Decimal("5000.00"),
+        "positions": (
+            ("SPY", Decimal("150")),
+            ("VTI", Decimal("100")),
+            ("BND", Decimal("200")),
+            ("QQQ", Decimal("75")),
+            ("IWM", Decimal("50")),
+        ),
+    }),
+    MappingProxyType({
+        "account_name": "Roth IRA",
+        "account_purpose": "Tax-free retirement growth account",
+        "cash_balance": Decimal("2500.00"),
+        "positions": (
+            ("VTI", Decimal("80")),
+            ("VXUS", Decimal("60")),
+            ("VNQ", Decimal("40")),
+            ("GLD", Decimal("25")),
+            ("TLT", Decimal("30")),
+            ("VIG", Decimal("45")),
+        ),
+    }),
+    MappingProxyType({
+        "account_name": "Brokerage Account",
+        "account_purpose": "Taxable investment account for individual stocks",
+        "cash_balance": Decimal("10000.00"),
+        "positions": (
+            ("TSLA", Decimal("15")),
+            ("AAPL", Decimal("50")),
+            ("AMZN", Decimal("10")),
+            ("NVDA", Decimal("25")),
+            ("MSFT", Decimal("30")),
+            ("GOOGL", Decimal("20")),
+            ("BTCUSD", Decimal("0.25")),
+            ("ETHUSD", Decimal("2")),
+        ),
+    }),
+)
+
+
 @app.delete("/api/reset-accounts")
-async def reset_accounts(
+def reset_accounts(
     clerk_user_id: str = Depends(get_current_user_id),
 ) -> Dict[str, Any]:
     """
@@ -1758,25 +2534,18 @@ async def reset_accounts(
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-        # Retrieve all accounts belonging to this user
-        accounts: List[Dict[str, Any]] = db.accounts.find_by_user(clerk_user_id)
-
-        # Counter for the number of accounts successfully deleted
-        deleted_count: int = 0
-        for account in accounts:
-            try:
-                # Delete the account; positions should be cascaded by DB constraints
-                db.accounts.delete(account["id"])
-                deleted_count += 1
-            except Exception as e:
-                # Warn when an individual account cannot be removed
-                logger.warning("Could not delete account %s: %s", account["id"], e)
+        # Delete all of the user's accounts in one statement; positions are
+        # removed by the ON DELETE CASCADE constraint
+        deleted_count: int = db.accounts.delete_all_by_user(clerk_user_id)
 
         return {
             "message": f"Deleted {deleted_count} account(s)",
             "accounts_deleted": deleted_count,
         }
 
+    except HTTPException:
+        # Allow previously raised HTTP exceptions to bubble up
+        raise
     except Exception as e:
         # Log any unexpected failure during bulk account reset
         logger.error("Error resetting accounts: %s", e)
@@ -1786,7 +2555,7 @@ async def reset_accounts(
 
 
 @app.post("/api/populate-test-data")
-async def populate_test_data(
+def populate_test_data(
     clerk_user_id: str = Depends(get_current_user_id),
 ) -> Dict[str, Any]:
     """
@@ -1820,171 +2589,66 @@ async def populate_test_data(
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-        # Define a set of key instruments that must exist for the demo to work
-        missing_instruments: Dict[str, Dict[str, Any]] = {
-            "AAPL": {
-                "name": "Apple Inc.",
-                "type": "stock",
-                "current_price": 195.89,
-                "allocation_regions": {"north_america": 100},
-                "allocation_sectors": {"technology": 100},
-                "allocation_asset_class": {"equity": 100},
-            },
-            "AMZN": {
-                "name": "Amazon.com Inc.",
-                "type": "stock",
-                "current_price": 178.35,
-                "allocation_regions": {"north_america": 100},
-                "allocation_sectors": {"consumer_discretionary": 100},
-                "allocation_asset_class": {"equity": 100},
-            },
-            "NVDA": {
-                "name": "NVIDIA Corporation",
-                "type": "stock",
-                "current_price": 522.74,
-                "allocation_regions": {"north_america": 100},
-                "allocation_sectors": {"technology": 100},
-                "allocation_asset_class": {"equity": 100},
-            },
-            "MSFT": {
-                "name": "Microsoft Corporation",
-                "type": "stock",
-                "current_price": 430.82,
-                "allocation_regions": {"north_america": 100},
-                "allocation_sectors": {"technology": 100},
-                "allocation_asset_class": {"equity": 100},
-            },
-            "GOOGL": {
-                "name": "Alphabet Inc. Class A",
-                "type": "stock",
-                "current_price": 173.69,
-                "allocation_regions": {"north_america": 100},
-                "allocation_sectors": {"technology": 100},
-                "allocation_asset_class": {"equity": 100},
-            },
-            # Crypto (modelled as commodities)
-            "BTCUSD": {
-                "name": "Bitcoin (BTC/USD)",
-                "type": "commodity",
-                "current_price": 42000.00,
-                "allocation_regions": {"global": 100},
-                "allocation_sectors": {"commodities": 100},
-                "allocation_asset_class": {"commodities": 100},
-            },
-            "ETHUSD": {
-                "name": "Ethereum (ETH/USD)",
-                "type": "commodity",
-                "current_price": 2200.00,
-                "allocation_regions": {"global": 100},
-                "allocation_sectors": {"commodities": 100},
-                "allocation_asset_class": {"commodities": 100},
-            },
+        # Ensure every instrument exists with one INSERT ... ON CONFLICT DO NOTHING
+        added_symbols: List[str] = []
+        try:
+            added_symbols = db.instruments.create_missing_instruments(_SEED_INSTRUMENTS)
+        except Exception as e:
+            # One bad row fails the whole batch; retry row by row so the
+            # remaining instruments still land
+            logger.warning("Bulk instrument insert failed, retrying individually: %s", e)
+            for instrument in _SEED_INSTRUMENTS:
+                try:
+                    symbol = db.instruments.create_instrument(instrument, if_missing=True)
+                except Exception as row_error:
+                    # Seeding can still proceed against whatever instruments exist
+                    logger.warning("Could not add instrument %s: %s", instrument.symbol, row_error)
+                    continue
+                if symbol:
+                    added_symbols.append(symbol)
+        if added_symbols:
+            _invalidate_instruments_cache()
+            logger.info("Added missing instruments: %s", ", ".join(added_symbols))
+
+        # Create all accounts in one multi-row INSERT ... RETURNING *
+        created_accounts: List[Dict[str, Any]] = db.accounts.create_accounts(
+            clerk_user_id, _SEED_ACCOUNTS
+        )
+        account_ids: Dict[str, str] = {
+            account["account_name"]: account["id"] for account in created_accounts
         }
 
-        # Ensure each instrument exists, creating it if necessary
-        for symbol, info in missing_instruments.items():
-            existing: Optional[Dict[str, Any]] = db.instruments.find_by_symbol(symbol)
-            if not existing:
-                try:
-                    # Import the creation schema lazily to avoid circular dependencies
-                    from src.schemas import InstrumentCreate
-
-                    # Build the instrument model from the info dictionary
-                    instrument_data = InstrumentCreate(
-                        symbol=symbol,
-                        name=info["name"],
-                        instrument_type=info["type"],
-                        current_price=Decimal(str(info["current_price"])),
-                        allocation_regions=info["allocation_regions"],
-                        allocation_sectors=info["allocation_sectors"],
-                        allocation_asset_class=info["allocation_asset_class"],
-                    )
-                    # Store the instrument in the database
-                    db.instruments.create_instrument(instrument_data)
-                    logger.info("Added missing instrument: %s", symbol)
-                except Exception as e:
-                    # Log a warning if a single instrument cannot be created
-                    logger.warning("Could not add instrument %s: %s", symbol, e)
-
-        # Define example accounts and positions to seed the user's portfolio
-        accounts_data: List[Dict[str, Any]] = [
-            {
-                "name": "401k Long-term",
-                "purpose": "Primary retirement savings account with employer match",
-                "cash": 5000.00,
-                "positions": [
-                    ("SPY", 150),
-                    ("VTI", 100),
-                    ("BND", 200),
-                    ("QQQ", 75),
-                    ("IWM", 50),
-                ],
-            },
-            {
-                "name": "Roth IRA",
-                "purpose": "Tax-free retirement growth account",
-                "cash": 2500.00,
-                "positions": [
-                    ("VTI", 80),
-                    ("VXUS", 60),
-                    ("VNQ", 40),
-                    ("GLD", 25),
-                    ("TLT", 30),
-                    ("VIG", 45),
-                ],
-            },
-            {
-                "name": "Brokerage Account",
-                "purpose": "Taxable investment account for individual stocks",
-                "cash": 10000.00,
-                "positions": [
-                    ("TSLA", 15),
-                    ("AAPL", 50),
-                    ("AMZN", 10),
-                    ("NVDA", 25),
-                    ("MSFT", 30),
-                    ("GOOGL", 20),
-                    ("BTCUSD", 0.25),
-                    ("ETHUSD", 2),
-                ],
-            },
+        # Insert every account's positions in a single upsert
+        new_positions: List[tuple[str, str, Decimal]] = [
+            (account_ids[account_data["account_name"]], symbol, quantity)
+            for account_data in _SEED_ACCOUNTS
+            for symbol, quantity in account_data["positions"]
         ]
-
-        # Keep track of the newly created account ids
-        created_accounts: List[str] = []
-        for account_data in accounts_data:
-            # Create each test account with its initial cash balance
-            account_id: str = db.accounts.create_account(
-                clerk_user_id=clerk_user_id,
-                account_name=account_data["name"],
-                account_purpose=account_data["purpose"],
-                cash_balance=Decimal(str(account_data["cash"])),
-            )
-
-            # Insert associated positions for this account
-            for symbol, quantity in account_data["positions"]:
+        try:
+            db.positions.add_positions(new_positions)
+        except Exception as e:
+            # One bad row fails the whole batch; retry row by row so the
+            # rest of the seed data still lands
+            logger.warning("Bulk position insert failed, retrying individually: %s", e)
+            for account_id, symbol, quantity in new_positions:
                 try:
-                    db.positions.add_position(
-                        account_id=account_id,
-                        symbol=symbol,
-                        quantity=Decimal(str(quantity)),
-                    )
-                except Exception as e:
+                    db.positions.add_position(account_id=account_id, symbol=symbol, quantity=quantity)
+                except Exception as row_error:
                     # Log non-fatal errors for individual position insertions
-                    logger.warning("Could not add position %s: %s", symbol, e)
-
-            created_accounts.append(account_id)
-
-        # Build a summary that includes all created accounts and their positions
-        all_accounts: List[Dict[str, Any]] = []
-        for account_id in created_accounts:
-            # Retrieve the account record
-            account: Dict[str, Any] = db.accounts.find_by_id(account_id)
-            # Retrieve positions for this account
-            positions: List[Dict[str, Any]] = db.positions.find_by_account(account_id)
-            # Attach positions to the account object for a richer response
-            account["positions"] = positions
-            all_accounts.append(account)
+                    logger.warning("Could not add position %s: %s", symbol, row_error)
+
+        # Attach positions to the new accounts from one query over the user's
+        # holdings (ordered by account_id, so rows group contiguously)
+        positions_by_account: Dict[str, List[Dict[str, Any]]] = {
+            account_id: list(rows)
+            for account_id, rows in groupby(
+                db.positions.find_by_user(clerk_user_id), key=lambda row: row["account_id"]
+            )
+        }
+        all_accounts: List[Dict[str, Any]] = [
+            {**account, "positions": positions_by_account.get(account["id"], [])}
+            for account in created_accounts
+        ]
 
         return {
             "message": "Test data populated successfully",
@@ -1992,6 +2656,9 @@ async def populate_test_data(
             "accounts": all_accounts,
         }
 
+    except HTTPException:
+        # Allow previously raised HTTP exceptions to bubble up
+        raise
     except Exception as e:
         # Log any unexpected error while seeding test data
         logger.error("Error populating test data: %s", e)
@@ -2000,6 +2667,34 @@ async def populate_test_data(
         ) from e
 
 
+# =========================
+# Cold-Start Initialisation
+# =========================
+
+
+def _prefetch_jwks() -> None:
+    """
+    Warm the Clerk JWKS cache so the first authenticated request skips the fetch.
+    """
+    try:
+        clerk_guard.jwks_client.get_jwk_set()
+    except Exception as e:
+        logger.warning("JWKS prefetch failed: %s", e)
+
+
+# On Lambda, do heavy client construction during the init phase rather than
+# on the first user-facing request.
+if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+    try:
+        _get_db()
+    except Exception as e:
+        # Keep the module importable (and `/health` working) if DB config is missing
+        logger.warning("Database initialisation deferred: %s", e)
+
+    if clerk_config.jwks_url:
+        threading.Thread(target=_prefetch_jwks, name="jwks-prefetch", daemon=True).start()
+
+
 # =========================
 # AWS Lambda Entry Point
 # =========================
@@ -9,24 +9,35 @@ backend API by:
 * Generating a minimal `requirements.txt` file for runtime dependencies.
 * Building a Docker image based on the official Lambda Python 3.12 base image.
 * Installing dependencies into `/var/task` inside the container.
-* Copying the resulting `/var/task` tree out of the container.
-* Zipping the extracted files into `api_lambda.zip` for direct Lambda upload.
+* Streaming the resulting `/var/task` tree out of BuildKit as a tar archive.
+* Converting that stream directly into `api_lambda.zip` for Lambda upload.
 
 The use of Docker ensures binary compatibility with Lambda's Linux/amd64
 runtime, even when this script is executed on a different host OS.
 """
 
+import hashlib
+import mmap
 import os
 import sys
 import shutil
 import subprocess
 from pathlib import Path
+import tarfile
 import tempfile
+import time
 import zipfile
-from typing import List, Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
 
 
-def run_command(cmd: List[str], cwd: Optional[Path] = None) -> str:
+def run_command(
+    cmd: List[str],
+    cwd: Optional[Path] = None,
+    env: Optional[Dict[str, str]] = None,
+    capture: bool = True,
+) -> str:
     """
     Run a shell command and terminate the process on failure.
 
@@ -36,12 +47,17 @@ def run_command(cmd: List[str], cwd: Optional[Path] = None) -> str:
         Command and arguments to execute, e.g. ``["docker", "info"]``.
     cwd : pathlib.Path, optional
         Optional working directory in which to execute the command.
+    env : dict of str to str, optional
+        Extra environment variables layered over the current environment.
+    capture : bool, default True
+        Capture stdout/stderr. When ``False`` both stream straight to the
+        terminal (e.g. build progress) and nothing is buffered in memory.
 
     Returns
     -------
     str
         Standard output captured from the command (decoded with replacement
-        for any invalid characters).
+        for any invalid characters), or ``""`` when ``capture`` is ``False``.
 
     Raises
     ------
@@ -52,25 +68,377 @@ def run_command(cmd: List[str], cwd: Optional[Path] = None) -> str:
     # Log the command being executed for transparency
     print(f"Running: {' '.join(cmd)}")
 
-    # Execute the command and capture stdout/stderr for diagnostics (as bytes)
+    # Execute the command, capturing stdout/stderr as bytes when requested
+    pipe = subprocess.PIPE if capture else None
     result = subprocess.run(
         cmd,
         cwd=str(cwd) if cwd is not None else None,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        env={**os.environ, **env} if env else None,
+        stdout=pipe,
+        stderr=pipe,
     )
 
-    # Decode with replacement to avoid UnicodeDecodeError on Windows cp1252
-    stdout = result.stdout.decode(errors="replace")
-    stderr = result.stderr.decode(errors="replace")
-
-    # If the command failed, print stderr and exit the script
+    # If the command failed, print stderr and exit the script (decoded with
+    # replacement to avoid UnicodeDecodeError on Windows cp1252)
     if result.returncode != 0:
-        print(f"Error: {stderr or 'No stderr output.'}")
+        if capture:
+            stderr = result.stderr.decode(errors="replace")
+            print(f"Error: {stderr or 'No stderr output.'}")
+        else:
+            print(f"Error: command exited with status {result.returncode}.")
         sys.exit(1)
 
     # Return the captured standard output for further processing
-    return stdout
+    return result.stdout.decode(errors="replace") if capture else ""
+
+
+# Lambda runtime image the dependencies are installed into
+LAMBDA_BASE_IMAGE: str = "public.ecr.aws/lambda/python:3.12"
+
+# Core dependencies required at runtime inside the Lambda environment
+REQUIREMENTS: str = """\
+fastapi>=0.116.0
+uvicorn>=0.35.0
+mangum>=0.19.0
+boto3>=1.26.0
+fastapi-clerk-auth>=0.0.7
+orjson>=3.10.0
+httpx[http2]>=0.28.1
+pydantic>=2.0.0
+python-dotenv>=1.0.0
+"""
+
+# Reuse installed dependencies across runs while the requirements are unchanged
+# (set LAMBDA_DEPS_CACHE=false to force a fresh resolve of the version ranges)
+DEPS_CACHE_ENABLED: bool = os.getenv("LAMBDA_DEPS_CACHE", "true").lower() != "false"
+DEPS_CACHE_ROOT: Path = Path(
+    os.getenv("LAMBDA_DEPS_CACHE_DIR", str(Path.home() / ".cache" / "alex-lambda"))
+)
+
+# Formats that are already compressed; deflating them again only burns CPU.
+# Shared libraries (.so) still shrink by roughly half, so they stay deflated.
+STORED_SUFFIXES = frozenset(
+    {".zip", ".whl", ".egg", ".gz", ".bz2", ".xz", ".zst", ".png", ".jpg", ".jpeg", ".gif", ".webp"}
+)
+
+# Earliest timestamp representable in a zip entry (1980-01-01, plus a day of
+# slack for local-time conversion); tar members may carry mtime 0
+ZIP_MIN_MTIME: int = 315_619_200
+
+# Files at least this large are memory-mapped when zipped instead of being
+# read into memory
+ZIP_MMAP_THRESHOLD: int = 64 * 1024
+
+# Worker threads compressing zip members in parallel (zlib releases the GIL)
+ZIP_WORKERS: int = os.cpu_count() or 1
+
+
+def zip_entry_info(name: str, mtime: float, mode: int) -> Optional[zipfile.ZipInfo]:
+    """
+    Build the zip header for one packaged file, or ``None`` to skip it.
+
+    Compiled Python bytecode and ``__pycache__`` directories are skipped,
+    already-compressed formats (see ``STORED_SUFFIXES``) are stored rather
+    than deflated again, the file mode is preserved and the timestamp is
+    clamped to the zip epoch.
+
+    Parameters
+    ----------
+    name : str
+        Archive-relative POSIX path of the file.
+    mtime : float
+        Modification time in seconds since the epoch.
+    mode : int
+        POSIX file mode bits.
+
+    Returns
+    -------
+    zipfile.ZipInfo or None
+        Header to write the file with, or ``None`` if it should be excluded.
+    """
+    if not name or name.endswith(".pyc") or "__pycache__" in name.split("/"):
+        return None
+
+    # Zip timestamps have two-second resolution; round down so the header
+    # reads back exactly as written
+    date_time = time.localtime(max(mtime, ZIP_MIN_MTIME))[:6]
+    date_time = (*date_time[:5], date_time[5] - date_time[5] % 2)
+
+    info = zipfile.ZipInfo(name, date_time=date_time)
+    info.compress_type = (
+        zipfile.ZIP_STORED
+        if os.path.splitext(name)[1].lower() in STORED_SUFFIXES
+        else zipfile.ZIP_DEFLATED
+    )
+    info.external_attr = (mode & 0xFFFF) << 16
+    return info
+
+
+def compress_zip_member(info: zipfile.ZipInfo, path: Path, size: int) -> Tuple[zipfile.ZipInfo, bytes]:
+    """
+    Compress one file ahead of writing it into a zip.
+
+    Fills in the CRC and sizes on ``info`` so the member can be written
+    with a single header, matching what ``ZipFile`` would produce itself.
+
+    Parameters
+    ----------
+    info : zipfile.ZipInfo
+        Header from :func:`zip_entry_info` (its compression type is honoured).
+    path : pathlib.Path
+        File to read.
+    size : int
+        File size in bytes, used to decide whether to memory-map it.
+
+    Returns
+    -------
+    tuple of (zipfile.ZipInfo, bytes)
+        The completed header and the member's (possibly compressed) payload.
+    """
+    with path.open("rb") as source:
+        # Small files are read outright; larger ones are mapped so CRC and
+        # deflate each run over one contiguous buffer without an extra copy
+        if size < ZIP_MMAP_THRESHOLD:
+            return _finish_zip_member(info, source.read())
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _finish_zip_member(info, mapped)
+
+
+def _finish_zip_member(info: zipfile.ZipInfo, data: Any) -> Tuple[zipfile.ZipInfo, bytes]:
+    """Compress ``data`` per ``info.compress_type`` and record CRC and sizes."""
+    if info.compress_type == zipfile.ZIP_DEFLATED:
+        # Same raw-deflate stream ZipFile writes at its default level
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+    else:
+        payload = bytes(data)
+    info.CRC = zlib.crc32(data)
+    info.file_size = len(data)
+    info.compress_size = len(payload)
+    return info, payload
+
+
+def write_precompressed(zipf: zipfile.ZipFile, info: zipfile.ZipInfo, payload: bytes) -> None:
+    """
+    Append an already-compressed member to a zip opened for writing.
+
+    ``ZipFile`` has no public API for pre-compressed data, so this writes
+    the local header and payload itself and registers the entry so that
+    ``ZipFile.close()`` emits it in the central directory.
+
+    Parameters
+    ----------
+    zipf : zipfile.ZipFile
+        Archive opened in ``"w"`` mode on a seekable file.
+    info : zipfile.ZipInfo
+        Completed header from :func:`compress_zip_member`.
+    payload : bytes
+        Member data, compressed according to ``info.compress_type``.
+    """
+    zipf.fp.seek(zipf.start_dir)
+    info.header_offset = zipf.fp.tell()
+    zipf.fp.write(info.FileHeader())
+    zipf.fp.write(payload)
+    zipf.filelist.append(info)
+    zipf.NameToInfo[info.filename] = info
+    zipf.start_dir = zipf.fp.tell()
+    zipf._didModify = True
+
+
+def tar_stream_to_zip(stream: IO[bytes], zip_path: Path) -> int:
+    """
+    Convert a streamed tar archive into a zip in a single pass.
+
+    Regular files are copied straight from the tar stream into the zip, so
+    the archive never has to be extracted to disk first.
+
+    Parameters
+    ----------
+    stream : file-like of bytes
+        Non-seekable tar stream, e.g. the stdout of ``docker build --output type=tar``.
+    zip_path : pathlib.Path
+        Destination zip file (overwritten).
+
+    Returns
+    -------
+    int
+        Number of files written to the zip.
+    """
+    count = 0
+    with tarfile.open(fileobj=stream, mode="r|") as tar, zipfile.ZipFile(
+        zip_path, "w", zipfile.ZIP_DEFLATED
+    ) as zipf:
+        for member in tar:
+            # Skip directories and links along with excluded files
+            if not member.isfile():
+                continue
+            name = member.name.removeprefix("./").lstrip("/")
+            info = zip_entry_info(name, member.mtime, member.mode)
+            if info is None:
+                continue
+
+            # Copy the entry through in chunks without buffering whole files
+            source = tar.extractfile(member)
+            with source, zipf.open(info, "w") as target:
+                shutil.copyfileobj(source, target)
+            count += 1
+    return count
+
+
+def trees_to_zip(trees: List[Tuple[Path, str]], zip_path: Path) -> int:
+    """
+    Zip one or more directory trees (or single files) into one archive.
+
+    Later trees win when two sources provide the same archive path, so the
+    application sources can be overlaid on a cached dependency tree. If
+    ``zip_path`` already holds exactly these files (same names, timestamps
+    and sizes) it is left as-is.
+
+    Parameters
+    ----------
+    trees : list of (pathlib.Path, str)
+        Source path and the archive prefix it is placed under ("" for root).
+    zip_path : pathlib.Path
+        Destination zip file (overwritten).
+
+    Returns
+    -------
+    int
+        Number of files written to the zip.
+    """
+    # Resolve archive names first so overlaid files are written only once
+    entries: Dict[str, Path] = {}
+    for source, prefix in trees:
+        if source.is_file():
+            entries[f"{prefix}{source.name}"] = source
+            continue
+        for root, dirs, files in os.walk(source):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            rel_root = Path(root).relative_to(source).as_posix()
+            base = prefix if rel_root == "." else f"{prefix}{rel_root}/"
+            for file in files:
+                entries[f"{base}{file}"] = Path(root) / file
+
+    # Stat every source once up front to decide whether anything changed
+    planned: List[Tuple[zipfile.ZipInfo, Path, int]] = []
+    for name, path in entries.items():
+        stat = path.stat()
+        info = zip_entry_info(name, stat.st_mtime, stat.st_mode)
+        if info is not None:
+            planned.append((info, path, stat.st_size))
+
+    # Leave an existing zip untouched when its members already match the
+    # sources by name, timestamp and size (staging preserves mtimes)
+    if zip_path.exists():
+        try:
+            with zipfile.ZipFile(zip_path, "r") as existing:
+                current = {i.filename: (i.date_time, i.file_size) for i in existing.infolist()}
+        except zipfile.BadZipFile:
+            current = None
+        if current == {info.filename: (info.date_time, size) for info, _, size in planned}:
+            print(f"No changes since last build; keeping {zip_path}")
+            return len(planned)
+
+    # Compress members in parallel and append them in order as they finish
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf, \
+            ThreadPoolExecutor(max_workers=ZIP_WORKERS) as executor:
+        for info, payload in executor.map(lambda item: compress_zip_member(*item), planned):
+            write_precompressed(zipf, info, payload)
+    return len(planned)
+
+
+def build_to_zip(build_cmd: List[str], package_dir: Path, zip_path: Path) -> None:
+    """
+    Run a BuildKit build and stream its tar output straight into a zip.
+
+    Parameters
+    ----------
+    build_cmd : list of str
+        Build command and arguments, excluding ``--output`` and the context.
+    package_dir : pathlib.Path
+        Docker build context containing the generated Dockerfile.
+    zip_path : pathlib.Path
+        Destination zip file (overwritten).
+
+    Raises
+    ------
+    SystemExit
+        If the build fails or produces an unreadable stream; the build log is
+        printed and the partial zip removed.
+    """
+    build_args: List[str] = [*build_cmd, "--output", "type=tar,dest=-", "."]
+    print(f"Running: {' '.join(build_args)}")
+
+    # Spool BuildKit's progress output to a file so it cannot block stdout
+    with tempfile.TemporaryFile() as build_log:
+        build = subprocess.Popen(
+            build_args,
+            cwd=str(package_dir),
+            env={**os.environ, "DOCKER_BUILDKIT": "1"},
+            stdout=subprocess.PIPE,
+            stderr=build_log,
+        )
+        stream_error: Optional[tarfile.TarError] = None
+        try:
+            tar_stream_to_zip(build.stdout, zip_path)
+        except tarfile.TarError as e:
+            # An empty/truncated stream usually means the build itself failed
+            stream_error = e
+        finally:
+            build.stdout.close()
+        returncode = build.wait()
+
+        # Surface the build output and discard the partial zip on failure
+        if returncode != 0 or stream_error is not None:
+            build_log.seek(0)
+            stderr = build_log.read().decode(errors="replace")
+            print(f"Error: {stderr or stream_error or 'No stderr output.'}")
+            zip_path.unlink(missing_ok=True)
+            sys.exit(1)
+
+
+def buildx_cache_args(cache_dir: Path) -> List[str]:
+    """
+    Return BuildKit cache flags when the active buildx builder can use them.
+
+    Local cache import/export is only supported by container-based builders
+    (e.g. ``docker-container``); the default ``docker`` driver rejects these
+    flags, so in that case (or when buildx is missing) no flags are returned
+    and the classic ``docker build`` path is used.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path
+        Directory used to persist the layer cache between packaging runs.
+
+    Returns
+    -------
+    list of str
+        ``--cache-from``/``--cache-to`` arguments, or an empty list.
+    """
+    # Inspect the active builder without aborting the script on failure
+    result = subprocess.run(
+        ["docker", "buildx", "inspect"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        return []
+
+    # Only container-based drivers can import/export a local cache
+    driver_lines = [
+        line
+        for line in result.stdout.decode(errors="replace").splitlines()
+        if line.strip().lower().startswith("driver:")
+    ]
+    if not driver_lines or driver_lines[0].split(":", 1)[1].strip() == "docker":
+        return []
+
+    args: List[str] = []
+    if (cache_dir / "index.json").exists():
+        args.append(f"--cache-from=type=local,src={cache_dir}")
+    args.append(f"--cache-to=type=local,dest={cache_dir},mode=max")
+    return args
 
 
 def main() -> None:
@@ -79,12 +447,12 @@ def main() -> None:
 
     This function:
 
-    1. Validates that Docker is available and running.
-    2. Copies the API and database source code into a temporary staging area.
-    3. Writes a minimal `requirements.txt` file for the Lambda runtime.
-    4. Builds a Docker image targeting ``linux/amd64`` using the Lambda base.
-    5. Extracts the `/var/task` contents from the image into a local directory.
-    6. Zips the extracted tree into ``api_lambda.zip`` under the API folder.
+    1. Copies the API and database source code into a temporary staging area.
+    2. Writes a minimal `requirements.txt` file for the Lambda runtime.
+    3. Reuses cached dependencies when available; otherwise validates that
+       Docker is running and builds a ``linux/amd64`` image on the Lambda base.
+    4. Streams the `/var/task` contents out of BuildKit as a tar archive.
+    5. Converts that stream into ``api_lambda.zip`` under the API folder.
     """
     # Resolve key directories relative to this script
     api_dir: Path = Path(__file__).parent.absolute()
@@ -95,15 +463,6 @@ def main() -> None:
     print(f"API directory: {api_dir}")
     print(f"Backend directory: {backend_dir}")
 
-    # Verify that Docker is installed and the daemon is running
-    try:
-        run_command(["docker", "info"])
-    except SystemExit:
-        # Provide a clearer message if Docker is not available
-        print("Error: Docker is not running or not installed.")
-        print("Please ensure Docker Desktop is running and try again.")
-        sys.exit(1)
-
     # Create a temporary working directory for building the package
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
@@ -115,92 +474,109 @@ def main() -> None:
         # Log the location where the packaging will occur
         print(f"Packaging in: {package_dir}")
 
-        # Copy the API code into a nested 'api' directory
-        api_package: Path = package_dir / "api"
-        shutil.copytree(
-            api_dir,
-            api_package,
-            ignore=shutil.ignore_patterns(
-                "__pycache__", "*.pyc", ".env*", "*.zip", "package_docker.py", "test_*.py"
-            ),
+        # Shared ignore rules for staged source trees (local virtualenvs
+        # would otherwise be copied into the image and the Lambda zip)
+        source_ignore = shutil.ignore_patterns(
+            "__pycache__", "*.pyc", ".env*", "*.zip", "package_docker.py", "test_*.py", ".venv"
         )
 
         # Copy the Lambda handler entry point to the root for Lambda discovery
         shutil.copy2(api_dir / "lambda_handler.py", package_dir / "lambda_handler.py")
 
-        # Determine the source and destination of the shared database package
-        database_src: Path = backend_dir / "database" / "src"
-        database_dst: Path = package_dir / "src"
-
-        # Copy the database source package if it exists
-        if database_src.exists():
-            shutil.copytree(
-                database_src,
-                database_dst,
-                ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
-            )
-            print(f"Copied database package from {database_src}")
-        else:
-            # Warn if the expected database package is missing
-            print(f"Warning: Database package not found at {database_src}")
-
-        # Copy deterministic helper packages used by the API (rebalancer + retirement simulation).
-        rebalancer_src: Path = backend_dir / "rebalancer"
-        rebalancer_dst: Path = package_dir / "rebalancer"
-        if rebalancer_src.exists():
-            shutil.copytree(
-                rebalancer_src,
-                rebalancer_dst,
-                ignore=shutil.ignore_patterns(
-                    "__pycache__",
-                    "*.pyc",
-                    "*.zip",
-                    "package_docker.py",
-                    "test_*.py",
-                    ".venv",
-                ),
-            )
-            print(f"Copied rebalancer package from {rebalancer_src}")
-        else:
-            print(f"Warning: Rebalancer package not found at {rebalancer_src}")
-
+        # Copy only the retirement simulation module (not the agent) used by the API
         retirement_src: Path = backend_dir / "retirement"
         retirement_dst: Path = package_dir / "retirement"
-        if retirement_src.exists():
+
+        def copy_retirement() -> None:
             retirement_dst.mkdir(parents=True, exist_ok=True)
             for filename in ["__init__.py", "simulation.py"]:
                 src_file = retirement_src / filename
                 if src_file.exists():
                     shutil.copy2(src_file, retirement_dst / filename)
-            print(f"Copied retirement simulation module from {retirement_src}")
-        else:
-            print(f"Warning: Retirement package not found at {retirement_src}")
+
+        # The API code, shared database package and deterministic helper
+        # packages (rebalancer + retirement simulation) are independent trees,
+        # so stage them concurrently to overlap the file I/O
+        staging_jobs: List[Tuple[str, Path, Callable[[], object]]] = [
+            (
+                "API package",
+                api_dir,
+                lambda: shutil.copytree(api_dir, package_dir / "api", ignore=source_ignore),
+            ),
+            (
+                "database package",
+                backend_dir / "database" / "src",
+                lambda: shutil.copytree(
+                    backend_dir / "database" / "src", package_dir / "src", ignore=source_ignore
+                ),
+            ),
+            (
+                "rebalancer package",
+                backend_dir / "rebalancer",
+                lambda: shutil.copytree(
+                    backend_dir / "rebalancer", package_dir / "rebalancer", ignore=source_ignore
+                ),
+            ),
+            ("retirement simulation module", retirement_src, copy_retirement),
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(staging_jobs)) as executor:
+            futures = {
+                label: (src, executor.submit(copy_fn))
+                for label, src, copy_fn in staging_jobs
+                if src.exists()
+            }
+
+        # Report results in a stable order (re-raising any copy failure)
+        for label, src, _ in staging_jobs:
+            if label in futures:
+                futures[label][1].result()
+                print(f"Copied {label} from {src}")
+            else:
+                # Warn if an expected package is missing
+                print(f"Warning: {label[0].upper()}{label[1:]} not found at {src}")
 
         # Build a minimal requirements.txt containing runtime dependencies
         requirements_file: Path = package_dir / "requirements.txt"
-        with requirements_file.open("w", encoding="utf-8") as f:
-            # Core dependencies required at runtime inside the Lambda environment
-            f.write("fastapi>=0.116.0\n")
-            f.write("uvicorn>=0.35.0\n")
-            f.write("mangum>=0.19.0\n")
-            f.write("boto3>=1.26.0\n")
-            f.write("fastapi-clerk-auth>=0.0.7\n")
-            f.write("pydantic>=2.0.0\n")
-            f.write("python-dotenv>=1.0.0\n")
-
-        # Define the Dockerfile content targeting the Lambda Python 3.12 base image
-        dockerfile_content: str = """
-FROM public.ecr.aws/lambda/python:3.12
-
-# Copy requirements and install dependencies
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt -t /var/task
+        requirements_file.write_text(REQUIREMENTS, encoding="utf-8")
+
+        # Copy only the staged application code, one layer per package, so the
+        # Dockerfile and requirements.txt are not shipped inside /var/task
+        app_copies: str = "\n".join(
+            f"COPY {name} /var/task/{name}"
+            for name in ("api", "src", "rebalancer", "retirement", "lambda_handler.py")
+            if (package_dir / name).exists()
+        )
+
+        # Define the Dockerfile content targeting the Lambda Python 3.12 base image.
+        # Dependencies are installed before any application code is copied, so
+        # the pip layer stays cached until requirements.txt itself changes.
+        dockerfile_content: str = f"""
+FROM {LAMBDA_BASE_IMAGE} AS deps
+
+# Install dependencies (preferring wheels, without bytecode) into a separate
+# /deps tree so requirements.txt and pip's working files stay out of the
+# package, then prune bundled test suites (dist-info is kept: packages read
+# their own metadata)
+COPY requirements.txt /tmp/requirements.txt
+RUN pip install --no-cache-dir --no-compile --prefer-binary -r /tmp/requirements.txt -t /deps \\
+    && find /deps -type d -name tests -prune -exec rm -rf {{}} + \\
+    && find /deps -type d -name __pycache__ -prune -exec rm -rf {{}} +
+
+# Assemble only runtime artefacts: installed dependencies plus application code
+FROM scratch AS build
+COPY --from=deps /deps /var/task
 
 # Copy application code
-COPY . /var/task/
+{app_copies}
 
-# Set the handler
-CMD ["api.main.handler"]
+# Export only the assembled /var/task tree to the host
+FROM scratch AS export
+COPY --from=build /var/task /
+
+# Export only the installed dependencies (for the local dependency cache)
+FROM scratch AS deps-export
+COPY --from=deps /deps /
 """
 
         # Write the Dockerfile into the package directory
@@ -208,72 +584,83 @@ CMD ["api.main.handler"]
         with dockerfile.open("w", encoding="utf-8") as f:
             f.write(dockerfile_content)
 
-        # Build the Docker image for the Lambda-compatible linux/amd64 platform
-        print("Building Docker image for x86_64 (linux/amd64) architecture...")
-        run_command(
-            [
-                "docker",
-                "build",
-                "--platform",
-                "linux/amd64",
-                "-t",
-                "alex-api-packager",
-                ".",
-            ],
-            cwd=package_dir,
-        )
-
-        # Name the container used for extracting the /var/task directory
-        container_name: str = "alex-api-extract"
-
-        # Attempt to remove any stale container with the same name
-        run_command(["docker", "rm", "-f", container_name], cwd=package_dir)
-
-        # Create a new container instance from the built image
-        run_command(
-            [
-                "docker",
-                "create",
-                "--name",
-                container_name,
-                "alex-api-packager",
-            ],
-            cwd=package_dir,
-        )
-
-        # Create a directory to receive the extracted Lambda /var/task contents
-        extract_dir: Path = temp_path / "lambda"
-        extract_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy the /var/task contents from the container into the extract directory
-        run_command(
-            ["docker", "cp", f"{container_name}:/var/task/.", str(extract_dir)]
-        )
-
-        # Remove the temporary container now that files have been extracted
-        run_command(["docker", "rm", "-f", container_name])
-
         # Define the final zip file path within the API directory
         zip_path: Path = api_dir / "api_lambda.zip"
-        print(f"Creating zip file: {zip_path}")
 
-        # Walk the extracted tree and bundle files into the Lambda zip package
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(extract_dir):
-                # Filter out __pycache__ directories during traversal
-                dirs[:] = [d for d in dirs if d != "__pycache__"]
+        # Installed dependencies are cached on disk keyed by base image and
+        # requirements, so unchanged dependencies skip the Docker build entirely
+        deps_dir: Optional[Path] = None
+        if DEPS_CACHE_ENABLED:
+            deps_key = hashlib.sha256(
+                f"{LAMBDA_BASE_IMAGE}\n{REQUIREMENTS}".encode("utf-8")
+            ).hexdigest()
+            deps_dir = DEPS_CACHE_ROOT / "api" / deps_key
 
-                for file in files:
-                    # Skip compiled Python bytecode files
-                    if file.endswith(".pyc"):
-                        continue
+        print(f"Creating zip file: {zip_path}")
+        if deps_dir is not None and deps_dir.is_dir():
+            # Overlay the freshly staged application code on the cached deps
+            print(f"Reusing cached dependencies from {deps_dir}")
+            trees_to_zip(
+                [(deps_dir, "")]
+                + [
+                    (package_dir / name, "" if name.endswith(".py") else f"{name}/")
+                    for name in ("api", "src", "rebalancer", "retirement", "lambda_handler.py")
+                    if (package_dir / name).exists()
+                ],
+                zip_path,
+            )
+        else:
+            # Only a build needs the Docker daemon, so check for it here
+            # rather than paying the round-trip on every cache hit
+            try:
+                run_command(["docker", "info"])
+            except SystemExit:
+                # Provide a clearer message if Docker is not available
+                print("Error: Docker is not running or not installed.")
+                print("Please ensure Docker Desktop is running and try again.")
+                sys.exit(1)
+
+            # Reuse base-image and pip layers across runs via a persistent local
+            # BuildKit cache when the active builder supports it
+            cache_dir: Path = Path(tempfile.gettempdir()) / "alex-api-buildcache"
+            cache_args: List[str] = buildx_cache_args(cache_dir)
+            build_cmd: List[str] = (
+                ["docker", "buildx", "build", *cache_args]
+                if cache_args
+                else ["docker", "build"]
+            )
 
-                    # Compute the archive-relative path for each file
-                    file_path = Path(root) / file
-                    arcname = file_path.relative_to(extract_dir)
+            # Build for the Lambda-compatible linux/amd64 platform and let
+            # BuildKit stream the export stage as a tar on stdout, which is
+            # zipped on the fly (no container, docker cp or extracted tree)
+            print("Building Docker image for x86_64 (linux/amd64) architecture...")
+            build_to_zip(
+                [*build_cmd, "--platform", "linux/amd64", "--target", "export"],
+                package_dir,
+                zip_path,
+            )
 
-                    # Add the file to the zip archive
-                    zipf.write(file_path, arcname)
+            # Populate the dependency cache from the (now layer-cached) deps stage
+            if deps_dir is not None:
+                partial_dir = deps_dir.with_name(f"{deps_dir.name}.partial")
+                shutil.rmtree(partial_dir, ignore_errors=True)
+                run_command(
+                    [
+                        *build_cmd,
+                        "--platform",
+                        "linux/amd64",
+                        "--target",
+                        "deps-export",
+                        "--output",
+                        f"type=local,dest={partial_dir}",
+                        ".",
+                    ],
+                    cwd=package_dir,
+                    env={"DOCKER_BUILDKIT": "1"},
+                    capture=False,
+                )
+                partial_dir.rename(deps_dir)
+                print(f"Cached dependencies in {deps_dir}")
 
         # Compute and display the size of the created Lambda package
         size_mb: float = zip_path.stat().st_size / (1024 * 1024)
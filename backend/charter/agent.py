@@ -9,9 +9,11 @@ This module provides the logic to:
 * Instantiate a LiteLLM-based model and construct a charter task prompt that
   will produce JSON-ready data for visualisations.
 
-The `analyze_portfolio` function performs all numerical aggregation, while
-`create_agent` wires the analysis into the LLM layer (using Bedrock-backed
-LiteLLM models and charter templates).
+The `_aggregate_portfolio` helper performs all numerical aggregation in one
+pass, shared by `analyze_portfolio` (text summary) and
+`generate_deterministic_charts` (chart payloads), while `create_agent` wires
+the analysis into the LLM layer (using Bedrock-backed LiteLLM models and
+charter templates).
 
 This module also provides guardrail utilities to:
 * Sanitise potentially unsafe free-text fields before they reach the LLM.
@@ -23,13 +25,34 @@ This module also provides guardrail utilities to:
 from __future__ import annotations
 
 import os
-import json
 import logging
-from typing import Dict, Any, Tuple, Optional
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from heapq import nlargest
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    DefaultDict,
+    Dict,
+    Any,
+    List,
+    Tuple,
+    Optional,
+    TypedDict,
+    Union,
+)
+
+from pydantic import ConfigDict, Discriminator, Tag, TypeAdapter, ValidationError, with_config
 
-from agents.extensions.models.litellm_model import LitellmModel
 from templates import CHARTER_INSTRUCTIONS, create_charter_task  # noqa: F401
 
+if TYPE_CHECKING:
+    # The agents/LiteLLM stack is heavy; it is imported lazily in create_agent
+    from agents.extensions.models.litellm_model import LitellmModel
+
 # =========================
 # Logging Configuration
 # =========================
@@ -37,11 +60,44 @@ from templates import CHARTER_INSTRUCTIONS, create_charter_task  # noqa: F401
 # Get a module-level logger for charter-specific messages
 logger: logging.Logger = logging.getLogger()
 
+# Allocation bucket names (asset classes, regions, sectors) recur across every
+# position; interning them lets the rollup dicts hit on identity comparison
+_intern = sys.intern
+
 
 # =========================
 # Guardrail Helpers
 # =========================
 
+# Phrases that suggest an attempt to smuggle instructions into a data field
+_DANGEROUS_PATTERNS: Tuple[str, ...] = (
+    "ignore previous instructions",
+    "disregard all prior",
+    "forget everything",
+    "new instructions:",
+    "system:",
+    "assistant:",
+)
+
+# One case-insensitive alternation scans each value once for every phrase,
+# without allocating a lowercased copy first
+_DANGEROUS_PATTERN_RE: re.Pattern[str] = re.compile(
+    "|".join(map(re.escape, _DANGEROUS_PATTERNS)), re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _injection_phrase(text: str) -> Optional[str]:
+    """
+    Return the suspicious phrase found in ``text`` (lowercased), if any.
+
+    Account and instrument names repeat across positions, so the scan is
+    memoised; logging stays in `sanitize_user_input` so every hit is reported.
+    """
+    match = _DANGEROUS_PATTERN_RE.search(text)
+    return match.group(0).lower() if match else None
+
+
 def sanitize_user_input(text: str) -> str:
     """
     Basic prompt-injection guardrail for user-facing text fields.
@@ -62,20 +118,10 @@ def sanitize_user_input(text: str) -> str:
         Sanitised text. Either the original text, or the string
         "[INVALID INPUT DETECTED]" when a suspicious pattern is detected.
     """
-    dangerous_patterns = [
-        "ignore previous instructions",
-        "disregard all prior",
-        "forget everything",
-        "new instructions:",
-        "system:",
-        "assistant:",
-    ]
-
-    lowered = text.lower()
-    for pattern in dangerous_patterns:
-        if pattern in lowered:
-            logger.warning("Charter: Potential prompt injection detected: %s", pattern)
-            return "[INVALID INPUT DETECTED]"
+    phrase = _injection_phrase(text)
+    if phrase is not None:
+        logger.warning("Charter: Potential prompt injection detected: %s", phrase)
+        return "[INVALID INPUT DETECTED]"
 
     return text
 
@@ -126,21 +172,33 @@ def _safe_float(value: Any, default: float | None = None) -> float | None:
 
 def _top_n_with_other(buckets: Dict[str, float], n: int) -> list[dict[str, Any]]:
     items = [(k, float(v)) for k, v in buckets.items() if v and float(v) > 0]
-    items.sort(key=lambda kv: kv[1], reverse=True)
 
-    top = items[:n]
-    rest = items[n:]
+    # Bounded heap selection (same order and tie-breaking as a full sort)
+    top = nlargest(n, items, key=lambda kv: kv[1])
     data: list[dict[str, Any]] = [{"name": k, "value": v} for k, v in top]
 
-    if rest:
-        other_value = sum(v for _, v in rest)
+    if len(items) > n:
+        # Sum the remainder directly rather than subtracting from a total,
+        # which could leave a rounding-noise "other" slice
+        top_names = {k for k, _ in top}
+        other_value = sum(v for k, v in items if k not in top_names)
         if other_value > 0:
             data.append({"name": "other", "value": other_value})
     return data
 
 
+# Normalises separators in account labels in a single pass
+_TAX_LABEL_SEPARATORS = str.maketrans("- ", "__")
+
+
+@lru_cache(maxsize=1024)
+def _infer_account_tax_status(fields: Tuple[Any, ...]) -> str:
+    """Infer the tax status from an account's raw free-text fields (memoised)."""
+    return _infer_tax_status(" ".join(str(field or "") for field in fields))
+
+
 def _infer_tax_status(label: str) -> str:
-    text = (label or "").strip().lower().replace("-", "_").replace(" ", "_")
+    text = (label or "").strip().lower().translate(_TAX_LABEL_SEPARATORS)
     if not text:
         return "unknown"
 
@@ -167,89 +225,217 @@ def _infer_tax_status(label: str) -> str:
     return "unknown"
 
 
-def generate_deterministic_charts(portfolio_data: Dict[str, Any]) -> Dict[str, Any]:
+# Allocation rows flattened to (interned bucket name, fraction of value) pairs
+_AllocationWeights = Tuple[Tuple[str, float], ...]
+
+
+def _allocation_weights(allocation: Any) -> _AllocationWeights:
+    """Flatten an instrument allocation mapping (values in pct) into weights."""
+    if not allocation:
+        return ()
+    return tuple(
+        (_intern(str(k)), _safe_float(pct, 0.0) / 100.0)
+        for k, pct in allocation.items()
+    )
+
+
+@dataclass
+class PortfolioAggregates:
     """
-    Deterministically generate the 6 charts used by the Analysis page.
+    Portfolio values rolled up in a single pass over accounts and positions.
 
-    Layout target (matches the UI grid ordering logic):
-      1) Bar (top, full-width)
-      2) Pie + Pie
-      3) Pie + Donut
-      4) Bar (bottom, full-width)
+    Shared by `analyze_portfolio` (text summary for the LLM) and
+    `generate_deterministic_charts` (chart payloads), which only format it.
+
+    Attributes
+    ----------
+    total_value : float
+        Cash plus the market value of every position.
+    total_cash : float
+        Cash summed across all accounts.
+    position_values : dict of str to float
+        Market value per symbol.
+    account_values : dict of str to float
+        Cash plus position value per (sanitised) account name.
+    account_types : dict of str to str
+        Account type per account name (the first one seen wins).
+    tax_status_values : dict of str to float
+        Value per inferred tax status (see `_infer_tax_status`).
+    asset_classes, regions, sectors : dict of str to float
+        Position value weighted by each instrument's allocation percentages.
+        Positions without allocation data for a dimension are accumulated
+        under the caller's ``unallocated_key``, in first-seen order.
+    """
+
+    total_value: float
+    total_cash: float
+    position_values: DefaultDict[str, float]
+    account_values: DefaultDict[str, float]
+    account_types: Dict[str, str]
+    tax_status_values: DefaultDict[str, float]
+    asset_classes: DefaultDict[str, float]
+    regions: DefaultDict[str, float]
+    sectors: DefaultDict[str, float]
+
+
+def _aggregate_portfolio(
+    portfolio_data: Dict[str, Any], unallocated_key: Optional[str] = None
+) -> PortfolioAggregates:
     """
-    # Aggregates
-    position_values: Dict[str, float] = {}
-    account_values: Dict[str, float] = {}
-    tax_status_values: Dict[str, float] = {}
-    asset_classes: Dict[str, float] = {}
-    regions: Dict[str, float] = {}
-    sectors: Dict[str, float] = {}
+    Walk a portfolio once and roll up every value the charter needs.
 
-    total_cash = 0.0
-    total_portfolio_value = 0.0
+    Missing or unparseable prices fall back to 1.0 (with a warning logged);
+    missing quantities, cash balances and allocation percentages count as
+    0.0. Account and instrument names are passed through
+    `sanitize_user_input`, since they may end up in an LLM prompt.
+
+    Parameters
+    ----------
+    portfolio_data : dict of str to Any
+        Portfolio payload containing an ``"accounts"`` list. Each account is
+        expected to contain fields such as ``"name"``, ``"type"``,
+        ``"cash_balance"``, and a list of ``"positions"``. Each position may
+        include ``"symbol"``, ``"quantity"``, and an ``"instrument"`` mapping
+        with allocation metadata.
+    unallocated_key : str or None, optional
+        Bucket that receives the value of positions with no allocation data
+        for a dimension (``None`` by default, for callers that drop it).
+
+    Returns
+    -------
+    PortfolioAggregates
+        Totals and per-bucket values for the whole portfolio.
+    """
+    # Track global totals across cash and positions
+    total_value: float = 0.0
+    total_cash: float = 0.0
+
+    # Per-symbol, per-account and per-tax-status value rollups
+    position_values: DefaultDict[str, float] = defaultdict(float)
+    account_values: DefaultDict[str, float] = defaultdict(float)
+    account_types: Dict[str, str] = {}
+    tax_status_values: DefaultDict[str, float] = defaultdict(float)
+
+    # Allocation dimensions (value with no allocation data goes to unallocated_key)
+    asset_classes: DefaultDict[str, float] = defaultdict(float)
+    regions: DefaultDict[str, float] = defaultdict(float)
+    sectors: DefaultDict[str, float] = defaultdict(float)
+
+    # Parsed (asset class, region, sector) weight rows per symbol
+    weights_by_symbol: Dict[str, Tuple[_AllocationWeights, ...]] = {}
 
     for account in portfolio_data.get("accounts", []):
+        # Sanitise the account name and remember the first type seen for it
         account_name = sanitize_user_input(str(account.get("name", "Unknown")))
-        account_label = " ".join(
-            [
-                str(account.get("name") or ""),
-                str(account.get("type") or ""),
-                str(account.get("purpose") or ""),
-                str(account.get("account_name") or ""),
-                str(account.get("account_purpose") or ""),
-            ]
-        ).strip()
-        tax_status = _infer_tax_status(account_label)
+        account_types.setdefault(account_name, account.get("type", "unknown"))
+
+        # Infer the tax wrapper from every free-text field describing the account
+        tax_status = _infer_account_tax_status(
+            (
+                account.get("name"),
+                account.get("type"),
+                account.get("purpose"),
+                account.get("account_name"),
+                account.get("account_purpose"),
+            )
+        )
 
-        cash = _safe_float(account.get("cash_balance"), 0.0) or 0.0
+        cash = _safe_float(account.get("cash_balance"), 0.0)
         total_cash += cash
-        total_portfolio_value += cash
-        account_values[account_name] = account_values.get(account_name, 0.0) + cash
-        tax_status_values[tax_status] = tax_status_values.get(tax_status, 0.0) + cash
+        total_value += cash
+        account_values[account_name] += cash
+        tax_status_values[tax_status] += cash
 
         for position in account.get("positions", []):
             symbol = str(position.get("symbol", "Unknown") or "Unknown")
-            quantity = _safe_float(position.get("quantity"), 0.0) or 0.0
+            quantity = _safe_float(position.get("quantity"), 0.0)
             instrument: Dict[str, Any] = position.get("instrument", {}) or {}
 
-            price = _safe_float(instrument.get("current_price"), 1.0) or 1.0
+            # Sanitise the instrument name in case it is later used in a prompt
+            if isinstance(instrument.get("name"), str):
+                instrument["name"] = sanitize_user_input(instrument["name"])
+
+            price = _safe_float(instrument.get("current_price"))
+            if price is None:
+                price = 1.0
+                logger.warning("Charter: No price for %s, using default of 1.0", symbol)
+
             value = quantity * price
-            total_portfolio_value += value
-
-            position_values[symbol] = position_values.get(symbol, 0.0) + value
-            account_values[account_name] = account_values.get(account_name, 0.0) + value
-            tax_status_values[tax_status] = tax_status_values.get(tax_status, 0.0) + value
-
-            # Allocation buckets (values in pct)
-            asset_alloc = instrument.get("allocation_asset_class", {}) or {}
-            if asset_alloc:
-                for k, pct in asset_alloc.items():
-                    pct_f = _safe_float(pct, 0.0) or 0.0
-                    asset_classes[str(k)] = asset_classes.get(str(k), 0.0) + value * (
-                        pct_f / 100.0
-                    )
+            total_value += value
+            position_values[symbol] += value
+            account_values[account_name] += value
+            tax_status_values[tax_status] += value
+
+            # Allocation weights are parsed once per symbol: instruments are
+            # per-symbol reference data, so repeat holdings reuse the rows
+            weights = weights_by_symbol.get(symbol)
+            if weights is None:
+                weights = weights_by_symbol[symbol] = (
+                    _allocation_weights(instrument.get("allocation_asset_class")),
+                    _allocation_weights(instrument.get("allocation_regions")),
+                    _allocation_weights(instrument.get("allocation_sectors")),
+                )
+            asset_weights, region_weights, sector_weights = weights
+
+            # Weights are applied per position (not once per summed symbol) so
+            # the float summation order, and thus every rounded total, is stable
+            if asset_weights:
+                for k, weight in asset_weights:
+                    asset_classes[k] += value * weight
             else:
-                asset_classes["unknown"] = asset_classes.get("unknown", 0.0) + value
+                asset_classes[unallocated_key] += value
 
-            region_alloc = instrument.get("allocation_regions", {}) or {}
-            if region_alloc:
-                for k, pct in region_alloc.items():
-                    pct_f = _safe_float(pct, 0.0) or 0.0
-                    regions[str(k)] = regions.get(str(k), 0.0) + value * (pct_f / 100.0)
+            if region_weights:
+                for k, weight in region_weights:
+                    regions[k] += value * weight
             else:
-                regions["unknown"] = regions.get("unknown", 0.0) + value
+                regions[unallocated_key] += value
 
-            sector_alloc = instrument.get("allocation_sectors", {}) or {}
-            if sector_alloc:
-                for k, pct in sector_alloc.items():
-                    pct_f = _safe_float(pct, 0.0) or 0.0
-                    sectors[str(k)] = sectors.get(str(k), 0.0) + value * (pct_f / 100.0)
+            if sector_weights:
+                for k, weight in sector_weights:
+                    sectors[k] += value * weight
             else:
-                sectors["unknown"] = sectors.get("unknown", 0.0) + value
+                sectors[unallocated_key] += value
+
+    return PortfolioAggregates(
+        total_value=total_value,
+        total_cash=total_cash,
+        position_values=position_values,
+        account_values=account_values,
+        account_types=account_types,
+        tax_status_values=tax_status_values,
+        asset_classes=asset_classes,
+        regions=regions,
+        sectors=sectors,
+    )
+
+
+def generate_deterministic_charts(portfolio_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deterministically generate the 6 charts used by the Analysis page.
+
+    Layout target (matches the UI grid ordering logic):
+      1) Bar (top, full-width)
+      2) Pie + Pie
+      3) Pie + Donut
+      4) Bar (bottom, full-width)
+    """
+    # Aggregates (positions without allocation data are charted as an
+    # explicit "unknown" bucket, in the order they are first seen)
+    aggregates = _aggregate_portfolio(portfolio_data, unallocated_key="unknown")
+    position_values = aggregates.position_values
+    account_values = aggregates.account_values
+    tax_status_values = aggregates.tax_status_values
+    asset_classes = aggregates.asset_classes
+    regions = aggregates.regions
+    sectors = aggregates.sectors
+
+    total_cash = aggregates.total_cash
+    total_portfolio_value = aggregates.total_value
 
     # Treat cash as an explicit asset class bucket.
     if total_cash > 0:
-        asset_classes["cash"] = asset_classes.get("cash", 0.0) + total_cash
+        asset_classes["cash"] += total_cash
 
     # If the portfolio is entirely cash, still provide sensible buckets.
     if total_portfolio_value > 0 and not regions:
@@ -258,7 +444,7 @@ def generate_deterministic_charts(portfolio_data: Dict[str, Any]) -> Dict[str, A
         sectors["unknown"] = total_portfolio_value
 
     # Build the 6 chart payloads in the desired order.
-    top_holdings = sorted(position_values.items(), key=lambda kv: kv[1], reverse=True)[:10]
+    top_holdings = nlargest(10, position_values.items(), key=lambda kv: kv[1])
     if not top_holdings and total_cash > 0:
         top_holdings = [("cash", total_cash)]
     top_holdings_data = [{"name": sym, "value": val} for sym, val in top_holdings]
@@ -325,8 +511,8 @@ def analyze_portfolio(portfolio_data: Dict[str, Any]) -> str:
     """
     Analyse portfolio composition and compute allocation metrics.
 
-    This function walks through the portfolio structure (accounts and positions)
-    to compute:
+    This function formats the single-pass rollup from `_aggregate_portfolio`
+    to report:
 
     * Total portfolio value (including cash).
     * Per-account values and their share of the overall portfolio.
@@ -356,87 +542,22 @@ def analyze_portfolio(portfolio_data: Dict[str, Any]) -> str:
         and allocation metrics, suitable for feeding into a charting LLM agent.
     """
     # Prepare an ordered list of text lines that will form the final summary
+    # (appending and joining once is faster than io.StringIO writes or a
+    # pre-sized list for a summary of a few dozen lines)
     result: list[str] = []
 
-    # Track global portfolio total value across cash and positions
-    total_value: float = 0.0
-
-    # Track aggregated value per symbol to identify top holdings
-    position_values: Dict[str, float] = {}
+    # Roll up totals, holdings and allocations in one pass over the portfolio
+    aggregates = _aggregate_portfolio(portfolio_data)
+    total_value: float = aggregates.total_value
 
-    # Track account-level totals and their positions
-    account_totals: Dict[str, Dict[str, Any]] = {}
-
-    # Iterate through all accounts to compute cash and position values
-    for account in portfolio_data.get("accounts", []):
-        # Extract and sanitise account name with a sensible default
-        raw_account_name = account.get("name", "Unknown")
-        account_name: str = sanitize_user_input(str(raw_account_name))
-
-        # Extract account type with a fallback (types are typically controlled)
-        account_type: str = account.get("type", "unknown")
-
-        # Read the raw cash balance which may be missing or empty
-        cash_balance = account.get("cash_balance")
-        # Normalise cash to a numeric value, treating None/empty as 0.0
-        if cash_balance is None or cash_balance == "":
-            cash: float = 0.0
-        else:
-            cash = float(cash_balance)
-
-        # Initialise the account aggregate structure if not already present
-        if account_name not in account_totals:
-            account_totals[account_name] = {
-                "value": 0.0,
-                "type": account_type,
-                "positions": [],
-            }
-
-        # Add cash to both account-level and total portfolio value
-        account_totals[account_name]["value"] += cash
-        total_value += cash
-
-        # Iterate through all positions associated with the account
-        for position in account.get("positions", []):
-            # Extract symbol identifier for the position
-            symbol: str = position.get("symbol", "")
-
-            # Parse the position quantity, defaulting to 0.0 if missing
-            quantity: float = float(position.get("quantity", 0))
-
-            # Extract instrument metadata (may be empty if enrichment failed)
-            instrument: Dict[str, Any] = position.get("instrument", {}) or {}
-
-            # Optionally sanitise instrument name if later used in textual output
-            if "name" in instrument and isinstance(instrument["name"], str):
-                instrument["name"] = sanitize_user_input(instrument["name"])
-
-            # Read the instrument's current price, which may be missing/null
-            current_price = instrument.get("current_price")
-
-            # Normalise price, logging a warning if a default is used
-            if current_price is None or current_price == "":
-                price: float = 1.0
-                logger.warning("Charter: No price for %s, using default of 1.0", symbol)
-            else:
-                price = float(current_price)
-
-            # Compute the position's market value
-            value: float = quantity * price
-
-            # Accumulate the value per symbol to find top holdings later
-            position_values[symbol] = position_values.get(symbol, 0.0) + value
-
-            # Add position value to the owning account's aggregate
-            account_totals[account_name]["value"] += value
-
-            # Store a rich per-position record for later inspection/usage
-            account_totals[account_name]["positions"].append(
-                {"symbol": symbol, "value": value, "instrument": instrument}
-            )
-
-            # Increase total portfolio value by this position value
-            total_value += value
+    # The summary only lists explicit allocations, so drop unallocated value
+    for buckets in (aggregates.asset_classes, aggregates.regions, aggregates.sectors):
+        buckets.pop(None, None)
+    total_cash: float = aggregates.total_cash
+    position_values = aggregates.position_values
+    asset_classes = aggregates.asset_classes
+    regions = aggregates.regions
+    sectors = aggregates.sectors
 
     # Add an overall portfolio heading
     result.append("Portfolio Analysis:")
@@ -445,7 +566,7 @@ def analyze_portfolio(portfolio_data: Dict[str, Any]) -> str:
     result.append(f"Total Value: ${total_value:,.2f}")
 
     # Summarise the number of accounts detected
-    result.append(f"Number of Accounts: {len(account_totals)}")
+    result.append(f"Number of Accounts: {len(aggregates.account_values)}")
 
     # Summarise the number of unique positions (by symbol)
     result.append(f"Number of Positions: {len(position_values)}")
@@ -454,19 +575,19 @@ def analyze_portfolio(portfolio_data: Dict[str, Any]) -> str:
     result.append("\nAccount Breakdown:")
 
     # Iterate over accounts to show each one's value and percentage of total
-    for name, data in account_totals.items():
+    for name, account_value in aggregates.account_values.items():
         # Compute the account share as a percentage of total portfolio value
-        pct: float = (data["value"] / total_value * 100) if total_value > 0 else 0.0
+        pct: float = (account_value / total_value * 100) if total_value > 0 else 0.0
         # Append a formatted account line to the summary
-        result.append(f"  {name} ({data['type']}): ${data['value']:,.2f} ({pct:.1f}%)")
+        account_type = aggregates.account_types[name]
+        result.append(f"  {name} ({account_type}): ${account_value:,.2f} ({pct:.1f}%)")
 
     # Add a heading for the top holdings section
     result.append("\nTop Holdings by Value:")
 
-    # Sort position values descending and select the top 10 symbols
-    sorted_positions = sorted(
-        position_values.items(), key=lambda x: x[1], reverse=True
-    )[:10]
+    # Select the top 10 symbols by value with a bounded heap (same order and
+    # tie-breaking as a full descending sort, without sorting every symbol)
+    sorted_positions = nlargest(10, position_values.items(), key=lambda x: x[1])
 
     # Append each top holding with its value and portfolio share
     for symbol, value in sorted_positions:
@@ -476,58 +597,9 @@ def analyze_portfolio(portfolio_data: Dict[str, Any]) -> str:
     # Add a heading for allocation calculations
     result.append("\nCalculated Allocations:")
 
-    # Initialise aggregation containers for allocation dimensions
-    asset_classes: Dict[str, float] = {}
-    regions: Dict[str, float] = {}
-    sectors: Dict[str, float] = {}
-
-    # Iterate again to aggregate value by asset class, region, and sector
-    for account in portfolio_data.get("accounts", []):
-        for position in account.get("positions", []):
-            # Extract symbol primarily for logging
-            symbol: str = position.get("symbol", "")
-
-            # Parse the position quantity, defaulting to 0.0
-            quantity: float = float(position.get("quantity", 0))
-
-            # Extract instrument metadata including allocation fields
-            instrument: Dict[str, Any] = position.get("instrument", {}) or {}
-
-            # Read the instrument's current price, with optional default
-            current_price = instrument.get("current_price")
-            if current_price is None or current_price == "":
-                price = 1.0
-                logger.warning("Charter: No price for %s, using default of 1.0", symbol)
-            else:
-                price = float(current_price)
-
-            # Compute monetary value for this specific position
-            value: float = quantity * price
-
-            # Aggregate value contribution by asset class
-            for asset_class, pct in instrument.get("allocation_asset_class", {}).items():
-                asset_value: float = value * (pct / 100.0)
-                asset_classes[asset_class] = asset_classes.get(asset_class, 0.0) + asset_value
-
-            # Aggregate value contribution by geographic region
-            for region, pct in instrument.get("allocation_regions", {}).items():
-                region_value: float = value * (pct / 100.0)
-                regions[region] = regions.get(region, 0.0) + region_value
-
-            # Aggregate value contribution by sector
-            for sector, pct in instrument.get("allocation_sectors", {}).items():
-                sector_value: float = value * (pct / 100.0)
-                sectors[sector] = sectors.get(sector, 0.0) + sector_value
-
-    # Compute total cash across accounts for inclusion in asset class allocations
-    total_cash: float = sum(
-        float(acc.get("cash_balance")) if acc.get("cash_balance") is not None else 0.0
-        for acc in portfolio_data.get("accounts", [])
-    )
-
     # If there is any cash, add it as an explicit 'cash' asset class bucket
     if total_cash > 0:
-        asset_classes["cash"] = asset_classes.get("cash", 0.0) + total_cash
+        asset_classes["cash"] += total_cash
 
     # Add a heading for asset class allocation details
     result.append("\nAsset Classes:")
@@ -549,9 +621,7 @@ def analyze_portfolio(portfolio_data: Dict[str, Any]) -> str:
     result.append("\nSectors:")
 
     # Append the top sectors, sorted by value (capped at 10 entries)
-    for sector, value in sorted(
-        sectors.items(), key=lambda x: x[1], reverse=True
-    )[:10]:
+    for sector, value in nlargest(10, sectors.items(), key=lambda x: x[1]):
         result.append(f"  {sector}: ${value:,.2f}")
 
     # Join all collected lines into a single newline-separated summary string
@@ -602,6 +672,10 @@ def create_agent(
         The first element is the instantiated LiteLLM model configured for
         Bedrock, and the second element is the charter task prompt string.
     """
+    # Deferred so importing this module (e.g. for validate_chart_data) does not
+    # pull in the agents/LiteLLM stack
+    from agents.extensions.models.litellm_model import LitellmModel
+
     # Read the Bedrock model identifier, falling back to a default Claude model
     model_id: str = os.getenv(
         "BEDROCK_MODEL_ID",
@@ -651,6 +725,80 @@ def create_agent(
 # Guardrail: Chart JSON Validation
 # =========================
 
+@with_config(ConfigDict(extra="allow"))
+class _PiePoint(TypedDict):
+    name: Any
+    value: Any
+
+
+@with_config(ConfigDict(extra="allow"))
+class _BarPoint(TypedDict):
+    category: Any
+
+
+@with_config(ConfigDict(extra="allow"))
+class _PieChart(TypedDict):
+    type: Any
+    data: List[_PiePoint]
+
+
+@with_config(ConfigDict(extra="allow"))
+class _BarChart(TypedDict):
+    type: Any
+    data: List[_BarPoint]
+
+
+@with_config(ConfigDict(extra="allow"))
+class _OtherChart(TypedDict):
+    type: Any
+    data: List[Any]
+
+
+def _chart_kind(chart: Any) -> str:
+    # Only pie and bar charts constrain their data points; every other chart
+    # type just needs a `type` and a `data` array.
+    kind = chart.get("type") if isinstance(chart, dict) else None
+    return kind if kind in ("pie", "bar") else "other"
+
+
+@with_config(ConfigDict(extra="allow"))
+class _ChartBundle(TypedDict):
+    charts: List[
+        Annotated[
+            Union[
+                Annotated[_PieChart, Tag("pie")],
+                Annotated[_BarChart, Tag("bar")],
+                Annotated[_OtherChart, Tag("other")],
+            ],
+            Discriminator(_chart_kind),
+        ]
+    ]
+
+
+# Compiled once at import: parses and validates chart JSON in a single
+# pydantic-core pass, keeping unknown keys so the parsed payload is returned intact
+_CHART_BUNDLE_ADAPTER: TypeAdapter[_ChartBundle] = TypeAdapter(_ChartBundle)
+
+
+def _describe_chart_error(error: Dict[str, Any]) -> str:
+    """
+    Turn the first pydantic validation error into a short guardrail message.
+    """
+    loc = error.get("loc", ())
+    if error.get("type") == "json_invalid":
+        return f"Invalid JSON: {error.get('ctx', {}).get('error', error.get('msg'))}"
+    if loc == ("charts",) and error.get("type") == "missing":
+        return "Missing required keys. Expected: ['charts']"
+    if loc == ("charts",):
+        return "Charts must be an array"
+    if len(loc) >= 2 and loc[0] == "charts":
+        # Drop the union tag from the location (e.g. charts.0.pie.data.1.name)
+        rest = [str(part) for part in loc[2:] if part not in ("pie", "bar", "other")]
+        where = ".".join(rest) or "chart"
+        return f"Chart {loc[1]} invalid at '{where}': {error.get('msg')}"
+    return f"Validation error: {error.get('msg')}"
+
+
 def validate_chart_data(chart_json: str) -> tuple[bool, str, Dict[Any, Any]]:
     """
     Validate that charter agent output is well-formed JSON with expected structure.
@@ -658,6 +806,11 @@ def validate_chart_data(chart_json: str) -> tuple[bool, str, Dict[Any, Any]]:
     This function is intended to be used as a guardrail after the charter agent
     runs, before chart data is persisted or returned to the frontend.
 
+    Parsing and structural checks run together through a compiled pydantic
+    `TypeAdapter`: the payload must contain a ``charts`` array whose entries
+    each have ``type`` and ``data`` (an array); pie points need ``name`` and
+    ``value`` and bar points need ``category``.
+
     Parameters
     ----------
     chart_json : str
@@ -675,53 +828,15 @@ def validate_chart_data(chart_json: str) -> tuple[bool, str, Dict[Any, Any]]:
         * ``parsed_data`` (dict): Parsed JSON object when valid, otherwise {}.
     """
     try:
-        # Parse JSON
-        data = json.loads(chart_json)
-
-        # Validate expected structure
-        required_keys = ["charts"]
-        if not all(key in data for key in required_keys):
-            return False, f"Missing required keys. Expected: {required_keys}", {}
-
-        # Validate charts array
-        if not isinstance(data["charts"], list):
-            return False, "Charts must be an array", {}
-
-        # Validate each chart
-        for i, chart in enumerate(data["charts"]):
-            if "type" not in chart:
-                return False, f"Chart {i} missing 'type' field", {}
-
-            if "data" not in chart:
-                return False, f"Chart {i} missing 'data' field", {}
-
-            # Validate chart data is array
-            if not isinstance(chart["data"], list):
-                return False, f"Chart {i} data must be an array", {}
-
-            # Validate data points have required fields based on chart type
-            if chart["type"] == "pie":
-                for point in chart["data"]:
-                    if "name" not in point or "value" not in point:
-                        return (
-                            False,
-                            "Pie chart data points must have 'name' and 'value'",
-                            {},
-                        )
-            elif chart["type"] == "bar":
-                for point in chart["data"]:
-                    if "category" not in point:
-                        return (
-                            False,
-                            "Bar chart data points must have 'category'",
-                            {},
-                        )
-
+        # TypedDict validation already yields a fresh plain dict, so it is
+        # returned as-is rather than copied again
+        data = _CHART_BUNDLE_ADAPTER.validate_json(chart_json)
         return True, "", data
 
-    except json.JSONDecodeError as e:
-        logger.error("Invalid JSON from charter agent: %s", e)
-        return False, f"Invalid JSON: {e}", {}
+    except ValidationError as e:
+        message = _describe_chart_error(e.errors(include_url=False)[0])
+        logger.error("Invalid chart data from charter agent: %s", message)
+        return False, message, {}
     except Exception as e:  # noqa: BLE001
         logger.error("Unexpected error validating chart data: %s", e)
         return False, f"Validation error: {e}", {}
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
 import math
 from pathlib import Path
 from typing import Any, Dict, Iterable, Tuple
 
+from pydantic_core import from_json
+
 from agent import analyze_portfolio
 
 
@@ -47,8 +48,8 @@ def _run_case(payload: Dict[str, Any]) -> Tuple[bool, str]:
         if heading in summary:
             score += 1
 
-    expected_total = float(expected.get("total_value", _portfolio_total_value(portfolio)))
     actual_total = _portfolio_total_value(portfolio)
+    expected_total = float(expected.get("total_value", actual_total))
     if not math.isclose(actual_total, expected_total, rel_tol=0.0, abs_tol=1e-6):
         return False, f"{case_id}: fixture expected total_value={expected_total}, got {actual_total}"
 
@@ -70,7 +71,8 @@ def _run_case(payload: Dict[str, Any]) -> Tuple[bool, str]:
 def main() -> int:
     results: list[Tuple[bool, str]] = []
     for path in _iter_fixture_paths():
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        # Parse the raw bytes directly (pydantic-core's parser, as in the handler)
+        payload = from_json(path.read_bytes())
         results.append(_run_case(payload))
 
     failed = [msg for ok, msg in results if not ok]
@@ -33,6 +33,7 @@ from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Union, List
 
 from agents import Agent, Runner, trace
+from pydantic_core import from_json
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from litellm.exceptions import RateLimitError
 
@@ -233,8 +234,9 @@ async def run_charter_agent(
                 )
 
                 try:
-                    # Try parsing the extracted JSON substring into a Python object
-                    parsed_data: Dict[str, Any] = json.loads(json_str)
+                    # Parse the extracted JSON substring with pydantic-core's Rust
+                    # parser (the same one validate_chart_data uses)
+                    parsed_data: Dict[str, Any] = from_json(json_str)
 
                     # The contract expects a top-level 'charts' list in the JSON
                     charts: List[Dict[str, Any]] = parsed_data.get("charts", [])
@@ -327,7 +329,7 @@ async def run_charter_agent(
                     else:
                         logger.warning("Charter: No charts found in parsed JSON")
 
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     # Log details of the JSON parse failure for debugging
                     logger.error("Charter: Failed to parse JSON: %s", e)
                     logger.error(
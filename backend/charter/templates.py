@@ -139,6 +139,19 @@ Remember: Output ONLY the JSON object. No explanations, no text before or after.
 # Task Prompt Construction
 # =========================
 
+# Static parts of the task prompt, built once at import; only the analysis
+# text in between varies per request
+_CHARTER_TASK_PREFIX: str = (
+    "Analyze this investment portfolio and create 4-6 visualization charts.\n\n"
+)
+_CHARTER_TASK_SUFFIX: str = (
+    "\n\n"
+    "Create charts based on this portfolio data. "
+    "Calculate aggregated values from the positions shown above.\n\n"
+    "OUTPUT ONLY THE JSON OBJECT with 4-6 charts - no other text."
+)
+
+
 def create_charter_task(
     portfolio_analysis: str,
     portfolio_data: Dict[str, Any],
@@ -169,18 +182,7 @@ def create_charter_task(
         A complete task prompt instructing the Chart Maker Agent to construct
         4–6 JSON-only chart specifications based on the provided analysis.
     """
-    # Start the task prompt with high-level instructions for the agent
-    header = "Analyze this investment portfolio and create 4-6 visualization charts.\n"
-
-    # Insert the detailed portfolio analysis as contextual grounding
-    body = f"\n{portfolio_analysis}\n\n"
-
-    # Conclude with a strict reminder about JSON-only output
-    footer = (
-        "Create charts based on this portfolio data. "
-        "Calculate aggregated values from the positions shown above.\n\n"
-        "OUTPUT ONLY THE JSON OBJECT with 4-6 charts - no other text."
-    )
-
-    # Concatenate header, analysis body, and footer into the final prompt
-    return header + body + footer
+    # Wrap the detailed portfolio analysis in the precomputed instructions and
+    # the strict reminder about JSON-only output (one f-string builds the
+    # prompt in a single allocation, without an intermediate prefix+analysis copy)
+    return f"{_CHARTER_TASK_PREFIX}{portfolio_analysis}{_CHARTER_TASK_SUFFIX}"
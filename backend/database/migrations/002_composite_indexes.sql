@@ -0,0 +1,54 @@
+-- ============================================================
+-- Alex Financial Planner — Composite Indexes (Migration 002)
+-- ------------------------------------------------------------
+-- Purpose:
+--   Match indexes to the hot per-user lookups so they are served by a
+--   single B-tree range scan that is already in the requested order,
+--   with no separate sort step.
+--
+-- Hot paths:
+--   * Accounts.find_by_user  – WHERE clerk_user_id ORDER BY created_at DESC
+--   * Jobs.find_by_user      – WHERE clerk_user_id [AND status]
+--                              ORDER BY created_at DESC LIMIT n
+--
+-- Already covered by migration 001 (no change needed):
+--   * instruments.symbol              – PRIMARY KEY
+--   * positions (account_id, symbol)  – UNIQUE constraint index, which also
+--                                       serves find_by_account ORDER BY symbol
+--
+-- Notes:
+--   * Single-column indexes whose column is now the leading column of a
+--     composite index are dropped to avoid paying for them on every write.
+--   * All statements are idempotent and runnable through the RDS Data API.
+-- ============================================================
+
+
+-- ============================================================
+-- Accounts
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_accounts_user_created
+    ON accounts (clerk_user_id, created_at DESC);
+
+DROP INDEX IF EXISTS idx_accounts_user;
+
+
+-- ============================================================
+-- Positions
+-- ============================================================
+
+-- Redundant with the UNIQUE (account_id, symbol) index
+DROP INDEX IF EXISTS idx_positions_account;
+
+
+-- ============================================================
+-- Jobs
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_jobs_user_created
+    ON jobs (clerk_user_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_user_status_created
+    ON jobs (clerk_user_id, status, created_at DESC);
+
+DROP INDEX IF EXISTS idx_jobs_user;
@@ -212,11 +212,11 @@ def get_migration_statements() -> List[str]:
         )
         """,
 
-        # Indexes
-        "CREATE INDEX IF NOT EXISTS idx_accounts_user ON accounts(clerk_user_id)",
-        "CREATE INDEX IF NOT EXISTS idx_positions_account ON positions(account_id)",
+        # Indexes (composites for hot per-user lookups; see migration 002)
+        "CREATE INDEX IF NOT EXISTS idx_accounts_user_created ON accounts(clerk_user_id, created_at DESC)",
         "CREATE INDEX IF NOT EXISTS idx_positions_symbol ON positions(symbol)",
-        "CREATE INDEX IF NOT EXISTS idx_jobs_user ON jobs(clerk_user_id)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_user_created ON jobs(clerk_user_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_user_status_created ON jobs(clerk_user_id, status, created_at DESC)",
         "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)",
 
         # Trigger function
@@ -41,6 +41,7 @@ import os
 from typing import List, Dict, Any, Optional
 from datetime import date, datetime
 from decimal import Decimal
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import logging
 
@@ -53,6 +54,20 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# HTTPS connection pool for Data API calls. botocore defaults to 10 pooled
+# connections, fewer than the API's worker threads, so excess concurrent
+# queries would otherwise open (and TLS-handshake) throwaway connections.
+DATA_API_MAX_POOL_CONNECTIONS = int(os.environ.get("DATA_API_MAX_POOL_CONNECTIONS", "40"))
+DATA_API_CONNECT_TIMEOUT = float(os.environ.get("DATA_API_CONNECT_TIMEOUT", "5"))
+
+_BOTO_CONFIG = Config(
+    max_pool_connections=DATA_API_MAX_POOL_CONNECTIONS,
+    connect_timeout=DATA_API_CONNECT_TIMEOUT,
+    # Keepalive probes let idle pooled sockets be detected as dead instead of
+    # failing the next request (the HTTP analogue of a pool pre-ping).
+    tcp_keepalive=True,
+)
+
 
 class DataAPIClient:
     """
@@ -99,7 +114,7 @@ class DataAPIClient:
             )
 
         self.region = region or os.environ.get("DEFAULT_AWS_REGION", "us-east-1")
-        self.client = boto3.client("rds-data", region_name=self.region)
+        self.client = boto3.client("rds-data", region_name=self.region, config=_BOTO_CONFIG)
 
     # ============================================================
     # SQL Execution Methods
@@ -156,20 +171,7 @@ class DataAPIClient:
             Rows mapped as `{column_name: value}`.
         """
         response = self.execute(sql, parameters)
-        if "records" not in response:
-            return []
-
-        columns = [col["name"] for col in response.get("columnMetadata", [])]
-        results = []
-
-        for record in response["records"]:
-            row = {
-                columns[i]: self._extract_value(record[i])
-                for i in range(len(columns))
-            }
-            results.append(row)
-
-        return results
+        return self._rows_from_response(response)
 
     def query_one(self, sql: str, parameters: Optional[List[Dict]] = None) -> Optional[Dict]:
         """
@@ -186,7 +188,13 @@ class DataAPIClient:
     # INSERT / UPDATE / DELETE
     # ============================================================
 
-    def insert(self, table: str, data: Dict, returning: Optional[str] = None) -> Optional[str]:
+    def insert(
+        self,
+        table: str,
+        data: Dict,
+        returning: Optional[str] = None,
+        on_conflict: Optional[str] = None,
+    ) -> Any:
         """
         Insert a row into a table.
 
@@ -197,45 +205,109 @@ class DataAPIClient:
         data : dict
             Column → value mapping.
         returning : str, optional
-            Column to return (e.g. primary key).
+            Column to return (e.g. primary key), or ``"*"`` for the full row.
+        on_conflict : str, optional
+            Conflict target column(s); when given the insert becomes
+            ``ON CONFLICT (...) DO NOTHING``.
 
         Returns
         -------
-        str or None
-            Returned value from RETURNING clause.
+        str, dict or None
+            Returned value from RETURNING clause (the whole row as a dict when
+            ``returning="*"``), or ``None`` if no row was inserted.
         """
         columns = list(data.keys())
-        placeholders = []
-
-        for col in columns:
-            val = data[col]
-            if isinstance(val, (dict, list)):
-                placeholders.append(f":{col}::jsonb")
-            elif isinstance(val, Decimal):
-                placeholders.append(f":{col}::numeric")
-            elif isinstance(val, date) and not isinstance(val, datetime):
-                placeholders.append(f":{col}::date")
-            elif isinstance(val, datetime):
-                placeholders.append(f":{col}::timestamp")
-            else:
-                placeholders.append(f":{col}")
+        placeholders = [self._placeholder(col, data[col]) for col in columns]
 
         sql = f"""
             INSERT INTO {table} ({", ".join(columns)})
             VALUES ({", ".join(placeholders)})
         """
 
+        if on_conflict:
+            sql += f" ON CONFLICT ({on_conflict}) DO NOTHING"
         if returning:
             sql += f" RETURNING {returning}"
 
         parameters = self._build_parameters(data)
         response = self.execute(sql, parameters)
 
+        if returning == "*":
+            rows = self._rows_from_response(response)
+            return rows[0] if rows else None
         if returning and response.get("records"):
             return self._extract_value(response["records"][0][0])
         return None
 
-    def update(self, table: str, data: Dict, where: str, where_params: Optional[Dict] = None) -> int:
+    def insert_many(
+        self,
+        table: str,
+        rows: List[Dict],
+        returning: Optional[str] = None,
+        on_conflict: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Insert several rows with a single multi-row ``INSERT`` statement.
+
+        Parameters
+        ----------
+        table : str
+            Target table name.
+        rows : list of dict
+            Column → value mappings; every row must have the same columns.
+        returning : str, optional
+            Column to return for each inserted row, or ``"*"`` for full rows.
+        on_conflict : str, optional
+            Conflict target column(s); when given the insert becomes
+            ``ON CONFLICT (...) DO NOTHING``.
+
+        Returns
+        -------
+        list
+            One returned value (or row dict for ``"*"``) per inserted row;
+            empty when nothing was inserted or no ``returning`` was given.
+        """
+        if not rows:
+            return []
+
+        columns = list(rows[0].keys())
+        values_sql = []
+        params: Dict[str, Any] = {}
+
+        # The Data API has no array parameters, so suffix each row's placeholders
+        for i, row in enumerate(rows):
+            names = [f"{col}_{i}" for col in columns]
+            values_sql.append(
+                "(" + ", ".join(self._placeholder(name, row[col]) for name, col in zip(names, columns)) + ")"
+            )
+            params.update({name: row[col] for name, col in zip(names, columns)})
+
+        sql = f"""
+            INSERT INTO {table} ({", ".join(columns)})
+            VALUES {", ".join(values_sql)}
+        """
+
+        if on_conflict:
+            sql += f" ON CONFLICT ({on_conflict}) DO NOTHING"
+        if returning:
+            sql += f" RETURNING {returning}"
+
+        response = self.execute(sql, self._build_parameters(params))
+
+        if returning == "*":
+            return self._rows_from_response(response)
+        if returning:
+            return [self._extract_value(record[0]) for record in response.get("records", [])]
+        return []
+
+    def update(
+        self,
+        table: str,
+        data: Dict,
+        where: str,
+        where_params: Optional[Dict] = None,
+        returning: Optional[str] = None,
+    ) -> Any:
         """
         Update rows in a table.
 
@@ -249,11 +321,15 @@ class DataAPIClient:
             SQL WHERE clause (no "WHERE" keyword).
         where_params : dict, optional
             Parameter values for WHERE clause.
+        returning : str, optional
+            Columns for a RETURNING clause (e.g. ``"*"``). When given, the
+            first updated row is returned instead of a row count.
 
         Returns
         -------
-        int
-            Number of updated rows.
+        int or dict or None
+            Number of updated rows, or the first updated row (``None`` if
+            nothing matched) when ``returning`` is set.
         """
         set_parts = []
         for col, val in data.items():
@@ -274,10 +350,16 @@ class DataAPIClient:
             WHERE {where}
         """
 
+        if returning:
+            sql += f" RETURNING {returning}"
+
         all_params = {**data, **(where_params or {})}
         parameters = self._build_parameters(all_params)
 
         response = self.execute(sql, parameters)
+        if returning:
+            rows = self._rows_from_response(response)
+            return rows[0] if rows else None
         return response.get("numberOfRecordsUpdated", 0)
 
     def delete(self, table: str, where: str, where_params: Optional[Dict] = None) -> int:
@@ -328,6 +410,37 @@ class DataAPIClient:
     # Internal Helpers
     # ============================================================
 
+    def _rows_from_response(self, response: Dict) -> List[Dict]:
+        """
+        Map Data API records to `{column_name: value}` rows using result metadata.
+        """
+        if "records" not in response:
+            return []
+
+        columns = [col["name"] for col in response.get("columnMetadata", [])]
+        results = []
+
+        for record in response["records"]:
+            row = {
+                columns[i]: self._extract_value(record[i])
+                for i in range(len(columns))
+            }
+            results.append(row)
+
+        return results
+
+    def _placeholder(self, name: str, value: Any) -> str:
+        """Return the named SQL placeholder for a value, with a type cast if needed."""
+        if isinstance(value, (dict, list)):
+            return f":{name}::jsonb"
+        if isinstance(value, Decimal):
+            return f":{name}::numeric"
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return f":{name}::date"
+        if isinstance(value, datetime):
+            return f":{name}::timestamp"
+        return f":{name}"
+
     def _build_parameters(self, data: Dict) -> List[Dict]:
         """
         Convert a dict of parameters into AWS Data API format.
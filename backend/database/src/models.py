@@ -27,7 +27,7 @@ The design goals of this layer are:
 * Offer specialised helpers (e.g. portfolio value computation, upserts)
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -140,7 +140,7 @@ class BaseModel:
         """
         return self.db.insert(self.table_name, data, returning=returning)
 
-    def update(self, id: Any, data: Dict[str, Any]) -> int:
+    def update(self, id: Any, data: Dict[str, Any], returning: Optional[str] = None) -> Any:
         """
         Update an existing record by primary key.
 
@@ -150,17 +150,24 @@ class BaseModel:
             Primary key value (UUID or string convertible to UUID).
         data : dict
             Column → updated value mapping.
+        returning : str, optional
+            Columns for a RETURNING clause (e.g. ``"*"``) so the updated row is
+            read back in the same round trip.
 
         Returns
         -------
-        int
-            Number of rows updated.
+        int or dict or None
+            Number of rows updated, or the updated row (``None`` if no row
+            matched) when ``returning`` is set.
         """
+        if returning and not data:
+            return self.find_by_id(id)
         return self.db.update(
             self.table_name,
             data,
             "id = :id::uuid",
             {"id": str(id)},
+            returning=returning,
         )
 
     def delete(self, id: Any) -> int:
@@ -184,6 +191,57 @@ class BaseModel:
         )
 
 
+# =========================
+# Owner-Scoped Mutations
+# =========================
+
+class OwnerScopedMixin:
+    """
+    Mixin for user-owned tables whose rows are mutated on behalf of a caller.
+
+    Models using it must define `_OWNED_WHERE`, a row filter binding ``:id``
+    and ``:clerk_user_id`` that only matches rows owned by the caller.
+    """
+
+    #: Row filter restricting mutations to rows owned by the caller.
+    _OWNED_WHERE: str
+
+    def update_owned(
+        self, id: Any, clerk_user_id: str, data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a record only if it belongs to the given user.
+
+        The ownership check (the model's `_OWNED_WHERE` filter) and the
+        write are a single ``UPDATE ... WHERE ... RETURNING *`` statement.
+
+        Parameters
+        ----------
+        id : Any
+            Primary key value (UUID or string convertible to UUID).
+        clerk_user_id : str
+            Clerk identifier of the expected owner.
+        data : dict
+            Column → updated value mapping.
+
+        Returns
+        -------
+        dict or None
+            Updated row, or ``None`` if no row owned by the user matched.
+        """
+        where_params = {"id": str(id), "clerk_user_id": clerk_user_id}
+        if not data:
+            sql = f"SELECT * FROM {self.table_name} WHERE {self._OWNED_WHERE}"
+            params = [
+                {"name": "id", "value": {"stringValue": str(id)}},
+                {"name": "clerk_user_id", "value": {"stringValue": clerk_user_id}},
+            ]
+            return self.db.query_one(sql, params)
+        return self.db.update(
+            self.table_name, data, self._OWNED_WHERE, where_params, returning="*"
+        )
+
+
 # =========================
 # Users Model
 # =========================
@@ -252,6 +310,64 @@ class Users(BaseModel):
         data = {k: v for k, v in data.items() if v is not None}
         return self.db.insert(self.table_name, data, returning="clerk_user_id")
 
+    def upsert_default(
+        self, clerk_user_id: str, defaults: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Insert a user with default settings unless one already exists.
+
+        Uses ``INSERT ... ON CONFLICT DO NOTHING RETURNING *`` so the new row is
+        returned by the insert itself; only a conflicting (concurrent) insert
+        falls back to a SELECT.
+
+        Parameters
+        ----------
+        clerk_user_id : str
+            External identity from Clerk.
+        defaults : dict
+            Column → value mapping for the remaining user columns.
+
+        Returns
+        -------
+        tuple of (dict, bool)
+            The stored user row and whether this call created it.
+        """
+        data: Dict[str, Any] = {"clerk_user_id": clerk_user_id, **defaults}
+        row = self.db.insert(
+            self.table_name, data, returning="*", on_conflict="clerk_user_id"
+        )
+        if row:
+            return row, True
+        return self.find_by_clerk_id(clerk_user_id), False
+
+    def update_by_clerk_id(
+        self, clerk_user_id: str, data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Apply a partial update to a user and return the updated row.
+
+        Parameters
+        ----------
+        clerk_user_id : str
+            External identity from Clerk.
+        data : dict
+            Column → updated value mapping.
+
+        Returns
+        -------
+        dict or None
+            Updated user row (via ``RETURNING *``), or ``None`` if no user matched.
+        """
+        if not data:
+            return self.find_by_clerk_id(clerk_user_id)
+        return self.db.update(
+            self.table_name,
+            data,
+            "clerk_user_id = :clerk_user_id",
+            {"clerk_user_id": clerk_user_id},
+            returning="*",
+        )
+
 
 # =========================
 # Instruments Model
@@ -278,6 +394,21 @@ class Instruments(BaseModel):
         sql = f"SELECT * FROM {self.table_name} ORDER BY symbol"
         return self.db.query(sql, [])
 
+    def find_all_summary(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve the lightweight columns used for instrument autocomplete.
+
+        Only ``symbol``, ``name``, ``instrument_type`` and ``current_price`` are
+        selected (the allocation JSONB columns are skipped), and the price is
+        cast to ``float8`` so it arrives as a native float (or ``None``).
+        """
+        sql = f"""
+            SELECT symbol, name, instrument_type, current_price::float8 AS current_price
+            FROM {self.table_name}
+            ORDER BY symbol
+        """
+        return self.db.query(sql, [])
+
     def find_by_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a single instrument by symbol.
@@ -296,25 +427,18 @@ class Instruments(BaseModel):
         params = [{"name": "symbol", "value": {"stringValue": symbol}}]
         return self.db.query_one(sql, params)
 
-    def create_instrument(self, instrument: InstrumentCreate) -> str:
+    @staticmethod
+    def _instrument_row(instrument: InstrumentCreate) -> Dict[str, Any]:
         """
-        Create a new instrument record with validated allocations.
+        Build the column mapping inserted for an instrument.
 
-        Parameters
-        ----------
-        instrument : InstrumentCreate
-            Pydantic model containing instrument details and allocation maps.
-
-        Returns
-        -------
-        str
-            Symbol of the created instrument.
+        Shared by the single-row and batch create paths so they stay in sync.
         """
         # Validate and normalise via Pydantic
         validated = instrument.model_dump()
 
         # Persist allocation fields as JSON-compatible structures
-        data: Dict[str, Any] = {
+        return {
             "symbol": validated["symbol"],
             "name": validated["name"],
             "instrument_type": validated["instrument_type"],
@@ -323,7 +447,54 @@ class Instruments(BaseModel):
             "allocation_asset_class": validated["allocation_asset_class"],
         }
 
-        return self.db.insert(self.table_name, data, returning="symbol")
+    def create_instrument(
+        self, instrument: InstrumentCreate, if_missing: bool = False
+    ) -> Optional[str]:
+        """
+        Create a new instrument record with validated allocations.
+
+        Parameters
+        ----------
+        instrument : InstrumentCreate
+            Pydantic model containing instrument details and allocation maps.
+        if_missing : bool, default False
+            Use ``ON CONFLICT (symbol) DO NOTHING`` so an existing instrument is
+            left untouched instead of raising a unique-violation error.
+
+        Returns
+        -------
+        str or None
+            Symbol of the created instrument, or ``None`` if ``if_missing`` was
+            set and the symbol already existed.
+        """
+        return self.db.insert(
+            self.table_name,
+            self._instrument_row(instrument),
+            returning="symbol",
+            on_conflict="symbol" if if_missing else None,
+        )
+
+    def create_missing_instruments(self, instruments: Iterable[InstrumentCreate]) -> List[str]:
+        """
+        Create any instruments that do not exist yet in a single statement.
+
+        Uses one multi-row ``INSERT ... ON CONFLICT (symbol) DO NOTHING``, so
+        existing instruments are left untouched.
+
+        Parameters
+        ----------
+        instruments : iterable of InstrumentCreate
+            Instruments to ensure exist.
+
+        Returns
+        -------
+        list of str
+            Symbols that were newly created.
+        """
+        rows = [self._instrument_row(instrument) for instrument in instruments]
+        return self.db.insert_many(
+            self.table_name, rows, returning="symbol", on_conflict="symbol"
+        )
 
     def find_by_type(self, instrument_type: str) -> List[Dict[str, Any]]:
         """
@@ -377,7 +548,7 @@ class Instruments(BaseModel):
 # Accounts Model
 # =========================
 
-class Accounts(BaseModel):
+class Accounts(OwnerScopedMixin, BaseModel):
     """
     Table abstraction for `accounts`.
 
@@ -386,6 +557,9 @@ class Accounts(BaseModel):
 
     table_name = "accounts"
 
+    # Row filter restricting mutations to accounts owned by the caller
+    _OWNED_WHERE = "id = :id::uuid AND clerk_user_id = :clerk_user_id"
+
     def find_by_user(self, clerk_user_id: str) -> List[Dict[str, Any]]:
         """
         Retrieve all accounts belonging to a given user.
@@ -415,7 +589,8 @@ class Accounts(BaseModel):
         account_purpose: Optional[str] = None,
         cash_balance: Decimal = Decimal("0"),
         cash_interest: Decimal = Decimal("0"),
-    ) -> str:
+        returning: str = "id",
+    ) -> Any:
         """
         Create a new investment account for a user.
 
@@ -431,11 +606,13 @@ class Accounts(BaseModel):
             Starting cash balance in the account.
         cash_interest : Decimal, default 0
             Interest rate or accrued interest value.
+        returning : str, default "id"
+            Column to return; ``"*"`` returns the full created row.
 
         Returns
         -------
-        str
-            UUID of the newly created account.
+        str or dict
+            UUID of the newly created account, or the row when ``returning="*"``.
         """
         data: Dict[str, Any] = {
             "clerk_user_id": clerk_user_id,
@@ -444,14 +621,77 @@ class Accounts(BaseModel):
             "cash_balance": cash_balance,
             "cash_interest": cash_interest,
         }
-        return self.db.insert(self.table_name, data, returning="id")
+        return self.db.insert(self.table_name, data, returning=returning)
+
+    def create_accounts(
+        self, clerk_user_id: str, accounts: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several accounts for a user with one multi-row ``INSERT``.
+
+        Parameters
+        ----------
+        clerk_user_id : str
+            User identifier from Clerk.
+        accounts : iterable of dict
+            Each with ``account_name`` and optional ``account_purpose``,
+            ``cash_balance`` and ``cash_interest``.
+
+        Returns
+        -------
+        list of dict
+            The created account rows.
+        """
+        rows: List[Dict[str, Any]] = [
+            {
+                "clerk_user_id": clerk_user_id,
+                "account_name": account["account_name"],
+                "account_purpose": account.get("account_purpose"),
+                "cash_balance": account.get("cash_balance", Decimal("0")),
+                "cash_interest": account.get("cash_interest", Decimal("0")),
+            }
+            for account in accounts
+        ]
+        return self.db.insert_many(self.table_name, rows, returning="*")
+
+    def delete_owned(self, account_id: str, clerk_user_id: str) -> int:
+        """
+        Delete an account (and, via ON DELETE CASCADE, its positions) only if it
+        belongs to the given user.
+
+        Returns
+        -------
+        int
+            Number of accounts deleted (0 if none owned by the user matched).
+        """
+        return self.db.delete(
+            self.table_name,
+            self._OWNED_WHERE,
+            {"id": str(account_id), "clerk_user_id": clerk_user_id},
+        )
+
+    def delete_all_by_user(self, clerk_user_id: str) -> int:
+        """
+        Delete every account (and, via ON DELETE CASCADE, every position)
+        belonging to a user in a single statement.
+
+        Returns
+        -------
+        int
+            Number of accounts deleted.
+        """
+        return self.db.delete(
+            self.table_name,
+            "clerk_user_id = :clerk_user_id",
+            {"clerk_user_id": clerk_user_id},
+        )
 
 
 # =========================
 # Positions Model
 # =========================
 
-class Positions(BaseModel):
+class Positions(OwnerScopedMixin, BaseModel):
     """
     Table abstraction for `positions`.
 
@@ -461,6 +701,12 @@ class Positions(BaseModel):
 
     table_name = "positions"
 
+    # Row filter restricting mutations to positions in accounts owned by the caller
+    _OWNED_WHERE = (
+        "id = :id::uuid AND account_id IN "
+        "(SELECT id FROM accounts WHERE clerk_user_id = :clerk_user_id)"
+    )
+
     def find_by_account(self, account_id: str) -> List[Dict[str, Any]]:
         """
         Retrieve all positions within a specific account.
@@ -493,6 +739,95 @@ class Positions(BaseModel):
         params = [{"name": "account_id", "value": {"stringValue": account_id}}]
         return self.db.query(sql, params)
 
+    def find_by_account_with_instrument(self, account_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve positions in an account, each with its instrument nested.
+
+        Rows carry the same flattened instrument columns as
+        :meth:`find_by_account`, plus an `instrument` dict rebuilt from those
+        columns, so one round-trip serves the API without a second lookup.
+
+        Parameters
+        ----------
+        account_id : str
+            UUID of the parent account.
+
+        Returns
+        -------
+        list of dict
+            Positions joined with instrument metadata, each with an
+            `instrument` dict shaped like an `instruments` row.
+        """
+        sql = """
+            SELECT
+                p.*,
+                i.name AS instrument_name,
+                i.instrument_type,
+                i.current_price,
+                i.allocation_regions,
+                i.allocation_sectors,
+                i.allocation_asset_class,
+                i.updated_at AS instrument_updated_at,
+                i.created_at AS instrument_created_at
+            FROM positions p
+            JOIN instruments i ON p.symbol = i.symbol
+            WHERE p.account_id = :account_id::uuid
+            ORDER BY p.symbol
+        """
+        params = [{"name": "account_id", "value": {"stringValue": account_id}}]
+        rows = self.db.query(sql, params)
+        for row in rows:
+            row["instrument"] = {
+                "symbol": row["symbol"],
+                "name": row["instrument_name"],
+                "instrument_type": row["instrument_type"],
+                "current_price": row["current_price"],
+                "allocation_regions": row["allocation_regions"],
+                "allocation_sectors": row["allocation_sectors"],
+                "allocation_asset_class": row["allocation_asset_class"],
+                "created_at": row.pop("instrument_created_at"),
+                "updated_at": row["instrument_updated_at"],
+            }
+        return rows
+
+    def find_by_user(self, clerk_user_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve all positions across every account owned by a user.
+
+        This is the batched counterpart of :meth:`find_by_account`, returning
+        the same instrument-enriched rows for all of the user's accounts in a
+        single round-trip.
+
+        Parameters
+        ----------
+        clerk_user_id : str
+            User identifier from Clerk.
+
+        Returns
+        -------
+        list of dict
+            Positions joined with instrument metadata, ordered by
+            ``account_id`` then ``symbol``.
+        """
+        sql = """
+            SELECT
+                p.*,
+                i.name AS instrument_name,
+                i.instrument_type,
+                i.current_price,
+                i.allocation_regions,
+                i.allocation_sectors,
+                i.allocation_asset_class,
+                i.updated_at AS instrument_updated_at
+            FROM positions p
+            JOIN accounts a ON a.id = p.account_id
+            JOIN instruments i ON p.symbol = i.symbol
+            WHERE a.clerk_user_id = :user_id
+            ORDER BY p.account_id, p.symbol
+        """
+        params = [{"name": "user_id", "value": {"stringValue": clerk_user_id}}]
+        return self.db.query(sql, params)
+
     def get_portfolio_value(self, account_id: str) -> Dict[str, float]:
         """
         Compute aggregate portfolio statistics for an account.
@@ -534,7 +869,9 @@ class Positions(BaseModel):
 
         return {"num_positions": 0, "total_value": 0.0, "total_shares": 0.0}
 
-    def add_position(self, account_id: str, symbol: str, quantity: Decimal) -> Optional[str]:
+    def add_position(
+        self, account_id: str, symbol: str, quantity: Decimal, returning: str = "id"
+    ) -> Any:
         """
         Insert or update a position using an UPSERT on (account_id, symbol).
 
@@ -546,13 +883,16 @@ class Positions(BaseModel):
             Instrument symbol.
         quantity : Decimal
             Quantity of the holding.
+        returning : str, default "id"
+            Column to return; ``"*"`` returns the full affected row.
 
         Returns
         -------
-        str or None
-            ID of the affected position row, or ``None`` if unavailable.
+        str, dict or None
+            ID of the affected position row (or the row itself when
+            ``returning="*"``), or ``None`` if unavailable.
         """
-        sql = """
+        sql = f"""
             INSERT INTO positions (account_id, symbol, quantity, as_of_date)
             VALUES (:account_id::uuid, :symbol, :quantity::numeric, :as_of_date::date)
             ON CONFLICT (account_id, symbol)
@@ -560,7 +900,7 @@ class Positions(BaseModel):
                 quantity = EXCLUDED.quantity,
                 as_of_date = EXCLUDED.as_of_date,
                 updated_at = NOW()
-            RETURNING id
+            RETURNING {returning}
         """
         params = [
             {"name": "account_id", "value": {"stringValue": account_id}},
@@ -568,6 +908,9 @@ class Positions(BaseModel):
             {"name": "quantity", "value": {"stringValue": str(quantity)}},
             {"name": "as_of_date", "value": {"stringValue": date.today().isoformat()}},
         ]
+        if returning == "*":
+            return self.db.query_one(sql, params)
+
         response = self.db.execute(sql, params)
 
         if response.get("records"):
@@ -575,6 +918,64 @@ class Positions(BaseModel):
 
         return None
 
+    def add_positions(self, positions: Iterable[Tuple[str, str, Decimal]]) -> int:
+        """
+        Upsert many positions with a single multi-row ``INSERT``.
+
+        Parameters
+        ----------
+        positions : iterable of (account_id, symbol, quantity)
+            Holdings to write; each (account_id, symbol) pair may appear at
+            most once, as Postgres cannot upsert the same row twice in one
+            statement.
+
+        Returns
+        -------
+        int
+            Number of position rows inserted or updated.
+        """
+        values_sql: List[str] = []
+        params: List[Dict[str, Any]] = [
+            {"name": "as_of_date", "value": {"stringValue": date.today().isoformat()}}
+        ]
+        # The Data API has no array parameters, so bind one placeholder set per row
+        for i, (account_id, symbol, quantity) in enumerate(positions):
+            values_sql.append(f"(:a{i}::uuid, :s{i}, :q{i}::numeric, :as_of_date::date)")
+            params.extend([
+                {"name": f"a{i}", "value": {"stringValue": account_id}},
+                {"name": f"s{i}", "value": {"stringValue": symbol}},
+                {"name": f"q{i}", "value": {"stringValue": str(quantity)}},
+            ])
+        if not values_sql:
+            return 0
+
+        sql = f"""
+            INSERT INTO positions (account_id, symbol, quantity, as_of_date)
+            VALUES {", ".join(values_sql)}
+            ON CONFLICT (account_id, symbol)
+            DO UPDATE SET
+                quantity = EXCLUDED.quantity,
+                as_of_date = EXCLUDED.as_of_date,
+                updated_at = NOW()
+        """
+        response = self.db.execute(sql, params)
+        return response.get("numberOfRecordsUpdated", 0)
+
+    def delete_owned(self, position_id: str, clerk_user_id: str) -> int:
+        """
+        Delete a position only if its account belongs to the given user.
+
+        Returns
+        -------
+        int
+            Number of positions deleted (0 if none owned by the user matched).
+        """
+        return self.db.delete(
+            self.table_name,
+            self._OWNED_WHERE,
+            {"id": str(position_id), "clerk_user_id": clerk_user_id},
+        )
+
 
 # =========================
 # Jobs Model
@@ -622,6 +1023,57 @@ class Jobs(BaseModel):
         }
         return self.db.insert(self.table_name, data, returning="id")
 
+    def find_by_id_with_user(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a job together with its owning user in one query.
+
+        Parameters
+        ----------
+        job_id : str
+            UUID of the job.
+
+        Returns
+        -------
+        dict or None
+            Job row with the owning user row nested under ``owner`` (None if
+            the user record is missing), or ``None`` if the job does not exist.
+        """
+        sql = f"""
+            SELECT j.*, row_to_json(u) AS owner
+            FROM {self.table_name} j
+            LEFT JOIN users u ON u.clerk_user_id = j.clerk_user_id
+            WHERE j.id = :id::uuid
+        """
+        params = [{"name": "id", "value": {"stringValue": str(job_id)}}]
+        return self.db.query_one(sql, params)
+
+    def find_version(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve only a job's ownership and `updated_at` stamp.
+
+        Used for conditional requests: the `updated_at` trigger bumps the
+        stamp on every write, so it identifies the row version without
+        transferring any of the JSONB payload columns.
+
+        Parameters
+        ----------
+        job_id : str
+            UUID of the job.
+
+        Returns
+        -------
+        dict or None
+            Dict with `id`, `clerk_user_id` and `updated_at`, or
+            ``None`` if the job does not exist.
+        """
+        sql = f"""
+            SELECT id, clerk_user_id, updated_at
+            FROM {self.table_name}
+            WHERE id = :id::uuid
+        """
+        params = [{"name": "id", "value": {"stringValue": str(job_id)}}]
+        return self.db.query_one(sql, params)
+
     def update_status(
         self,
         job_id: str,
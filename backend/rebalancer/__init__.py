@@ -1,4 +1,3 @@
-from .rebalance import compute_rebalance_recommendation
-
-__all__ = ["compute_rebalance_recommendation"]
+from .rebalance import compute_rebalance_recommendation, normalize_asset_class_targets
 
+__all__ = ["compute_rebalance_recommendation", "normalize_asset_class_targets"]
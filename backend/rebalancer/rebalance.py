@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, List, Mapping, Optional, Tuple
+
+# Asset-class targets as frozen (class, weight) pairs whose weights sum to 100
+NormalizedTargets = Tuple[Tuple[str, float], ...]
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
@@ -29,6 +33,16 @@ def _normalize_targets(targets: Dict[str, Any]) -> Dict[str, float]:
     return {k: (v / total) * 100.0 for k, v in cleaned.items()}
 
 
+def normalize_asset_class_targets(targets: Mapping[str, Any] | None) -> NormalizedTargets:
+    """
+    Normalise raw asset-class targets once into a frozen, reusable form.
+
+    Callers that see the same targets repeatedly can cache the result and
+    pass it straight to `compute_rebalance_recommendation`.
+    """
+    return tuple(_normalize_targets(targets or {}).items())
+
+
 def _majority_key(weights: Dict[str, Any]) -> Optional[str]:
     if not weights:
         return None
@@ -162,7 +176,7 @@ def _pick_symbol(
 def compute_rebalance_recommendation(
     *,
     accounts: List[Dict[str, Any]],
-    asset_class_targets: Dict[str, Any],
+    asset_class_targets: Mapping[str, Any] | NormalizedTargets,
     options: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
     """
@@ -171,9 +185,15 @@ def compute_rebalance_recommendation(
     - Uses user `asset_class_targets` and current market values
     - Produces cash-first buys; optionally adds sells if `cash_only=False`
     - Adds lightweight UK/US tax-aware guidance based on account labels
+
+    `asset_class_targets` may be the user's raw mapping or the output of
+    `normalize_asset_class_targets`.
     """
     opts = _parse_options(options)
-    targets = _normalize_targets(asset_class_targets)
+    if isinstance(asset_class_targets, tuple):
+        targets = dict(asset_class_targets)
+    else:
+        targets = _normalize_targets(asset_class_targets)
     if not targets:
         return {
             "enabled": False,
@@ -181,7 +201,7 @@ def compute_rebalance_recommendation(
         }
 
     total_cash = 0.0
-    symbol_values: Dict[str, float] = {}
+    symbol_values: DefaultDict[str, float] = defaultdict(float)
     symbol_prices: Dict[str, float] = {}
     symbol_asset_class: Dict[str, str] = {}
     symbol_company: Dict[str, str] = {}
@@ -222,7 +242,7 @@ def compute_rebalance_recommendation(
             if value <= 0:
                 continue
 
-            symbol_values[symbol] = symbol_values.get(symbol, 0.0) + value
+            symbol_values[symbol] += value
             if price > 0 and symbol not in symbol_prices:
                 symbol_prices[symbol] = price
             symbol_asset_class[symbol] = _classify_asset_class(instrument)
@@ -237,10 +257,10 @@ def compute_rebalance_recommendation(
 
     total_invested = sum(symbol_values.values())
     total_value = total_invested + total_cash
-    current_class_values: Dict[str, float] = {"cash": total_cash}
+    current_class_values: DefaultDict[str, float] = defaultdict(float, cash=total_cash)
     for symbol, value in symbol_values.items():
         cls = symbol_asset_class.get(symbol, "equity")
-        current_class_values[cls] = current_class_values.get(cls, 0.0) + value
+        current_class_values[cls] += value
         holdings_by_class.setdefault(cls, []).append((symbol, value))
 
     target_class_values: Dict[str, float] = {k: (v / 100.0) * total_value for k, v in targets.items()}
@@ -43,6 +43,7 @@ import logging
 import os
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict
 
 from agents import Agent, Runner, trace
@@ -72,6 +73,18 @@ from templates import RETIREMENT_INSTRUCTIONS
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+
+@lru_cache(maxsize=1)
+def _get_db() -> Database:
+    """
+    Return the container-wide Database, created on first use.
+
+    Reused across handler calls and warm invocations instead of building a
+    fresh boto3 RDS Data API (HTTP) client each time.
+    """
+    return Database()
+
+
 def _normalize_markdown_report(text: str) -> str:
     """
     Normalize agent-produced markdown for consistent UI rendering.
@@ -272,7 +285,7 @@ def get_user_preferences(job_id: str) -> Dict[str, Any]:
         - ``current_age`` (defaulting to 40 for now)
     """
     try:
-        db = Database()
+        db = _get_db()
 
         job = db.jobs.find_by_id(job_id)
         if job and job.get("clerk_user_id"):
@@ -363,7 +376,7 @@ async def run_retirement_agent(
     start_time = datetime.now(timezone.utc)
 
     # Initialise database access
-    db = Database()
+    db = _get_db()
 
     # Load user preferences for this job
     user_preferences = get_user_preferences(job_id)
@@ -631,13 +644,7 @@ def lambda_handler(event: Any, context: Any) -> Dict[str, Any]:
             if not portfolio_data:
                 logger.info("Retirement: Loading portfolio data for job %s", job_id)
                 try:
-                    # Ensure project root is on sys.path (primarily for local runs)
-                    import sys
-
-                    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-                    from src import Database as DBForLambda  # Local alias
-
-                    db = DBForLambda()
+                    db = _get_db()
                     job = db.jobs.find_by_id(job_id)
 
                     if job:
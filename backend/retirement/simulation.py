@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import random
+from array import array
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import cached_property
+from math import fsum
+from operator import mul
+from typing import Any, Dict, List, Tuple, Union
 
 
 def _randn() -> float:
@@ -61,53 +66,71 @@ def _apply_cholesky(l: List[List[float]], z: List[float]) -> List[float]:
     ]
 
 
-def _sample_regime_returns(
-    state: int,
-    *,
-    tail_df: int,
-    return_shift: float,
-    volatility_mult: float,
-) -> Dict[str, float]:
-    """
-    Sample correlated yearly returns for (equity, bonds, real_estate) using a
-    simple 2-regime (bull/bear) Markov model and a shared fat-tail shock.
-    """
-    # Baseline regime params (annual, real-ish).
-    if state == 0:  # bull
-        mu = {"equity": 0.08, "bonds": 0.035, "real_estate": 0.065}
-        sigma = {"equity": 0.16, "bonds": 0.045, "real_estate": 0.12}
-        corr = [
+# (means, volatilities, correlation or Cholesky factor) for (equity, bonds, real_estate)
+RegimeParams = Tuple[Tuple[float, ...], Tuple[float, ...], List[List[float]]]
+
+# Baseline bull (0) / bear (1) regime params (annual, real-ish).
+_REGIME_BASE: Tuple[RegimeParams, ...] = (
+    (
+        (0.08, 0.035, 0.065),
+        (0.16, 0.045, 0.12),
+        [
             [1.0, -0.20, 0.65],
             [-0.20, 1.0, -0.10],
             [0.65, -0.10, 1.0],
-        ]
-    else:  # bear
-        mu = {"equity": -0.02, "bonds": 0.02, "real_estate": -0.01}
-        sigma = {"equity": 0.22, "bonds": 0.07, "real_estate": 0.18}
-        corr = [
+        ],
+    ),
+    (
+        (-0.02, 0.02, -0.01),
+        (0.22, 0.07, 0.18),
+        [
             [1.0, -0.45, 0.70],
             [-0.45, 1.0, -0.20],
             [0.70, -0.20, 1.0],
-        ]
+        ],
+    ),
+)
+
+# The correlation structure is fixed, so factor it once at import.
+_REGIME_CHOLESKY: Tuple[List[List[float]], ...] = tuple(
+    _cholesky_3x3(corr) for _, _, corr in _REGIME_BASE
+)
 
-    # Apply user scenario knobs.
+
+def _regime_params(
+    state: int, *, return_shift: float, volatility_mult: float
+) -> RegimeParams:
+    """
+    Regime means/volatilities with the user's scenario knobs applied, plus the
+    regime's Cholesky factor. Constant for a whole simulation run.
+    """
+    mu, sigma, _ = _REGIME_BASE[0 if state == 0 else 1]
     v_mult = max(0.0, float(volatility_mult))
-    for k in mu:
-        mu[k] = mu[k] + float(return_shift)
-    for k in sigma:
-        sigma[k] = sigma[k] * v_mult
+    shift = float(return_shift)
+    return (
+        tuple(m + shift for m in mu),
+        tuple(sd * v_mult for sd in sigma),
+        _REGIME_CHOLESKY[0 if state == 0 else 1],
+    )
 
-    l = _cholesky_3x3(corr)
+
+def _draw_regime_returns(params: RegimeParams, tail_df: int) -> Tuple[float, float, float]:
+    """
+    Sample correlated yearly (equity, bonds, real_estate) returns for one
+    regime with a shared fat-tail shock, from precomputed regime params.
+    """
+    (mu_eq, mu_bd, mu_re), (sd_eq, sd_bd, sd_re), l = params
 
     # Shared tail shock so extreme moves co-occur across assets.
     tail = _student_t(tail_df)
-    z = _apply_cholesky(l, [_randn(), _randn(), _randn()])
-    z = [zi * (abs(tail) / 1.25) for zi in z]  # modest fat-tail scaling
+    z0, z1, z2 = _apply_cholesky(l, [_randn(), _randn(), _randn()])
+    scale = abs(tail) / 1.25  # modest fat-tail scaling
 
-    eq = mu["equity"] + sigma["equity"] * z[0]
-    bd = mu["bonds"] + sigma["bonds"] * z[1]
-    re = mu["real_estate"] + sigma["real_estate"] * z[2]
-    return {"equity": eq, "bonds": bd, "real_estate": re}
+    return (
+        mu_eq + sd_eq * (z0 * scale),
+        mu_bd + sd_bd * (z1 * scale),
+        mu_re + sd_re * (z2 * scale),
+    )
 
 
 def _next_state(state: int, *, p_stay_bull: float, p_stay_bear: float) -> int:
@@ -117,65 +140,123 @@ def _next_state(state: int, *, p_stay_bull: float, p_stay_bear: float) -> int:
     return 1 if u < p_stay_bear else 0
 
 
-def calculate_portfolio_value(portfolio_data: Dict[str, Any]) -> float:
-    total_value = 0.0
-
-    for account in portfolio_data.get("accounts", []):
-        cash = float(account.get("cash_balance", 0) or 0)
-        total_value += cash
-
-        for position in account.get("positions", []):
-            quantity = float(position.get("quantity", 0) or 0)
-            instrument = position.get("instrument", {}) or {}
-            price = float(instrument.get("current_price", 0) or 0)
-            total_value += quantity * price
-
-    return total_value
-
-
-def calculate_asset_allocation(portfolio_data: Dict[str, Any]) -> Dict[str, float]:
-    total_equity = 0.0
-    total_bonds = 0.0
-    total_real_estate = 0.0
-    total_commodities = 0.0
-    total_cash = 0.0
-    total_value = 0.0
-
-    for account in portfolio_data.get("accounts", []):
-        cash = float(account.get("cash_balance", 0) or 0)
-        total_cash += cash
-        total_value += cash
-
-        for position in account.get("positions", []):
-            quantity = float(position.get("quantity", 0) or 0)
-            instrument = position.get("instrument", {}) or {}
-            price = float(instrument.get("current_price", 0) or 0)
-            value = quantity * price
-            total_value += value
-
-            asset_allocation = instrument.get("allocation_asset_class", {}) or {}
-            if asset_allocation:
-                total_equity += value * (asset_allocation.get("equity", 0) / 100)
-                total_bonds += value * (asset_allocation.get("fixed_income", 0) / 100)
-                total_real_estate += value * (asset_allocation.get("real_estate", 0) / 100)
-                total_commodities += value * (asset_allocation.get("commodities", 0) / 100)
-
-    if total_value == 0:
-        return {
-            "equity": 0.0,
-            "bonds": 0.0,
-            "real_estate": 0.0,
-            "commodities": 0.0,
-            "cash": 0.0,
+# Instrument ``allocation_asset_class`` keys mapped onto simulation asset classes.
+_ALLOCATION_KEYS: Tuple[Tuple[str, str], ...] = (
+    ("equity", "equity"),
+    ("bonds", "fixed_income"),
+    ("real_estate", "real_estate"),
+    ("commodities", "commodities"),
+)
+
+
+@dataclass(frozen=True)
+class PortfolioArrays:
+    """
+    Column-oriented (struct-of-arrays) view of a portfolio.
+
+    Every position-level column is a contiguous ``array('d')`` so that value and
+    allocation reductions run over flat float64 buffers instead of re-walking
+    nested account/position/instrument dicts and re-coercing each field.
+
+    Notes
+    -----
+    Uses the stdlib ``array`` module rather than numpy to keep this Lambda-friendly.
+    """
+
+    symbols: Tuple[str, ...]
+    account_ids: Tuple[str, ...]
+    quantities: array
+    prices: array
+    allocation_weights: Dict[str, array]
+    cash_balances: array
+
+    @classmethod
+    def from_portfolio_data(cls, portfolio_data: Dict[str, Any]) -> "PortfolioArrays":
+        """Coerce a nested ``{"accounts": [...]}`` payload into float64 columns once."""
+        symbols: List[str] = []
+        account_ids: List[str] = []
+        quantities = array("d")
+        prices = array("d")
+        weights = {name: array("d") for name, _ in _ALLOCATION_KEYS}
+        cash_balances = array("d")
+
+        for account in portfolio_data.get("accounts", []):
+            cash_balances.append(float(account.get("cash_balance", 0) or 0))
+            account_id = str(account.get("id", ""))
+
+            for position in account.get("positions", []):
+                instrument = position.get("instrument", {}) or {}
+                symbols.append(str(position.get("symbol", "")))
+                account_ids.append(account_id)
+                quantities.append(float(position.get("quantity", 0) or 0))
+                prices.append(float(instrument.get("current_price", 0) or 0))
+
+                asset_allocation = instrument.get("allocation_asset_class", {}) or {}
+                for name, key in _ALLOCATION_KEYS:
+                    weights[name].append(float(asset_allocation.get(key, 0) or 0) / 100)
+
+        return cls(
+            symbols=tuple(symbols),
+            account_ids=tuple(account_ids),
+            quantities=quantities,
+            prices=prices,
+            allocation_weights=weights,
+            cash_balances=cash_balances,
+        )
+
+    @cached_property
+    def _position_values(self) -> array:
+        # Computed once per snapshot and shared by the value/allocation reductions
+        return array("d", map(mul, self.quantities, self.prices))
+
+    @cached_property
+    def _total_cash(self) -> float:
+        return fsum(self.cash_balances)
+
+    def position_values(self) -> array:
+        """Market value per position (``quantity * price``)."""
+        return array("d", self._position_values)
+
+    def total_value(self) -> float:
+        return self._total_cash + fsum(self._position_values)
+
+    def asset_allocation(self) -> Dict[str, float]:
+        values = self._position_values
+        total_cash = self._total_cash
+        total_value = total_cash + fsum(values)
+
+        if total_value == 0:
+            return {
+                "equity": 0.0,
+                "bonds": 0.0,
+                "real_estate": 0.0,
+                "commodities": 0.0,
+                "cash": 0.0,
+            }
+
+        allocation = {
+            name: fsum(map(mul, values, self.allocation_weights[name])) / total_value
+            for name, _ in _ALLOCATION_KEYS
         }
+        allocation["cash"] = total_cash / total_value
+        return allocation
 
-    return {
-        "equity": total_equity / total_value,
-        "bonds": total_bonds / total_value,
-        "real_estate": total_real_estate / total_value,
-        "commodities": total_commodities / total_value,
-        "cash": total_cash / total_value,
-    }
+
+PortfolioInput = Union[Dict[str, Any], PortfolioArrays]
+
+
+def _as_portfolio_arrays(portfolio_data: PortfolioInput) -> PortfolioArrays:
+    if isinstance(portfolio_data, PortfolioArrays):
+        return portfolio_data
+    return PortfolioArrays.from_portfolio_data(portfolio_data)
+
+
+def calculate_portfolio_value(portfolio_data: PortfolioInput) -> float:
+    return _as_portfolio_arrays(portfolio_data).total_value()
+
+
+def calculate_asset_allocation(portfolio_data: PortfolioInput) -> Dict[str, float]:
+    return _as_portfolio_arrays(portfolio_data).asset_allocation()
 
 
 def run_monte_carlo_simulation(
@@ -221,21 +302,29 @@ def run_monte_carlo_simulation(
     years_lasted: List[int] = []
     retirement_years = 30
 
+    # Loop invariants: hoisted so the per-year body is plain float arithmetic.
+    regimes = (
+        _regime_params(0, return_shift=return_shift, volatility_mult=volatility_mult),
+        _regime_params(1, return_shift=return_shift, volatility_mult=volatility_mult),
+    )
+    w_equity = asset_allocation.get("equity", 0.0)
+    w_bonds = asset_allocation.get("bonds", 0.0)
+    w_real_estate = asset_allocation.get("real_estate", 0.0)
+    cash_return = asset_allocation.get("cash", 0.0) * 0.02
+    contribution = max(0.0, float(annual_contribution))
+    inflation_factor = 1.0 + max(0.0, float(inflation_rate))
+    accumulation_years = int(years_until_retirement)
+    apply_shock = shock_year is not None and shock_pct is not None
+
     for _ in range(num_simulations):
         portfolio_value = float(current_value)
         state = 0  # start in bull regime
 
-        for year_idx in range(int(years_until_retirement)):
+        for year_idx in range(accumulation_years):
             if use_markov_regimes:
-                r = _sample_regime_returns(
-                    state,
-                    tail_df=tail_df,
-                    return_shift=float(return_shift),
-                    volatility_mult=float(volatility_mult),
+                equity_return, bond_return, real_estate_return = _draw_regime_returns(
+                    regimes[state], tail_df
                 )
-                equity_return = r["equity"]
-                bond_return = r["bonds"]
-                real_estate_return = r["real_estate"]
                 state = _next_state(state, p_stay_bull=p_stay_bull, p_stay_bear=p_stay_bear)
             else:
                 equity_return = random.gauss(equity_return_mean, equity_return_std)
@@ -245,16 +334,16 @@ def run_monte_carlo_simulation(
                 )
 
             portfolio_return = (
-                asset_allocation.get("equity", 0.0) * equity_return
-                + asset_allocation.get("bonds", 0.0) * bond_return
-                + asset_allocation.get("real_estate", 0.0) * real_estate_return
-                + asset_allocation.get("cash", 0.0) * 0.02
+                w_equity * equity_return
+                + w_bonds * bond_return
+                + w_real_estate * real_estate_return
+                + cash_return
             )
 
             portfolio_value = portfolio_value * (1 + portfolio_return)
-            portfolio_value += max(0.0, float(annual_contribution))
+            portfolio_value += contribution
 
-            if shock_year is not None and shock_pct is not None and year_idx == shock_year:
+            if apply_shock and year_idx == shock_year:
                 portfolio_value *= 1.0 - shock_pct
 
         value_at_retirement = float(portfolio_value)
@@ -266,18 +355,12 @@ def run_monte_carlo_simulation(
             if portfolio_value <= 0:
                 break
 
-            annual_withdrawal *= 1.0 + max(0.0, float(inflation_rate))
+            annual_withdrawal *= inflation_factor
 
             if use_markov_regimes:
-                r = _sample_regime_returns(
-                    state,
-                    tail_df=tail_df,
-                    return_shift=float(return_shift),
-                    volatility_mult=float(volatility_mult),
+                equity_return, bond_return, real_estate_return = _draw_regime_returns(
+                    regimes[state], tail_df
                 )
-                equity_return = r["equity"]
-                bond_return = r["bonds"]
-                real_estate_return = r["real_estate"]
                 state = _next_state(state, p_stay_bull=p_stay_bull, p_stay_bear=p_stay_bear)
             else:
                 equity_return = random.gauss(equity_return_mean, equity_return_std)
@@ -287,10 +370,10 @@ def run_monte_carlo_simulation(
                 )
 
             portfolio_return = (
-                asset_allocation.get("equity", 0.0) * equity_return
-                + asset_allocation.get("bonds", 0.0) * bond_return
-                + asset_allocation.get("real_estate", 0.0) * real_estate_return
-                + asset_allocation.get("cash", 0.0) * 0.02
+                w_equity * equity_return
+                + w_bonds * bond_return
+                + w_real_estate * real_estate_return
+                + cash_return
             )
 
             portfolio_value = portfolio_value * (1 + portfolio_return) - annual_withdrawal
@@ -337,9 +420,19 @@ def generate_projections(
     current_age: int,
     annual_contribution: float = 10_000.0,
     retirement_years: int = 30,
+    max_years: int | None = None,
 ) -> List[Dict[str, Any]]:
     projections: List[Dict[str, Any]] = []
     portfolio_value = float(current_value)
+    accumulation_years = max(0, int(years_until_retirement)) + 1
+    retirement_years = max(0, int(retirement_years))
+
+    # Callers that only display the first few rows pass `max_years`; clamp both
+    # phases up front so the loops never build rows that would be sliced away.
+    if max_years is not None:
+        max_years = max(0, int(max_years))
+        retirement_years = min(retirement_years, max(0, max_years - accumulation_years))
+        accumulation_years = min(accumulation_years, max_years)
 
     # Accumulation phase (simple deterministic expected-return model).
     expected_return = (
@@ -349,7 +442,7 @@ def generate_projections(
         + asset_allocation.get("cash", 0.0) * 0.02
     )
 
-    for year in range(max(0, int(years_until_retirement)) + 1):
+    for year in range(accumulation_years):
         age = current_age + year
         projections.append(
             {
@@ -361,7 +454,7 @@ def generate_projections(
         portfolio_value = portfolio_value * (1 + expected_return) + max(0.0, float(annual_contribution))
 
     # Retirement phase (simple 4% rule income proxy).
-    for year in range(1, max(0, int(retirement_years)) + 1):
+    for year in range(1, retirement_years + 1):
         age = current_age + years_until_retirement + year
         annual_income = portfolio_value * 0.04
         projections.append(
@@ -24,7 +24,9 @@ type RangeKey = "1D" | "5D" | "1M" | "6M" | "YTD" | "1Y" | "5Y" | "MAX";
 type SeriesResponse = {
   symbol: string;
   range: RangeKey;
-  points: Array<{ t: number; c: number }>;
+  // Columnar series: t[i] is the bar timestamp (ms) and c[i] its close
+  t: number[];
+  c: number[];
 };
 
 const RANGES: RangeKey[] = ["1D", "5D", "1M", "6M", "YTD", "1Y", "5Y", "MAX"];
@@ -82,12 +84,13 @@ export default function Market() {
   }, [instruments, symbol]);
 
   const chartData = useMemo(() => {
-    const pts = series?.points || [];
-    return pts.map((p) => ({
-      t: p.t,
-      price: p.c,
+    const ts = series?.t || [];
+    const closes = series?.c || [];
+    return ts.map((t, i) => ({
+      t,
+      price: closes[i],
     }));
-  }, [series?.points]);
+  }, [series]);
 
   const yDomain = useMemo(() => {
     if (chartData.length === 0) return ["auto", "auto"] as const;
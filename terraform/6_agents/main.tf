@@ -28,7 +28,7 @@ resource "aws_sqs_queue" "analysis_jobs" {
   delay_seconds             = 0
   max_message_size          = 262144
   message_retention_seconds = 86400  # 1 day
-  receive_wait_time_seconds = 10     # Long polling
+  receive_wait_time_seconds = 20     # Maximum long-poll wait
   visibility_timeout_seconds = 910   # 15 minutes + 10 seconds buffer (matches Planner Lambda timeout)
   
   redrive_policy = jsonencode({